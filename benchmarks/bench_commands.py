@@ -0,0 +1,109 @@
+"""
+Benchmarks for turning Messages into values
+"""
+
+from obd.commands import commands
+from obd.decoders import dtc_codes
+from obd.dtc import load as load_dtc_table
+from obd.utils import BitArray
+
+from .common import adapter_lines, decoder_commands, make_protocol, CAN_11BIT
+
+_DECODERS = decoder_commands()
+
+
+class CommandCall:
+    """ OBDCommand.__call__, including __constrain_message_data """
+
+    params = ["RPM", "COOLANT_TEMP", "VIN", "GET_DTC"]
+    param_names = ["command"]
+
+    def setup(self, name):
+        self.cmd = commands[name]
+        protocol = make_protocol(CAN_11BIT)
+        self.messages = protocol(adapter_lines(CAN_11BIT, self.cmd.command))
+
+    def time_call(self, name):
+        self.cmd(self.messages)
+
+    def time_call_raw(self, name):
+        self.cmd(self.messages, raw=True)
+
+
+class Decoders:
+    """ every decoder in decoders.py, through one command that uses it """
+
+    params = sorted(_DECODERS.keys())
+    param_names = ["command"]
+
+    def setup(self, name):
+        cmd = _DECODERS[name]
+        protocol = make_protocol(CAN_11BIT)
+        self.decode = cmd.decode
+        self.messages = protocol(adapter_lines(CAN_11BIT, cmd.command))
+
+    def time_decode(self, name):
+        self.decode(self.messages)
+
+
+class PIDBitmap:
+    """ the BitArray work done on a PID-support bitmap in OBD.__load_commands """
+
+    def setup(self):
+        self.data = b"\xbe\x3f\xb8\x13"
+
+    def time_build(self):
+        BitArray(self.data)
+
+    def time_set_bits(self):
+        list(BitArray(self.data).iter_set_bits())
+
+    def time_num_set(self):
+        BitArray(self.data).num_set()
+
+
+class DTCPayload:
+    """ bulk DTC decoding, as in a sweep over many ECUs """
+
+    params = [4, 64, 1024]
+    param_names = ["codes"]
+
+    def setup(self, n):
+        self.data = bytes(b"\x01\x04\x80\x03\x41\x23\xc1\x55" * (n // 4))
+
+    def time_dtc_codes(self, n):
+        dtc_codes(self.data)
+
+
+class DTCDescriptions:
+    """ lookups in the compiled DTC description table """
+
+    def setup(self):
+        self.table = load_dtc_table()
+
+    def time_get(self):
+        self.table.get("P0104", "")
+
+    def time_get_missing(self):
+        self.table.get("P1234", "")
+
+    def time_search_group(self):
+        self.table.search("P01XX")
+
+
+class CommandLookup:
+    """ the per-query bookkeeping that keys on OBDCommand """
+
+    def setup(self):
+        self.cmd = commands.RPM
+        self.supported = set(commands[1]) - {None}
+
+    def time_in_supported(self):
+        self.cmd in self.supported
+
+    def time_mode_pid(self):
+        self.cmd.mode
+        self.cmd.pid
+
+    def time_has_command(self):
+        commands.has_command(self.cmd)
@@ -0,0 +1,27 @@
+"""
+Benchmarks for the history kept behind the GUI's graph tabs
+"""
+
+from obd.timeseries import TimeSeries
+
+
+class GraphHistory:
+    """ one sample into a full 450 point graph, as sensorProducer does """
+
+    def setup(self):
+        self.series = TimeSeries(450)
+        for i in range(450):
+            self.series.append(i, 0.5 * i)
+        self.counter = 450
+
+    def time_append(self):
+        self.series.append(self.counter, 1.5)
+        self.counter += 1
+
+    def time_window(self):
+        self.series.x
+        self.series.y
+
+    def time_points(self):
+        # what the graph tab hands to PolySpline
+        list(zip(self.series.x, self.series.y))
@@ -0,0 +1,20 @@
+"""
+Benchmarks for import and first-use costs, each in a fresh interpreter
+"""
+
+
+class ImportTime:
+    """ what short-lived tools pay before talking to an adapter """
+
+    def timeraw_import_obd(self):
+        return "import obd"
+
+    def timeraw_connection_classes(self):
+        return "import obd; obd.OBD; obd.Async"
+
+    def timeraw_first_quantity(self):
+        # builds the pint UnitRegistry
+        return "import obd; obd.Unit.Quantity(1, 'volt')"
+
+    def timeraw_dtc_table(self):
+        return "import obd.codes; obd.codes.DTC"
@@ -0,0 +1,44 @@
+"""
+Benchmarks for turning adapter lines into Messages
+"""
+
+from obd.protocols.protocol import Message
+
+from .common import adapter_lines, make_protocol, CAN_11BIT, CAN_29BIT, LEGACY
+
+
+class ProtocolCall:
+    """ Protocol.__call__, from raw lines to Messages """
+
+    params = [CAN_11BIT, CAN_29BIT, LEGACY]
+    param_names = ["protocol"]
+
+    def setup(self, protocol_id):
+        self.protocol = make_protocol(protocol_id)
+        self.single = adapter_lines(protocol_id, b"010C")  # one frame
+        self.multi = adapter_lines(protocol_id, b"0902")  # VIN, multiple frames
+        self.two_ecus = adapter_lines(protocol_id, b"0100", ecus=2)
+
+    def time_single_frame(self, protocol_id):
+        self.protocol(self.single)
+
+    def time_multi_frame(self, protocol_id):
+        self.protocol(self.multi)
+
+    def time_two_ecus(self, protocol_id):
+        self.protocol(self.two_ecus)
+
+
+class CANReassembly:
+    """ CANProtocol.parse_message, from parsed frames to a Message """
+
+    params = [b"010C", b"0902", b"03"]
+    param_names = ["command"]
+
+    def setup(self, cmd):
+        self.protocol = make_protocol(CAN_11BIT)
+        messages = self.protocol(adapter_lines(CAN_11BIT, cmd))
+        self.frames = messages[0].frames
+
+    def time_parse_message(self, cmd):
+        self.protocol.parse_message(Message(list(self.frames)))
@@ -0,0 +1,43 @@
+"""
+Shared fixtures for the benchmarks
+
+Adapter output is generated with the ELM327 simulator, so that every
+protocol produces the exact lines a real adapter would send.
+"""
+
+from obd.commands import commands
+from obd.elm327 import ELM327, split_lines
+from obd.simulator import ELM327Simulator
+
+CAN_11BIT = "6"
+CAN_29BIT = "7"
+LEGACY = "3"
+
+
+def adapter_lines(protocol_id, cmd, ecus=1):
+    """ returns the lines the adapter sends for cmd, as given to Protocol.__call__ """
+    sim = ELM327Simulator(protocol=protocol_id, ecus=ecus, seed=0)
+    for at in (b"ATE0", b"ATH1", b"ATSP" + protocol_id.encode()):
+        sim.respond(at)
+    return split_lines(sim.respond(cmd))
+
+
+def make_protocol(protocol_id, ecus=1):
+    """ builds the protocol object, as ELM327 does after connecting """
+    return ELM327._SUPPORTED_PROTOCOLS[protocol_id](adapter_lines(protocol_id, b"0100", ecus))
+
+
+def decoder_commands():
+    """ returns one command for every distinct decoder, by command name """
+    seen = set()
+    found = {}
+    for c in sum(commands.modes, []) + commands.base_commands():
+        if c is None:
+            continue
+        decode = c.decode
+        key = (getattr(decode, "func", decode), getattr(decode, "args", ()),
+               tuple(sorted(getattr(decode, "keywords", {}).items())))
+        if key not in seen:
+            seen.add(key)
+            found[c.name] = c
+    return found
@@ -0,0 +1,122 @@
+"""
+Runs the benchmarks without asv
+
+    python -m benchmarks.run                     print the timings
+    python -m benchmarks.run --save base.json    also save them
+    python -m benchmarks.run --compare base.json flag regressions against a saved run
+
+The suites follow asv conventions (setup(), time_* methods, params, and
+timeraw_* methods returning code to time in a fresh interpreter), so
+"asv run" / "asv continuous" can track the same benchmarks over the
+project's history (see asv.conf.json).
+"""
+
+import argparse
+import contextlib
+import importlib
+import inspect
+import io
+import json
+import pkgutil
+import subprocess
+import sys
+import timeit
+
+import benchmarks
+
+
+def discover(pattern=""):
+    """ yields (name, suite class, param, method name) for every benchmark """
+    for info in pkgutil.iter_modules(benchmarks.__path__):
+        if not info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module("benchmarks." + info.name)
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            for method in sorted(m for m in dir(cls) if m.startswith(("time_", "timeraw_"))):
+                for param in getattr(cls, "params", [None]):
+                    name = "%s.%s.%s" % (info.name, cls_name, method)
+                    if param is not None:
+                        name += "(%s)" % (param.decode() if isinstance(param, bytes) else param)
+                    if pattern in name:
+                        yield name, cls, param, method
+
+
+def measure_raw(code, repeat=3):
+    """ returns the best time for running code in a new interpreter, in seconds """
+    timer = "import time; t = time.perf_counter(); exec(%r); print(time.perf_counter() - t)" % code
+    times = []
+    for _ in range(repeat):
+        out = subprocess.check_output([sys.executable, "-c", timer])
+        times.append(float(out.decode().split()[-1]))
+    return min(times)
+
+
+def measure(cls, param, method, repeat=3):
+    """ returns the best time per call, in seconds """
+    suite = cls()
+    args = () if param is None else (param,)
+    if method.startswith("timeraw_"):
+        return measure_raw(getattr(suite, method)(*args), repeat)
+    # the parsers still print debug output, keep it out of the results
+    with contextlib.redirect_stdout(io.StringIO()):
+        if hasattr(suite, "setup"):
+            suite.setup(*args)
+        bound = getattr(suite, method)
+        bound(*args)  # warm up, so one-off setup (e.g. the unit registry) isn't timed
+        timer = timeit.Timer(lambda: bound(*args))
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number
+
+
+def commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-k", dest="pattern", default="", help="only run benchmarks containing this string")
+    parser.add_argument("--save", help="save the timings to this JSON file")
+    parser.add_argument("--compare", help="compare against timings saved with --save")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown ratio reported as a regression (default 1.25)")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["timings"]
+
+    timings = {}
+    regressions = []
+    for name, cls, param, method in discover(args.pattern):
+        t = measure(cls, param, method)
+        timings[name] = t
+        line = "%-70s %10.2f us" % (name, t * 1e6)
+        if name in baseline:
+            ratio = t / baseline[name]
+            line += "  %5.2fx" % ratio
+            if ratio > args.threshold:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"commit": commit(), "python": sys.version.split()[0], "timings": timings},
+                      f, indent=2, sort_keys=True)
+
+    if regressions:
+        print("%d benchmark(s) slower than %.2fx the baseline" % (len(regressions), args.threshold))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -51,12 +51,29 @@ class OBDCommand:
                  header=ECU_HEADER.ENGINE):
         self.name = name  # human readable name (also used as key in commands dict)
         self.desc = desc  # human readable description
-        self.command = command  # command string
+        self.__command = command  # command string
         self.bytes = _bytes  # number of bytes expected in return
         self.decode = decoder  # decoding function
         self.ecu = ecu  # ECU ID from which this command expects messages from
         self.fast = fast  # can an extra digit be added to the end of the command? (to make the ELM return early)
-        self.header = header  # ECU header used for the queries
+        self.__header = header  # ECU header used for the queries
+        self.unit = getattr(decoder, "unit", None)  # name of the value's unit, for raw value queries
+        self.__update()
+
+    def __update(self):
+        """
+            precomputes the fields derived from the command and header,
+            since commands are looked up in dicts and sets on every query
+        """
+        command = self.__command
+        if len(command) >= 2 and isHex(command.decode()):
+            self.__mode = int(command[:2], 16)
+            self.__pid = int(command[2:], 16) if len(command) > 2 else None
+        else:
+            self.__mode = None
+            self.__pid = None
+        self.__key = (self.__header, command)
+        self.__hash = hash(self.__key)
 
     def clone(self):
         return OBDCommand(self.name,
@@ -68,21 +85,38 @@ class OBDCommand:
                           self.fast,
                           self.header)
 
+    @property
+    def command(self):
+        return self.__command
+
+    @command.setter
+    def command(self, command):
+        self.__command = command
+        self.__update()
+
+    @property
+    def header(self):
+        return self.__header
+
+    @header.setter
+    def header(self, header):
+        self.__header = header
+        self.__update()
+
     @property
     def mode(self):
-        if len(self.command) >= 2 and isHex(self.command.decode()):
-            return int(self.command[:2], 16)
-        else:
-            return None
+        return self.__mode
 
     @property
     def pid(self):
-        if len(self.command) > 2 and isHex(self.command.decode()):
-            return int(self.command[2:], 16)
-        else:
-            return None
+        return self.__pid
 
-    def __call__(self, messages):
+    def __call__(self, messages, raw=False):
+        """
+            Decodes the messages into an OBDResponse. With raw=True,
+            decoders that return pint Quantities return plain numbers
+            instead, in the unit named by self.unit.
+        """
 
         # filter for applicable messages (from the right ECU(s))
         messages = [m for m in messages if (self.ecu & m.ecu) > 0]
@@ -95,7 +129,8 @@ class OBDCommand:
         # and reference to original command
         r = OBDResponse(self, messages)
         if messages:
-            r.value = self.decode(messages)
+            decode = getattr(self.decode, "raw", self.decode) if raw else self.decode
+            r.value = decode(messages)
         else:
             logger.info(str(self) + " did not receive any acceptable messages")
 
@@ -144,10 +179,10 @@ class OBDCommand:
 
     def __hash__(self):
         # needed for using commands as keys in a dict (see async.py)
-        return hash(self.header + self.command)
+        return self.__hash
 
     def __eq__(self, other):
         if isinstance(other, OBDCommand):
-            return self.command == other.command and self.header == other.header
+            return self is other or self.__key == other.__key
         else:
             return False
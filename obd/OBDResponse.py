@@ -36,6 +36,7 @@ import sys
 import time
 
 from .codes import *
+from .UnitsAndScaling import Unit
 
 logger = logging.getLogger(__name__)
 
@@ -48,25 +49,50 @@ else:
 class OBDResponse:
     """ Standard response object for any OBDCommand """
 
+    __slots__ = ("command", "messages", "value", "time")
+
     def __init__(self, command=None, messages=None):
         self.command = command
         self.messages = messages if messages else []
         self.value = None
         self.time = time.time()
 
+    def drop_messages(self):
+        """
+            Frees the raw messages (and their frames), keeping the decoded
+            value. Afterwards, messages is None. Used by long-running
+            loggers that only need the values.
+        """
+        self.messages = None
+        return self
+
     @property
     def unit(self):
         # for backwards compatibility
-        from obd import Unit  # local import to avoid cyclic-dependency
-        if isinstance(self.value, Unit.Quantity):
-            return str(self.value.u)
-        elif self.value is None:
+        if self.value is None:
             return None
+        elif getattr(self.command, "unit", None) is not None:
+            # the unit is known from the command, for Quantities and raw values alike
+            return self.command.unit
+        elif isinstance(self.value, Unit.Quantity):
+            return str(self.value.u)
         else:
             return str(type(self.value))
 
+    @property
+    def quantity(self):
+        """
+            The value as a pint Quantity. Responses to raw value queries
+            hold plain numbers, and only build the Quantity here.
+        """
+        unit = getattr(self.command, "unit", None)
+        if unit is None or self.value is None or isinstance(self.value, Unit.Quantity):
+            return self.value
+        return Unit.Quantity(self.value, unit)
+
     def is_null(self):
-        return (not self.messages) or (self.value == None)
+        # messages is None once they were dropped from a decoded response
+        return (self.messages is not None and not self.messages) or (self.value == None)
 
     def __str__(self):
         return str(self.value)
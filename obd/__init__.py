@@ -37,9 +37,9 @@
 #                                                                      #
 ########################################################################
 
+import importlib
+
 from .__version__ import __version__
-from .obd import OBD
-from .asynchronous import Async
 from .commands import commands
 from .OBDCommand import OBDCommand
 from .OBDResponse import OBDResponse
@@ -49,6 +49,26 @@ from .UnitsAndScaling import Unit
 
 import logging
 
+# the connection classes pull in the serial and adapter layers, so they
+# are only imported when first used (PEP 562). The names above can't be
+# lazy, since they're also the names of submodules.
+_LAZY = {
+    "OBD": ".obd",
+    "Async": ".asynchronous",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value  # later lookups don't come through here
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)
 
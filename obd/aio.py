@@ -0,0 +1,449 @@
+# -*- coding: utf-8 -*-
+
+########################################################################
+#                                                                      #
+# python-OBD: A python OBD-II serial module derived from pyobd         #
+#                                                                      #
+# Copyright 2004 Donour Sizemore (donour@uchicago.edu)                 #
+# Copyright 2009 Secons Ltd. (www.obdtester.com)                       #
+# Copyright 2009 Peter J. Creath                                       #
+# Copyright 2016 Brendan Whitfield (brendan-w.com)                     #
+#                                                                      #
+########################################################################
+#                                                                      #
+# aio.py                                                               #
+#                                                                      #
+# This file is part of python-OBD (a derivative of pyOBD)              #
+#                                                                      #
+# python-OBD is free software: you can redistribute it and/or modify   #
+# it under the terms of the GNU General Public License as published by #
+# the Free Software Foundation, either version 2 of the License, or    #
+# (at your option) any later version.                                  #
+#                                                                      #
+# python-OBD is distributed in the hope that it will be useful,        #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+# GNU General Public License for more details.                         #
+#                                                                      #
+# You should have received a copy of the GNU General Public License    #
+# along with python-OBD.  If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                      #
+########################################################################
+
+import asyncio
+import logging
+
+from .OBDResponse import OBDResponse
+from .commands import commands
+from .elm327 import ELM327, split_lines, decode_lines
+from .protocols import ECU_HEADER, UnknownProtocol
+from .utils import group_by_header, OBDStatus
+
+logger = logging.getLogger(__name__)
+
+
+class ELMProtocol(asyncio.Protocol):
+    """
+        asyncio Protocol for the ELM327 byte stream.
+
+        Responses are framed on the ELM prompt character. Only one
+        command may be in flight at a time (see AsyncOBD's lock).
+    """
+
+    def __init__(self):
+        self.transport = None
+        self.__buffer = bytearray()
+        self.__waiter = None
+        self.__end_marker = ELM327.ELM_PROMPT
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        start = len(self.__buffer)
+        self.__buffer.extend(data)
+
+        # only scan the newly received bytes (plus enough overlap
+        # to catch a multi-byte end marker split across reads)
+        start = max(0, start - len(self.__end_marker) + 1)
+        if self.__buffer.find(self.__end_marker, start) < 0:
+            return
+
+        if self.__waiter is not None and not self.__waiter.done():
+            self.__waiter.set_result(bytes(self.__buffer))
+        self.__buffer.clear()
+
+    def connection_lost(self, exc):
+        self.transport = None
+        if self.__waiter is not None and not self.__waiter.done():
+            self.__waiter.set_exception(exc or ConnectionError("Device disconnected"))
+
+    async def send(self, cmd, timeout, end_marker=ELM327.ELM_PROMPT):
+        """
+            writes the given command, and waits until the end marker
+            (by default, the prompt) is seen. Returns a list of
+            memoryview lines (see split_lines())
+        """
+        if self.transport is None:
+            raise ConnectionError("Device disconnected")
+
+        self.__buffer.clear()
+        self.__end_marker = end_marker
+        self.__waiter = asyncio.get_running_loop().create_future()
+
+        cmd += b"\r"  # terminate with carriage return in accordance with ELM327 and STN11XX specifications
+        logger.debug("write: " + repr(cmd))
+        self.transport.write(cmd)
+
+        try:
+            buffer = await asyncio.wait_for(self.__waiter, timeout)
+        finally:
+            self.__waiter = None
+            self.__end_marker = ELM327.ELM_PROMPT
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("read: " + repr(buffer))
+
+        return split_lines(buffer, ELM327.ELM_PROMPT)
+
+
+async def open_transport(portstr, baudrate=38400):
+    """
+        Opens an ELMProtocol on the given port. TCP adapters are
+        given as pyserial style URLs (socket://host:port), everything
+        else is opened as a serial port using the optional
+        pyserial-asyncio package.
+    """
+    loop = asyncio.get_running_loop()
+
+    if portstr.startswith("socket://"):
+        host, _, port = portstr[len("socket://"):].rpartition(":")
+        _, protocol = await loop.create_connection(ELMProtocol, host, int(port))
+    else:
+        try:
+            import serial_asyncio
+        except ImportError:
+            raise ImportError("Serial ports require the 'pyserial-asyncio' package")
+        _, protocol = await serial_asyncio.create_serial_connection(
+            loop, ELMProtocol, portstr, baudrate=baudrate)
+
+    return protocol
+
+
+class AsyncOBD(object):
+    """
+        asyncio-native OBD-II connection.
+
+        Unlike obd.Async, no thread is used, so many adapters can share
+        a single event loop:
+
+            async with AsyncOBD("socket://192.168.0.10:35000") as connection:
+                r = await connection.query(obd.commands.RPM)
+                async for r in connection.stream([obd.commands.RPM, obd.commands.SPEED]):
+                    ...
+
+        The baudrate isn't auto-detected; it defaults to the ELM's boot
+        rate of 38400.
+    """
+
+    def __init__(self, portstr, baudrate=None, protocol=None, fast=True,
+                 timeout=10, raw_values=False):
+        self.supported_commands = set(commands.base_commands())
+        self.fast = fast  # global switch for disabling optimizations
+        self.timeout = timeout  # seconds to wait for the prompt
+        self.raw_values = raw_values  # decode to plain numbers instead of pint Quantities
+        self.__portstr = portstr
+        self.__baudrate = baudrate or 38400
+        self.__requested_protocol = protocol
+        self.__transport = None
+        self.__protocol = UnknownProtocol([])
+        self.__status = OBDStatus.NOT_CONNECTED
+        self.__lock = None  # only one command may be in flight, created in connect() (it binds to the running loop)
+        self.__last_command = b""  # used for running the previous command with a CR
+        self.__last_header = ECU_HEADER.ENGINE  # for comparing with the previously used header
+        self.header_switches_saved = 0  # AT SH round trips saved by sending commands grouped by header
+        self.__frame_counts = {}  # keeps track of the number of return frames for each command
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+        return False  # don't suppress any exceptions
+
+    async def connect(self):
+        """
+            Opens the transport, initializes the ELM,
+            and loads the car's supported commands
+        """
+        try:
+            self.__transport = await open_transport(self.__portstr, self.__baudrate)
+        except (OSError, ImportError) as e:
+            logger.error(str(e))
+            return False
+        self.__lock = asyncio.Lock()
+
+        # every failure below closes the transport again, which resets the status
+        try:
+            await self.__send(b"ATZ", timeout=max(self.timeout, 2))  # return data can be junk
+            if not self.__isok(await self.__send(b"ATE0"), expectEcho=True):
+                logger.error("ATE0 did not return 'OK'")
+                await self.close()
+                return False
+            if not self.__isok(await self.__send(b"ATH1")):
+                logger.error("ATH1 did not return 'OK', or echoing is still ON")
+                await self.close()
+                return False
+            if not self.__isok(await self.__send(b"ATL0")):
+                logger.error("ATL0 did not return 'OK'")
+                await self.close()
+                return False
+
+            # by now, we've successfuly communicated with the ELM, but not the car
+            self.__status = OBDStatus.ELM_CONNECTED
+
+            if await self.__set_protocol(self.__requested_protocol):
+                self.__status = OBDStatus.CAR_CONNECTED
+                logger.info("Connected Successfully: PORT=%s PROTOCOL=%s" %
+                            (self.__portstr, self.__protocol.ELM_ID))
+            else:
+                logger.error("Connected to the adapter, "
+                             "but failed to connect to the vehicle")
+                await self.close()
+                return False
+        except (asyncio.TimeoutError, ConnectionError) as e:
+            logger.error("Failed to initialize the ELM327: %s" % str(e))
+            await self.close()
+            return False
+
+        await self.__load_commands()
+        return True
+
+    async def __set_protocol(self, protocol_):
+        if protocol_ is not None:
+            # an explicit protocol was specified
+            if protocol_ not in ELM327._SUPPORTED_PROTOCOLS:
+                logger.error("%s is not a valid protocol. Please use \"1\" through \"A\"" % protocol_)
+                return False
+            await self.__send(b"ATTP" + protocol_.encode())
+            r0100 = await self.__send(b"0100")
+            if self.__has_message(r0100, "UNABLE TO CONNECT"):
+                return False
+            self.__protocol = ELM327._SUPPORTED_PROTOCOLS[protocol_](r0100)
+            return True
+
+        # -------------- try the ELM's auto protocol mode --------------
+        await self.__send(b"ATSP0")
+        r0100 = await self.__send(b"0100")
+        r = await self.__send(b"ATDPN")
+
+        p = r[0] if len(r) == 1 else ""
+        # suppress any "automatic" prefix
+        p = p[1:] if (len(p) > 1 and p.startswith("A")) else p
+
+        if p in ELM327._SUPPORTED_PROTOCOLS:
+            self.__protocol = ELM327._SUPPORTED_PROTOCOLS[p](r0100)
+            return True
+
+        logger.debug("ELM responded with unknown protocol. Trying them one-by-one")
+        for p in ELM327._TRY_PROTOCOL_ORDER:
+            await self.__send(b"ATTP" + p.encode())
+            r0100 = await self.__send(b"0100")
+            if not self.__has_message(r0100, "UNABLE TO CONNECT") and \
+                    not self.__has_message(r0100, "NO DATA") and \
+                    not self.__has_message(r0100, "BUS INIT: ...ERROR") and \
+                    not self.__has_message(r0100, "CAN ERROR"):
+                self.__protocol = ELM327._SUPPORTED_PROTOCOLS[p](r0100)
+                return True
+
+        logger.error("Failed to determine protocol")
+        return False
+
+    async def __load_commands(self):
+        """
+            Queries for available PIDs, sets their support status,
+            and compiles a list of command objects.
+        """
+        for get in commands.pid_getters():
+            # PID listing commands should sequentially become supported
+            # Mode 1 PID 0 is assumed to always be supported
+            if not self.test_cmd(get, warn=False):
+                continue
+
+            response = await self.query(get)
+
+            if response.is_null():
+                logger.info("No valid data for PID listing command: %s" % get)
+                continue
+
+            # loop through PIDs bit-array
+            for i, bit in enumerate(response.value):
+                if bit:
+                    mode = get.mode
+                    pid = get.pid + i + 1
+
+                    if commands.has_pid(mode, pid):
+                        self.supported_commands.add(commands[mode][pid])
+
+                    # set support for mode 2 commands
+                    if mode == 1 and commands.has_pid(2, pid):
+                        self.supported_commands.add(commands[2][pid])
+
+        logger.info("finished querying with %d commands supported" % len(self.supported_commands))
+
+    async def close(self):
+        """ Closes the connection, and clears supported_commands """
+        self.supported_commands = set()
+        self.__status = OBDStatus.NOT_CONNECTED
+
+        if self.__transport is not None and self.__transport.transport is not None:
+            logger.info("Closing connection")
+            self.__transport.transport.close()
+        self.__transport = None
+
+    def status(self):
+        """ returns the OBD connection status """
+        return self.__status
+
+    def is_connected(self):
+        """ Returns a boolean for whether a connection with the car was made. """
+        return self.__status == OBDStatus.CAR_CONNECTED
+
+    def protocol_name(self):
+        """ returns the name of the protocol being used by the ELM327 """
+        return self.__protocol.ELM_NAME if self.__protocol else ""
+
+    def protocol_id(self):
+        """ returns the ID of the protocol being used by the ELM327 """
+        return self.__protocol.ELM_ID if self.__protocol else ""
+
+    def supports(self, cmd):
+        """
+            Returns a boolean for whether the given command
+            is supported by the car
+        """
+        return cmd in self.supported_commands
+
+    def test_cmd(self, cmd, warn=True):
+        """
+            Returns a boolean for whether a command will
+            be sent without using force=True.
+        """
+        if not self.supports(cmd):
+            if warn:
+                logger.warning("'%s' is not supported" % str(cmd))
+            return False
+
+        # mode 06 is only implemented for the CAN protocols
+        if cmd.mode == 6 and self.protocol_id() not in ["6", "7", "8", "9"]:
+            if warn:
+                logger.warning("Mode 06 commands are only supported over CAN protocols")
+            return False
+
+        return True
+
+    async def query(self, cmd, force=False):
+        """
+            primary API function. Sends commands to the car, and
+            protects against sending unsupported commands.
+        """
+        if self.__status == OBDStatus.NOT_CONNECTED or self.__transport is None:
+            logger.warning("Query failed, no connection available")
+            return OBDResponse()
+
+        # if the user forces, skip all checks
+        if not force and not self.test_cmd(cmd):
+            return OBDResponse()
+
+        async with self.__lock:
+            try:
+                await self.__set_header(cmd.header)
+
+                logger.info("Sending command: %s" % str(cmd))
+                cmd_string = self.__build_command_string(cmd)
+                messages = self.__protocol(await self.__send(cmd_string, decode=False))
+            except asyncio.TimeoutError:
+                logger.warning("Timed out waiting for the ELM prompt")
+                return OBDResponse()
+            except ConnectionError:
+                logger.critical("Device disconnected")
+                self.__status = OBDStatus.NOT_CONNECTED
+                return OBDResponse()
+
+            # if we're sending a new command, note it
+            if cmd_string:
+                self.__last_command = cmd_string
+
+            # if we don't already know how many frames this command returns,
+            # log it, so we can specify it next time
+            if cmd not in self.__frame_counts:
+                self.__frame_counts[cmd] = sum([len(m.frames) for m in messages])
+
+        if not messages:
+            logger.info("No valid OBD Messages returned")
+            return OBDResponse()
+
+        return cmd(messages, raw=self.raw_values)  # compute a response object
+
+    async def stream(self, cmds, delay=0.0, force=False):
+        """
+            Async generator which repeatedly queries the given commands,
+            yielding each new response. An optional delay (in seconds)
+            is inserted after every pass over the commands.
+
+            Each pass is sent grouped by header, starting with the header
+            that is already set, to save AT SH round trips.
+        """
+        cmds = list(cmds)
+        while self.is_connected():
+            ordered, saved = group_by_header(cmds, self.__last_header)
+            self.header_switches_saved += saved
+            for cmd in ordered:
+                yield await self.query(cmd, force=force)
+            await asyncio.sleep(delay)
+
+    async def __set_header(self, header):
+        if header == self.__last_header:
+            return
+        r = await self.__send(b'AT SH ' + header + b' ')
+        if r != ["OK"]:
+            logger.info("Set Header ('AT SH %s') did not return 'OK'", header)
+            return
+        self.__last_header = header
+
+    def __build_command_string(self, cmd):
+        """ assembles the appropriate command string """
+        cmd_string = cmd.command
+
+        # if we know the number of frames that this command returns,
+        # only wait for exactly that number
+        if self.fast and cmd.fast and (cmd in self.__frame_counts):
+            cmd_string += str(self.__frame_counts[cmd]).encode()
+
+        # if we sent this last time, just send a CR
+        if self.fast and (cmd_string == self.__last_command):
+            cmd_string = b""
+
+        return cmd_string
+
+    async def __send(self, cmd, timeout=None, decode=True):
+        if self.__transport is None:
+            raise ConnectionError("Device disconnected")
+        lines = await self.__transport.send(cmd, timeout or self.timeout)
+        return decode_lines(lines) if decode else lines
+
+    def __isok(self, lines, expectEcho=False):
+        if not lines:
+            return False
+        if expectEcho:
+            # allow the adapter to already have echo disabled
+            return self.__has_message(lines, 'OK')
+        else:
+            return len(lines) == 1 and lines[0] == 'OK'
+
+    def __has_message(self, lines, text):
+        for line in lines:
+            if text in line:
+                return True
+        return False
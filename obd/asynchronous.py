@@ -30,6 +30,7 @@
 #                                                                      #
 ########################################################################
 
+import heapq
 import time
 import threading
 import logging
@@ -47,15 +48,20 @@ class Async(OBD):
 
     def __init__(self, portstr=None, baudrate=None, protocol=None, fast=True,
                  timeout=0.1, check_voltage=True, start_low_power=False,
-                 delay_cmds=0.25):
+                 delay_cmds=0.25, session_cache=None, max_baudrate=None,
+                 capture=None, keep_messages=True, raw_values=False):
         self.__thread = None
         super(Async, self).__init__(portstr, baudrate, protocol, fast,
-                                    timeout, check_voltage, start_low_power)
+                                    timeout, check_voltage, start_low_power,
+                                    session_cache, max_baudrate, capture, raw_values)
         self.__commands = {}   # key = OBDCommand, value = Response
         self.__callbacks = {}  # key = OBDCommand, value = list of Functions
+        self.__rates = {}  # key = OBDCommand, value = requested rate in Hz (None = every delay_cmds)
+        self.__intervals = {}  # key = OBDCommand, value = smoothed seconds between updates
         self.__running = False
         self.__was_running = False  # used with __enter__() and __exit__()
         self.__delay_cmds = delay_cmds
+        self.__keep_messages = keep_messages  # False = only keep the decoded values
 
     @property
     def running(self):
@@ -121,11 +127,17 @@ class Async(OBD):
         self.stop()
         super(Async, self).close()
 
-    def watch(self, c, callback=None, force=False):
+    def watch(self, c, callback=None, force=False, rate_hz=None):
         """
             Subscribes the given command for continuous updating. Once subscribed,
             query() will return that command's latest value. Optional callbacks can
             be given, which will be fired upon every new value.
+
+            rate_hz requests a polling rate for this command. Commands are
+            scheduled earliest-deadline-first, so fast-changing PIDs get more
+            of the bus. Without a rate, a command is polled again delay_cmds
+            seconds after the pass it was updated in. Commands that are due
+            together are sent grouped by header.
         """
 
         # the dict shouldn't be changed while the daemon thread is iterating
@@ -143,6 +155,14 @@ class Async(OBD):
                 self.__commands[c] = OBDResponse()  # give it an initial value
                 self.__callbacks[c] = []  # create an empty list
 
+            if rate_hz is not None:
+                if rate_hz <= 0:
+                    logger.warning("Ignoring non-positive rate for command: %s" % str(c))
+                else:
+                    self.__rates[c] = float(rate_hz)
+            elif c not in self.__rates:
+                self.__rates[c] = None
+
             # if a callback was given, push it
             if hasattr(callback, "__call__") and (callback not in self.__callbacks[c]):
                 logger.info("subscribing callback for command: %s" % str(c))
@@ -169,10 +189,14 @@ class Async(OBD):
                     # if no more callbacks are left, remove the command entirely
                     if len(self.__callbacks[c]) == 0:
                         self.__commands.pop(c, None)
+                        self.__rates.pop(c, None)
+                        self.__intervals.pop(c, None)
                 else:
                     # no callback was specified, pop everything
                     self.__callbacks.pop(c, None)
                     self.__commands.pop(c, None)
+                    self.__rates.pop(c, None)
+                    self.__intervals.pop(c, None)
 
     def unwatch_all(self):
         """ Unsubscribes all commands and callbacks from being updated """
@@ -184,6 +208,8 @@ class Async(OBD):
             logger.info("Unwatching all")
             self.__commands = {}
             self.__callbacks = {}
+            self.__rates = {}
+            self.__intervals = {}
 
     def query(self, c, force=False):
         """
@@ -196,31 +222,97 @@ class Async(OBD):
         else:
             return OBDResponse()
 
+    def rates(self):
+        """
+            Returns the polling rates of the watched commands as a dict of
+            {OBDCommand: (requested_hz, achieved_hz)}. The requested rate is
+            None for commands watched without one, and the achieved rate is
+            None until a command has been updated at least twice.
+        """
+        rates = {}
+        for c in self.__commands:
+            interval = self.__intervals.get(c)
+            achieved = (1.0 / interval) if interval else None
+            rates[c] = (self.__rates.get(c), achieved)
+        return rates
+
     def run(self):
         """ Daemon thread """
 
+        # earliest-deadline-first queue of (deadline, tie-breaker, command)
+        # the watch list can't change while running, so build it once
+        now = time.monotonic()
+        queue = [(now, i, c) for i, c in enumerate(self.__commands)]
+        heapq.heapify(queue)
+        last_update = {}  # key = OBDCommand, value = monotonic time of the last update
+
         # loop until the stop signal is received
         while self.__running:
 
-            if len(self.__commands) > 0:
-                # loop over the requested commands, send, and collect the response
-                for c in self.__commands:
-                    if not self.is_connected():
-                        logger.info("Async thread terminated because device disconnected")
-                        self.__running = False
-                        self.__thread = None
-                        return
-
-                    # force, since commands are checked for support in watch()
-                    r = super(Async, self).query(c, force=True)
-
-                    # store the response
-                    self.__commands[c] = r
-
-                    # fire the callbacks, if there are any
-                    for callback in self.__callbacks[c]:
-                        callback(r)
-                time.sleep(self.__delay_cmds)
-
-            else:
+            if len(queue) == 0:
                 time.sleep(0.25)  # idle
+                continue
+
+            deadline, i, c = queue[0]
+            now = time.monotonic()
+            if deadline > now:
+                # wake up regularly to notice the stop signal
+                time.sleep(min(deadline - now, 0.25))
+                continue
+
+            # take every command that's due, and send them grouped by header
+            due = {}  # key = OBDCommand, value = (deadline, tie-breaker)
+            while queue and queue[0][0] <= now:
+                deadline, i, c = heapq.heappop(queue)
+                due[c] = (deadline, i)
+
+            updated = []
+            for c in self._group_by_header(list(due)):
+
+                if not self.__running:
+                    break  # the queue is rebuilt when the loop is restarted
+
+                if not self.is_connected():
+                    logger.info("Async thread terminated because device disconnected")
+                    self.__running = False
+                    self.__thread = None
+                    return
+
+                # force, since commands are checked for support in watch()
+                r = super(Async, self).query(c, force=True)
+
+                # long sessions don't need every sample's frames, just the values
+                if not self.__keep_messages:
+                    r.drop_messages()
+
+                # store the response
+                self.__commands[c] = r
+
+                # fire the callbacks, if there are any
+                for callback in self.__callbacks[c]:
+                    callback(r)
+
+                # track the achieved rate with an exponential moving average
+                now = time.monotonic()
+                if c in last_update:
+                    interval = now - last_update[c]
+                    previous = self.__intervals.get(c)
+                    if previous is None:
+                        self.__intervals[c] = interval
+                    else:
+                        self.__intervals[c] = 0.8 * previous + 0.2 * interval
+                last_update[c] = now
+                updated.append(c)
+
+            # schedule the next updates. Rated commands keep a fixed cadence,
+            # but never build up a backlog when the bus is saturated. The
+            # others are due again together, so they stay grouped by header
+            now = time.monotonic()
+            for c in updated:
+                deadline, i = due[c]
+                rate = self.__rates.get(c)
+                if rate is None:
+                    deadline = now + self.__delay_cmds
+                else:
+                    deadline = max(deadline + (1.0 / rate), now)
+                heapq.heappush(queue, (deadline, i, c))
@@ -34,7 +34,7 @@ import logging
 
 from .OBDCommand import OBDCommand
 from .decoders import *
-from .protocols import ECU
+from .protocols import ECU, ECU_HEADER
 
 logger = logging.getLogger(__name__)
 
@@ -336,6 +336,11 @@ class Commands():
         for c in __misc__:
             self.__dict__[c.name] = c
 
+        # O(1) lookups by command, and by (mode, pid, header)
+        self.__all = set(c for c in self.__dict__.values() if isinstance(c, OBDCommand))
+        self.__by_pid = dict(((c.mode, c.pid, c.header), c) for c in self.__all
+                             if c.mode is not None)
+
     def __getitem__(self, key):
         """
             commands can be accessed by name, or by mode/pid
@@ -390,7 +395,11 @@ class Commands():
 
     def has_command(self, c):
         """ checks for existance of a command by OBDCommand object """
-        return c in self.__dict__.values()
+        return c in self.__all
+
+    def lookup(self, mode, pid, header=ECU_HEADER.ENGINE):
+        """ returns the command for an int mode, int pid and header, or None """
+        return self.__by_pid.get((mode, pid, header))
 
     def has_name(self, name):
         """ checks for existance of a command by name """
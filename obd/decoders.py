@@ -33,9 +33,10 @@ import time
 import math
 import functools
 from .utils import *
+from . import codes
 from .codes import *
 from .OBDResponse import Status, StatusTest, Monitor, MonitorTest
-from .UnitsAndScaling import Unit, UAS_IDS
+from .UnitsAndScaling import Unit, UAS, UAS_IDS
 
 import logging
 
@@ -81,7 +82,12 @@ Unit/Scaling in that table, simply to avoid redundant code.
 
 def uas(id_):
     """ get the corresponding decoder for this UAS ID """
-    return functools.partial(decode_uas, id_=id_)
+    decoder = functools.partial(decode_uas, id_=id_)
+    if isinstance(UAS_IDS[id_], UAS):
+        # numeric UAS also decode to plain numbers (see quantity())
+        decoder.raw = functools.partial(decode_uas_raw, id_=id_)
+        decoder.unit = UAS_IDS[id_].unit_name
+    return decoder
 
 
 def decode_uas(messages, id_):
@@ -89,134 +95,188 @@ def decode_uas(messages, id_):
     return UAS_IDS[id_](d)
 
 
+def decode_uas_raw(messages, id_):
+    d = messages[0].data[2:]  # chop off mode and PID bytes
+    return UAS_IDS[id_].raw(d)
+
+
 """
 General sensor decoders
 Return pint Quantities
+
+Each is written as a plain number decoder, and wrapped by quantity() to
+attach its unit. The wrapped decoder keeps the number decoder as .raw,
+and the unit's name as .unit, so that raw value queries (see
+OBDCommand.__call__) never touch pint.
 """
 
+
+def quantity(unit):
+    """
+        decorator turning a number decoder into a Quantity decoder
+
+        the unit is given by name (as pint prints it), and looked
+        up in the registry on the first decode
+    """
+
+    def decorate(raw):
+        resolved = []  # the Quantity class and pint unit, once looked up
+
+        @functools.wraps(raw)
+        def decoder(messages):
+            v = raw(messages)
+            if v is None:
+                return None
+            if not resolved:
+                resolved.extend((Unit.Quantity, Unit.Unit(unit)))
+            return resolved[0](v, resolved[1])
+
+        decoder.raw = raw
+        decoder.unit = unit
+        return decoder
+
+    return decorate
+
+
+@quantity("count")
 def count(messages):
     d = messages[0].data[2:]
     v = bytes_to_int(d)
-    return v * Unit.count
+    return v
 
 # 0 to 100 %
+@quantity("percent")
 def percent(messages):
     d = messages[0].data[2:]
     v = d[0]
     v = v * 100.0 / 255.0
-    return v * Unit.percent
+    return v
 
 
 # -100 to 100 %
+@quantity("percent")
 def percent_centered(messages):
     d = messages[0].data[2:]
     v = d[0]
     v = (v - 128) * 100.0 / 128.0
-    return v * Unit.percent
+    return v
 
 
 # -40 to 215 C
+@quantity("degree_Celsius")
 def temp(messages):
     d = messages[0].data[2:]
     v = bytes_to_int(d)
     v = v - 40
-    return Unit.Quantity(v, Unit.celsius)  # non-multiplicative unit
+    return v  # Quantity() handles the non-multiplicative unit
 
 
 # -128 to 128 mA
+@quantity("milliampere")
 def current_centered(messages):
     d = messages[0].data[2:]
     v = bytes_to_int(d[2:4])
     v = (v / 256.0) - 128
-    return v * Unit.milliampere
+    return v
 
 
 # 0 to 1.275 volts
+@quantity("volt")
 def sensor_voltage(messages):
     d = messages[0].data[2:]
     v = d[0] / 200.0
-    return v * Unit.volt
+    return v
 
 
 # 0 to 8 volts
+@quantity("volt")
 def sensor_voltage_big(messages):
     d = messages[0].data[2:]
     v = bytes_to_int(d[2:4])
     v = (v * 8.0) / 65535
-    return v * Unit.volt
+    return v
 
 
 # 0 to 765 kPa
+@quantity("kilopascal")
 def fuel_pressure(messages):
     d = messages[0].data[2:]
     v = d[0]
     v = v * 3
-    return v * Unit.kilopascal
+    return v
 
 
 # 0 to 255 kPa
+@quantity("kilopascal")
 def pressure(messages):
     d = messages[0].data[2:]
     v = d[0]
-    return v * Unit.kilopascal
+    return v
 
 
 # -8192 to 8192 Pa
+@quantity("pascal")
 def evap_pressure(messages):
     # decode the twos complement
     d = messages[0].data[2:]
     a = twos_comp(d[0], 8)
     b = twos_comp(d[1], 8)
     v = ((a * 256.0) + b) / 4.0
-    return v * Unit.pascal
+    return v
 
 
 # 0 to 327.675 kPa
+@quantity("kilopascal")
 def abs_evap_pressure(messages):
     d = messages[0].data[2:]
     v = bytes_to_int(d)
     v = v / 200.0
-    return v * Unit.kilopascal
+    return v
 
 
 # -32767 to 32768 Pa
+@quantity("pascal")
 def evap_pressure_alt(messages):
     d = messages[0].data[2:]
     v = bytes_to_int(d)
     v = v - 32767
-    return v * Unit.pascal
+    return v
 
 
 # -64 to 63.5 degrees
+@quantity("degree")
 def timing_advance(messages):
     d = messages[0].data[2:]
     v = d[0]
     v = (v - 128) / 2.0
-    return v * Unit.degree
+    return v
 
 
 # -210 to 301 degrees
+@quantity("degree")
 def inject_timing(messages):
     d = messages[0].data[2:]
     v = bytes_to_int(d)
     v = (v - 26880) / 128.0
-    return v * Unit.degree
+    return v
 
 
 # 0 to 2550 grams/sec
+@quantity("gps")
 def max_maf(messages):
     d = messages[0].data[2:]
     v = d[0]
     v = v * 10
-    return v * Unit.gps
+    return v
 
 
 # 0 to 3212 Liters/hour
+@quantity("lph")
 def fuel_rate(messages):
     d = messages[0].data[2:]
     v = bytes_to_int(d)
     v = v * 0.05
-    return v * Unit.liters_per_hour
+    return v
 
 
 # special bit encoding for PID 13
@@ -249,13 +309,15 @@ def o2_sensors_alt(messages):
 
 
 # 0 to 25700 %
+@quantity("percent")
 def absolute_load(messages):
     d = messages[0].data[2:]
     v = bytes_to_int(d)
     v *= 100.0 / 255.0
-    return v * Unit.percent
+    return v
 
 
+@quantity("volt")
 def elm_voltage(messages):
     # doesn't register as a normal OBD response,
     # so access the raw frame data
@@ -265,7 +327,7 @@ def elm_voltage(messages):
     v = v.replace('v', '')
 
     try:
-        return float(v) * Unit.volt
+        return float(v)
     except ValueError:
         logger.warning("Failed to parse ELM voltage")
         return None
@@ -388,6 +450,25 @@ def fuel_type(messages):
     return v
 
 
+# DTC code strings by byte. The first byte gives the letter, the first
+# digit and the first hex digit, the second byte the last two hex digits
+#
+# BYTES: (16,      35      )
+# HEX:    4   1    2   3
+# BIN:    01000001 00100011
+#         [][][  in hex   ]
+#         | / /
+# DTC:    C0123
+_DTC_HIGH = tuple("PCBU"[b >> 6] + "%d%X" % ((b >> 4) & 0b0011, b & 0x0F) for b in range(256))
+_DTC_LOW = tuple("%02X" % b for b in range(256))
+
+
+def dtc_codes(data):
+    """ converts a run of 2-byte DTCs into a list of DTC codes, skipping padding """
+    # an odd trailing byte is dropped by zip()
+    return [_DTC_HIGH[a] + _DTC_LOW[b] for a, b in zip(data[0::2], data[1::2]) if a or b]
+
+
 def parse_dtc(_bytes):
 
     """ converts 2 bytes into a DTC code """
@@ -396,63 +477,30 @@ def parse_dtc(_bytes):
     if (len(_bytes) != 2) or (_bytes == (0, 0)):
         return None
 
-    # BYTES: (16,      35      )
-    # HEX:    4   1    2   3
-    # BIN:    01000001 00100011
-    #         [][][  in hex   ]
-    #         | / /
-    # DTC:    C0123
-
-    dtc = ['P', 'C', 'B', 'U'][_bytes[0] >> 6]  # the last 2 bits of the first byte
-    dtc += str((_bytes[0] >> 4) & 0b0011)  # the next pair of 2 bits. Mask off the bits we read above
-    dtc += bytes_to_hex(_bytes)[1:4]
+    dtc = _DTC_HIGH[_bytes[0]] + _DTC_LOW[_bytes[1]]
 
     # pull a description if we have one
-    return (dtc, DTC.get(dtc, ""))
+    return (dtc, codes.DTC.get(dtc, ""))
 
 
 def hex_to_int(str):
-    i = eval("0x" + str, {}, {})
-    return i
+    return int(str, 16)
 
 
 def single_dtc(messages):
     """ parses a single DTC from a message """
     d = messages[0].data[2:]
-    #d = messages[0].data[1:3]
     return parse_dtc(d)
 
 
 def dtc(messages):
     """ converts a frame of 2-byte DTCs into a list of DTCs """
-    codes = []
-    d = []
-    print("len messages == ",len(messages))
-
+    d = bytearray()
     for message in messages:
+        d += message.data[2:]  # remove the mode and DTC_count bytes
 
-        print("len data == ", len(message.data))
-        #  # remove the mode and DTC_count bytes
-        if message.can == False:
-            d += message.data[2:]
-        elif message.can and message.num_frames == 1:
-            d += message.data[1:]  # remove the mode and DTC_count bytes
-        elif message.can and message.num_frames > 1:
-            d += message.data[0:]  # remove the mode and DTC_count bytes
-    print(d)
-    print(len(d))
-    # look at data in pairs of bytes
-    # looping through ENDING indices to avoid odd (invalid) code lengths
-
-    for n in range(1, len(d), 2):
-        # parse the code
-        dtc = parse_dtc([d[n-1],d[n]])
-
-        if (dtc is not None) and (dtc[0] != "P0000"):
-            print(dtc)
-            codes.append(dtc)
-
-    return codes
+    # the description table is only loaded once there's a code to describe
+    return [(code, codes.DTC.get(code, "")) for code in dtc_codes(d)]
 
 
 def parse_monitor_test(d, mon):
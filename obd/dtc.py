@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+########################################################################
+#                                                                      #
+# python-OBD: A python OBD-II serial module derived from pyobd         #
+#                                                                      #
+# Copyright 2004 Donour Sizemore (donour@uchicago.edu)                 #
+# Copyright 2009 Secons Ltd. (www.obdtester.com)                       #
+# Copyright 2009 Peter J. Creath                                       #
+# Copyright 2016 Brendan Whitfield (brendan-w.com)                     #
+#                                                                      #
+########################################################################
+#                                                                      #
+# dtc.py                                                               #
+#                                                                      #
+# This file is part of python-OBD (a derivative of pyOBD)              #
+#                                                                      #
+# python-OBD is free software: you can redistribute it and/or modify   #
+# it under the terms of the GNU General Public License as published by #
+# the Free Software Foundation, either version 2 of the License, or    #
+# (at your option) any later version.                                  #
+#                                                                      #
+# python-OBD is distributed in the hope that it will be useful,        #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+# GNU General Public License for more details.                         #
+#                                                                      #
+# You should have received a copy of the GNU General Public License    #
+# along with python-OBD.  If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                      #
+########################################################################
+
+
+import bisect
+import logging
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Mapping
+
+logger = logging.getLogger(__name__)
+
+"""
+DTC descriptions, one compiled table per language in obd/data/
+
+A table is a sorted index of fixed-size records followed by the UTF-8
+descriptions. It is memory-mapped: only the codes are read into memory
+(on the first lookup), and a description is read when it is first asked
+for. A lookup is a binary search over the codes, and a prefix search
+(P01XX) is two.
+
+The tables are compiled from the tab-separated sources in translation/:
+
+    python -m obd.dtc translation/dtc_cs.tsv obd/data/dtc_cs.bin
+"""
+
+LANGUAGE = "cs"  # the language of codes.DTC
+
+_DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+_MAGIC = b"DTC1"
+_HEADER = struct.Struct(">4sI")  # magic, number of codes
+_RECORD = struct.Struct(">5sIH")  # code, offset and length of the description
+
+_tables = {}  # key = language, value = DTCTable
+
+
+class DTCTable(Mapping):
+    """
+        Read-only mapping of DTC code to description, backed by a
+        compiled table. Codes iterate in sorted order.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.__count = _HEADER.unpack_from(self.__map, 0)
+        if magic != _MAGIC:
+            raise ValueError("%s is not a DTC table" % path)
+        self.__text = _HEADER.size + self.__count * _RECORD.size  # start of the descriptions
+        self.__codes = None  # the code column, read on first use
+        self.__read = {}  # key = code, value = description already read from the table
+        self.path = path
+
+    @property
+    def _codes(self):
+        if self.__codes is None:
+            index = self.__map[_HEADER.size:self.__text]
+            self.__codes = [index[i:i + 5].decode("ascii")
+                            for i in range(0, len(index), _RECORD.size)]
+        return self.__codes
+
+    def __description(self, i):
+        _, offset, length = _RECORD.unpack_from(self.__map, _HEADER.size + i * _RECORD.size)
+        start = self.__text + offset
+        return self.__map[start:start + length].decode("utf-8")
+
+    def __getitem__(self, code):
+        if code in self.__read:
+            return self.__read[code]
+        codes = self._codes
+        i = bisect.bisect_left(codes, code) if isinstance(code, str) else len(codes)
+        if i < len(codes) and codes[i] == code:
+            description = self.__read[code] = self.__description(i)
+            return description
+        raise KeyError(code)
+
+    def __len__(self):
+        return self.__count
+
+    def __iter__(self):
+        return iter(self._codes)
+
+    def __range(self, prefix):
+        # "P01XX" and "P01" both mean every P01 code
+        prefix = prefix.rstrip("xX").upper()
+        codes = self._codes
+        return bisect.bisect_left(codes, prefix), bisect.bisect_left(codes, prefix + "\uffff")
+
+    def codes(self, prefix=""):
+        """ the codes starting with prefix, in order """
+        lo, hi = self.__range(prefix)
+        return self._codes[lo:hi]
+
+    def search(self, prefix=""):
+        """ the (code, description) pairs starting with prefix, in order """
+        lo, hi = self.__range(prefix)
+        return [(self._codes[i], self.__description(i)) for i in range(lo, hi)]
+
+
+def load(language=None):
+    """
+        Returns the DTCTable for a language (default: LANGUAGE). Unknown
+        languages fall back to the default one.
+    """
+    language = language or LANGUAGE
+    if language not in _tables:
+        path = os.path.join(_DATA, "dtc_%s.bin" % language)
+        if not os.path.exists(path) and language != LANGUAGE:
+            logger.warning("No DTC descriptions for language '%s', using '%s'" % (language, LANGUAGE))
+            return load(LANGUAGE)
+        _tables[language] = DTCTable(path)
+    return _tables[language]
+
+
+def write_table(descriptions, path):
+    """ compiles a dict of {code: description} into a table file """
+    codes = sorted(descriptions)
+    index = []
+    text = bytearray()
+    for code in codes:
+        if len(code) != 5:
+            raise ValueError("Invalid DTC code: %r" % code)
+        d = descriptions[code].encode("utf-8")
+        index.append(_RECORD.pack(code.encode("ascii"), len(text), len(d)))
+        text += d
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(codes)))
+        f.write(b"".join(index))
+        f.write(text)
+
+
+def read_tsv(path):
+    """ reads a tab-separated source file of code/description lines """
+    descriptions = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if line:
+                code, description = line.split("\t", 1)
+                descriptions[code] = description
+    return descriptions
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python -m obd.dtc <source.tsv> <table.bin>")
+        sys.exit(1)
+    write_table(read_tsv(sys.argv[1]), sys.argv[2])
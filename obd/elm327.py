@@ -35,11 +35,43 @@ import serial
 import time
 import logging
 from .protocols import *
+from .replay import CapturePort, ReplayPort
+from .simulator import SimulatorPort
 from .utils import OBDStatus
 
 
 logger = logging.getLogger(__name__)
 
+# a line is everything between CR/LFs, minus any surrounding whitespace
+_LINE = re.compile(rb"[^\s](?:[^\r\n]*[^\s])?")
+
+
+def split_lines(buffer, end_marker=b">"):
+    """
+        splits a response buffer into lines without copying them
+
+        returns a list of memoryview slices into the buffer, with
+        NUL characters, the trailing end marker, empty lines and
+        surrounding whitespace removed
+    """
+
+    # clean out any null characters
+    if b"\x00" in buffer:
+        buffer = buffer.replace(b"\x00", b"")
+
+    # ignore the prompt character
+    end = len(buffer)
+    if buffer.endswith(end_marker):
+        end -= len(end_marker)
+
+    view = memoryview(buffer)
+    return [view[m.start():m.end()] for m in _LINE.finditer(buffer, 0, end)]
+
+
+def decode_lines(lines):
+    """ converts the lines from split_lines() into standard strings """
+    return [bytes(line).decode("utf-8", "ignore") for line in lines]
+
 
 class ELM327:
     """
@@ -104,11 +136,24 @@ class ELM327:
     # We check the two default baud rates first, then go fastest to
     # slowest, on the theory that anyone who's using a slow baud rate is
     # going to be less picky about the time required to detect it.
-    _TRY_BAUDS = [38400, 9600,  115200, 57600, 19200, 14400, 3000000, 2000000, 1000000, 250000, 230400, 128000, 500000, 460800, 500000, 576000, 921600, 1000000, 1152000, 1500000, 2000000, 2500000, 3000000, 3500000, 4000000]
+    _TRY_BAUDS = [38400, 9600, 115200, 57600, 19200, 14400, 3000000, 2000000, 1000000, 250000, 230400, 128000, 500000, 460800, 576000, 921600, 1152000, 1500000, 2500000, 3500000, 4000000]
+
+    # the baudrate each port last answered at, tried first by auto_baudrate()
+    _LAST_BAUDS = {}
 
     def __init__(self, portname, baudrate, protocol, timeout,
-                 check_voltage=False, start_low_power=False):
-        """Initializes port by resetting device and gettings supported PIDs. """
+                 check_voltage=False, start_low_power=False, max_baudrate=None,
+                 capture=None):
+        """
+            Initializes port by resetting device and gettings supported PIDs.
+
+            Ports named replay://<file>[?speed=N] replay a capture file
+            (see replay.py) instead of opening a serial port. A capture
+            path records all of this port's traffic to that file, and
+            capture=True records it in memory until save_capture(). Ports
+            named sim://[?protocol=6&latency=...] talk to a simulated
+            adapter and car (see simulator.py).
+        """
 
         logger.info("Initializing ELM327: PORT=%s BAUD=%s PROTOCOL=%s" %
                     (
@@ -125,24 +170,33 @@ class ELM327:
         self.__status = OBDStatus.NOT_CONNECTED
         self.__port = None
         self.__protocol = UnknownProtocol([])
+        self.__signature = ""
+        self.__boot_baudrate = None  # the rate the adapter answers at after a reset
         self.__low_power = False
         self.timeout = timeout
 
 
         # ------------- open port -------------
         try:
-            self.__port = serial.serial_for_url(portname,
-                                                parity=serial.PARITY_NONE,
-                                                stopbits=1,
-                                                bytesize=8,
-                                                timeout=10)  # seconds
+            if portname.startswith("replay://"):
+                self.__port = ReplayPort.from_url(portname)
+            elif portname.startswith("sim://"):
+                self.__port = SimulatorPort.from_url(portname)
+            else:
+                self.__port = serial.serial_for_url(portname,
+                                                    parity=serial.PARITY_NONE,
+                                                    stopbits=1,
+                                                    bytesize=8,
+                                                    timeout=10)  # seconds
+            if capture is not None:
+                self.__port = CapturePort(self.__port, None if capture is True else capture)
             print('Port '+portname+' created')
             self.__port.write_timeout = timeout
         except serial.SerialException as e:
             self.__error(e)
             print(e)
             return
-        except OSError as e:
+        except (OSError, ValueError) as e:
             self.__error(e)
             print(e)
             return
@@ -150,7 +204,7 @@ class ELM327:
         # If we start with the IC in the low power state we need to wake it up
         if start_low_power:
             self.__write(b" ")
-            time.sleep(1)
+            self.__read(timeout=1)  # wait for the wake-up, but no longer than 1 second
             print('Start low power')
 
         # ------------------------ find the ELM's baud ------------------------
@@ -163,7 +217,7 @@ class ELM327:
         # ---------------------------- ATZ (reset) ----------------------------
 
         try:
-            r =self.__send(b"ATZ", delay=1)  # wait 1 second for ELM to initialize
+            r = self.__send(b"ATZ")  # returns once the ELM has rebooted and shows its prompt
             if "elm" in str(r).lower():
                 print(str(r))
                 print('ATZ succesful')
@@ -177,7 +231,7 @@ class ELM327:
             return
 
         # -------------------------- ATE0 (echo OFF) --------------------------
-        r = self.__send(b"ATE0", delay=1)
+        r = self.__send(b"ATE0")
         if not self.__isok(r, expectEcho=True):
             self.__error("ATE0 did not return 'OK'")
             return
@@ -185,7 +239,7 @@ class ELM327:
             print('ATE0 OK')
 
         # ------------------------- ATH1 (headers ON) -------------------------
-        r = self.__send(b"ATH1", delay=1)
+        r = self.__send(b"ATH1")
         if not self.__isok(r):
             self.__error("ATH1 did not return 'OK', or echoing is still ON")
             return
@@ -200,6 +254,10 @@ class ELM327:
         else:
             print('ATL0 OK')
 
+        # ------------------ switch to a faster baudrate -------------------
+        if max_baudrate is not None:
+            self.upgrade_baudrate(max_baudrate)
+
         # by now, we've successfuly communicated with the ELM, but not the car
         self.__status = OBDStatus.ELM_CONNECTED
         print('Connected to the ELM327')
@@ -269,7 +327,7 @@ class ELM327:
 
         if not self.__has_message(r0100, "UNABLE TO CONNECT"):
             # success, found the protocol
-            self.__protocol = self._SUPPORTED_PROTOCOLS[protocol_](r0100)
+            self.__load_protocol(protocol_, r0100)
             print('Protocol set.')
             return True
         else:
@@ -287,10 +345,10 @@ class ELM327:
         """
 
         # -------------- try the ELM's auto protocol mode --------------
-        r = self.__send(b"ATSP0", delay=1)
+        r = self.__send(b"ATSP0")
         print('Trying to set auto protocol.')
         # -------------- 0100 (first command, SEARCH protocols) --------------
-        r0100 = self.__send(b"0100", delay=1)
+        r0100 = self.__send(b"0100")  # the protocol search ends with the prompt
         if self.__has_message(r0100, "UNABLE TO CONNECT"):
             logger.error("Failed to query protocol 0100: unable to connect")
             print("Failed to query protocol 0100: unable to connect")
@@ -310,7 +368,7 @@ class ELM327:
         # check if the protocol is something we know
         if p in self._SUPPORTED_PROTOCOLS:
             # jackpot, instantiate the corresponding protocol handler
-            self.__protocol = self._SUPPORTED_PROTOCOLS[p](r0100)
+            self.__load_protocol(p, r0100)
             return True
         else:
             # an unknown protocol
@@ -327,7 +385,7 @@ class ELM327:
                     not self.__has_message(r0100, "CAN ERROR"):
                     # success, found the protocol
                     print('success, found the protocol')
-                    self.__protocol = self._SUPPORTED_PROTOCOLS[p](r0100)
+                    self.__load_protocol(p, r0100)
                     return True
 
         # if we've come this far, then we have failed...
@@ -335,6 +393,18 @@ class ELM327:
         print("Failed to determine protocol")
         return False
 
+    def __load_protocol(self, p, r0100):
+        """
+            instantiates the protocol handler for the given ID, and
+            records the car's answer to 0100 as its ECU signature
+        """
+        self.__protocol = self._SUPPORTED_PROTOCOLS[p](r0100)
+
+        # the responding ECUs and their supported PIDs identify the car
+        messages = [m for m in self.__protocol(r0100) if m.parsed()]
+        self.__signature = " ".join(sorted(["%s:%s" % (m.tx_id, m.hex().decode())
+                                            for m in messages]))
+
     def set_baudrate(self, baud):
         if baud is None:
             # when connecting to pseudo terminal, don't bother with auto baud
@@ -342,12 +412,14 @@ class ELM327:
                 logger.debug("Detected pseudo terminal, skipping baudrate setup")
                 print("Detected pseudo terminal, skipping baudrate setup")
                 self.__port.baudrate = 38400
+                self.__boot_baudrate = 38400
                 return True
             else:
                 return self.auto_baudrate()
         else:
             try:
                 self.__port.baudrate = baud
+                self.__boot_baudrate = baud
                 print("Baud rate set!")
             except serial.serialutil.SerialException:
                 print("Baud rate not supported!")
@@ -357,27 +429,30 @@ class ELM327:
     def auto_baudrate(self):
         """
         Detect the baud rate at which a connected ELM32x interface is operating.
+        The rate this port last answered at is tried first.
         Returns boolean for success.
         """
 
         # before we change the timout, save the "normal" value
         timeout = self.__port.timeout
         self.__port.timeout = 0.1  # we're only talking with the ELM, so things should go quickly
-        #print(self.__port.write_timeout)
         self.__port.write_timeout = 0.1
-        #print(self.__port.write_timeout)
-        for baud in self._TRY_BAUDS:
-            print('Baudrate ' + str(baud))
+
+        bauds = list(self._TRY_BAUDS)
+        last = self._LAST_BAUDS.get(self.port_name())
+        if last in bauds:
+            bauds.remove(last)
+        if last is not None:
+            bauds.insert(0, last)
+
+        for baud in bauds:
             try:
                 self.__port.baudrate = baud
             except serial.serialutil.SerialException:
-                print('This baudrate is not supported on this platform!')
+                logger.debug("Baud %d is not supported on this platform" % baud)
                 continue
 
-            print("Trying baudrate "+str(baud))
-            print('flushing input')
             self.__port.flushInput()
-            print('flushing output')
             self.__port.flushOutput()
 
             # Send a nonsense command to get a prompt back from the scanner
@@ -388,32 +463,23 @@ class ELM327:
 
             # All commands should be terminated with carriage return according
             # to ELM327 and STN11XX specifications
-            
-            print('writing \x7F\x7F\r')
             try:
                 self.__port.write(b"\x7F\x7F\r")
             except serial.serialutil.SerialTimeoutException:
-                print('Timeout')
-            """
-            print('writing ATZ')
-            try:
-                self.__port.write(b"ATZ\r")
-            except serial.serialutil.SerialTimeoutException:
-                print('Timeout')
-            """
-            print('flushing')
+                logger.debug("Write timeout at baud %d" % baud)
             self.__port.flush()
-            print('reading')
-            response = self.__port.read(1024)
+
+            # returns as soon as the prompt arrives, instead of waiting out the timeout
+            response = self.__port.read_until(self.ELM_PROMPT, 1024)
             logger.debug("Response from baud %d: %s" % (baud, repr(response)))
-            print("Response from baud %d: %s" % (baud, repr(response)))
-            # watch for the prompt character
-            #if (response.endswith(b">")) or ("elm" in str(response).lower()) or (b'\x7f\x7f\r' in response):
-            if "elm" in str(response).lower() or ((b'\x7f\x7f\r' in response) and (response.endswith(b">"))):
+
+            if self.__looks_like_elm(response):
                 logger.debug("Choosing baud %d" % baud)
                 print("Choosing baud %d" % baud)
                 self.__port.timeout = timeout  # reinstate our original timeout
                 self.__port.write_timeout = timeout
+                self._LAST_BAUDS[self.port_name()] = baud
+                self.__boot_baudrate = baud
                 return True
 
         logger.debug("Failed to choose baud")
@@ -425,6 +491,86 @@ class ELM327:
             return False
         return False
 
+    def __looks_like_elm(self, response):
+        """
+            whether a response to the auto_baudrate() probe came from
+            an ELM talking at the current baudrate
+        """
+        if b"elm" in response.lower():
+            return True
+
+        # At the wrong baudrate, bytes arrive mangled, usually with the high
+        # bit set. Plain ASCII lines ending in the prompt mean the framing is
+        # right, even if the echo was eaten or echo is off ("?\r\r>").
+        return (response.endswith(self.ELM_PROMPT) and
+                b"\r" in response and
+                all(b < 0x80 for b in response))
+
+    def upgrade_baudrate(self, baud):
+        """
+            Switches the adapter to a faster baudrate, with the ELM's
+            AT BRD handshake (or STBR on STN chips). The adapter falls
+            back to the old rate by itself if the handshake fails.
+
+            Note that ATZ resets the adapter to its boot baudrate.
+            Returns boolean for success.
+        """
+
+        current = self.__port.baudrate
+        if baud <= current:
+            return True
+
+        r = self.__send(b"STI")
+        if r and r[0].upper().startswith("STN"):
+            cmd = b"STBR " + str(baud).encode()
+        else:
+            # the ELM327 runs at 4 Mbaud / divisor, with divisors from 08 to FF
+            divisor = min(max(int(round(4000000.0 / baud)), 0x08), 0xFF)
+            baud = int(round(4000000.0 / divisor))
+            cmd = b"AT BRD %02X" % divisor
+
+        if baud <= current:
+            return True
+
+        # the adapter answers OK at the old rate, then switches and
+        # sends its ID string, waiting for a CR at the new rate
+        self.__write(cmd)
+        r = decode_lines(self.__read(end_marker=b"OK", timeout=1))
+        if not self.__has_message(r, "OK"):
+            logger.info("Adapter refused to switch to baud %d" % baud)
+            self.__read(timeout=1)  # consume the prompt
+            return False
+
+        try:
+            self.__port.baudrate = baud
+        except serial.serialutil.SerialException:
+            logger.info("Baud %d is not supported on this platform" % baud)
+            self.__read(timeout=1)  # the adapter reverts, and shows its prompt
+            return False
+
+        # skip the remains of the OK line, up to the ID string
+        r = []
+        for _ in range(3):
+            r = self.__read(end_marker=b"\r", timeout=1)
+            if r:
+                break
+        if not r:
+            logger.info("No ID string from the adapter at baud %d" % baud)
+            self.__port.baudrate = current
+            self.__read(timeout=1)
+            return False
+
+        # confirm the new rate, the adapter then shows its prompt
+        self.__port.write(b"\r")
+        if not self.__port.read_until(self.ELM_PROMPT, 1024).endswith(self.ELM_PROMPT):
+            logger.info("Adapter didn't confirm baud %d" % baud)
+            self.__port.baudrate = current
+            return False
+
+        logger.info("Switched to baud %d" % baud)
+        print("Switched to baud %d" % baud)
+        return True
+
     def __isok(self, lines, expectEcho=False):
         if not lines:
             return False
@@ -458,9 +604,21 @@ class ELM327:
     def baudrate(self):
         return self.__port.baudrate
 
+    def boot_baudrate(self):
+        """ the baudrate the adapter falls back to after ATZ """
+        return self.__boot_baudrate
+
     def ecus(self):
         return self.__protocol.ecu_map.values()
 
+    def ecu_map(self):
+        """ returns the protocol's {tx_id: ECU} map (see protocols/protocol.py) """
+        return self.__protocol.ecu_map
+
+    def ecu_signature(self):
+        """ returns a string identifying the ECUs that answered 0100 """
+        return self.__signature
+
     def protocol_name(self):
         return self.__protocol.ELM_NAME
 
@@ -488,7 +646,7 @@ class ELM327:
             print("cannot enter low power when unconnected")
             return None
 
-        lines = self.__send(b"ATLP", delay=1, end_marker=self.ELM_LP_ACTIVE)
+        lines = self.__send(b"ATLP", timeout=1, end_marker=self.ELM_LP_ACTIVE)
 
         if 'OK' in lines:
             logger.debug("Successfully entered low power mode")
@@ -528,6 +686,14 @@ class ELM327:
 
         return lines
 
+    def save_capture(self, path):
+        """
+            Writes the traffic recorded in memory (capture=True) to path,
+            and keeps recording to it. Does nothing for other ports.
+        """
+        if isinstance(self.__port, CapturePort):
+            self.__port.save(path)
+
     def close(self):
         """
             Resets the device, and sets all
@@ -572,36 +738,30 @@ class ELM327:
         if self.__low_power == True:
             self.normal_power()
 
-        lines = self.__send(cmd)
+        # the protocol parses the raw lines, skipping the str conversion
+        lines = self.__send(cmd, decode=False)
         messages = self.__protocol(lines)
         return messages
 
-    def __send(self, cmd, delay=None, end_marker=ELM_PROMPT):
+    def __send(self, cmd, timeout=None, end_marker=ELM_PROMPT, decode=True):
         """
             unprotected send() function
 
             will __write() the given string, no questions asked.
             returns result of __read() (a list of line strings)
-            after an optional delay, until the end marker (by
-            default, the prompt) is seen
+            as soon as the end marker (by default, the prompt) is
+            seen. An optional timeout (in seconds) bounds the wait,
+            otherwise the port's read timeout applies.
+
+            with decode=False, the lines are returned as the
+            memoryview slices produced by __read()
         """
         self.__write(cmd)
 
-        delayed = 0.0
-        if delay is not None:
-            logger.debug("wait: %d seconds" % delay)
-            print("wait: %d seconds" % delay)
-            time.sleep(delay)
-            delayed += delay
-
-        r = self.__read(end_marker=end_marker)
-        while delayed < 1.0 and len(r) <= 0:
-            d = 0.1
-            logger.debug("no response; wait: %f seconds" % d)
-            print("no response; wait: %f seconds" % d)
-            time.sleep(d)
-            delayed += d
-            r = self.__read(end_marker=end_marker)
+        r = self.__read(end_marker=end_marker, timeout=timeout)
+
+        if decode:
+            r = decode_lines(r)
         return r
 
     def __write(self, cmd):
@@ -627,13 +787,18 @@ class ELM327:
         else:
             logger.info("cannot perform __write() when unconnected")
             print("cannot perform __write() when unconnected")
-    def __read(self, end_marker=ELM_PROMPT):
+    def __read(self, end_marker=ELM_PROMPT, timeout=None):
         """
             "low-level" read function
 
             accumulates characters until the end marker (by
             default, the prompt character) is seen
-            returns a list of [/r/n] delimited strings
+            returns a list of [/r/n] delimited memoryview lines
+            (see split_lines())
+
+            when a timeout is given, gives up after that many
+            seconds and returns whatever was received, without
+            treating the silence as a disconnect
         """
         if not self.__port:
             logger.info("cannot perform __read() when unconnected")
@@ -641,6 +806,13 @@ class ELM327:
             return []
 
         buffer = bytearray()
+        scanned = 0  # everything before this index was searched for the end marker
+
+        port_timeout = self.__port.timeout
+        deadline = None
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+            self.__port.timeout = timeout
 
         while True:
             # retrieve as much data as possible
@@ -654,6 +826,13 @@ class ELM327:
                 print("Device disconnected while reading")
                 return []
 
+            if deadline is not None and (not data or time.monotonic() >= deadline):
+                if data:
+                    buffer.extend(data)
+                logger.debug("Stopped waiting for %s after %s seconds" % (repr(end_marker), timeout))
+                self.__port.timeout = port_timeout
+                break
+
             # if nothing was received
             if not data:
                 logger.warning("Failed to read port")
@@ -666,23 +845,15 @@ class ELM327:
             buffer.extend(data)
 
             # end on specified end-marker sequence
-            if end_marker in buffer:
+            # only the new data (and the tail of a split marker) needs scanning
+            if buffer.find(end_marker, max(0, scanned - len(end_marker) + 1)) >= 0:
+                if deadline is not None:
+                    self.__port.timeout = port_timeout
                 break
+            scanned = len(buffer)
 
         # log, and remove the "bytearray(   ...   )" part
-        logger.debug("read: " + repr(buffer)[10:-1])
-
-        # clean out any null characters
-        buffer = re.sub(b"\x00", b"", buffer)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("read: " + repr(buffer)[10:-1])
 
-        # remove the prompt character
-        if buffer.endswith(self.ELM_PROMPT):
-            buffer = buffer[:-1]
-
-        # convert bytes into a standard string
-        string = buffer.decode("utf-8", "ignore")
-
-        # splits into lines while removing empty lines and trailing spaces
-        lines = [s.strip() for s in re.split("[\r\n]", string) if bool(s)]
-
-        return lines
+        return split_lines(buffer, self.ELM_PROMPT)
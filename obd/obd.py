@@ -32,13 +32,17 @@
 
 
 import logging
+import threading
+from concurrent.futures import Future, as_completed
 
 from .OBDResponse import OBDResponse
 from .__version__ import __version__
 from .commands import commands
 from .elm327 import ELM327
 from .protocols import ECU_HEADER
-from .utils import scan_serial, OBDStatus
+from .protocols.protocol import Message
+from .session import SessionCache
+from .utils import scan_serial, group_by_header, OBDStatus
 
 logger = logging.getLogger(__name__)
 
@@ -49,26 +53,44 @@ class OBD(object):
         with it's assorted commands/sensors.
     """
 
+    # the ELM327 accepts up to six Mode 01 PIDs in a single CAN request
+    _MAX_PIDS_PER_QUERY = 6
+
     def __init__(self, portstr=None, baudrate=None, protocol=None, fast=True,
-                 timeout=0.1, check_voltage=True, start_low_power=False):
+                 timeout=0.1, check_voltage=True, start_low_power=False,
+                 session_cache=None, max_baudrate=None, capture=None,
+                 raw_values=False):
         self.interface = None
         self.supported_commands = set(commands.base_commands())
         self.fast = fast  # global switch for disabling optimizations
         self.timeout = timeout
+        self.max_baudrate = max_baudrate  # switch the adapter up to this rate after connecting
+        self.capture = capture  # path to record the adapter traffic to (see replay.py and __connect())
+        self.raw_values = raw_values  # decode to plain numbers instead of pint Quantities (see OBDResponse.quantity)
         self.__last_command = b""  # used for running the previous command with a CR
         self.__last_header = ECU_HEADER.ENGINE  # for comparing with the previously used header
+        self.header_switches_saved = 0  # AT SH round trips saved by sending commands grouped by header
         self.__frame_counts = {}  # keeps track of the number of return frames for each command
+        self.__session_cache = SessionCache(session_cache) if session_cache else None
+        self.__session = None  # the cached session validated by __connect()
 
         logger.info("======================= python-OBD (v%s) =======================" % __version__)
         self.__connect(portstr, baudrate, protocol,
                        check_voltage, start_low_power)  # initialize by connecting and loading sensors
-        self.__load_commands()  # try to load the car's supported commands
+        if not self.__restore_session():
+            self.__load_commands()  # try to load the car's supported commands
+        self.__save_session()
         logger.info("===================================================================")
 
     def __connect(self, portstr, baudrate, protocol, check_voltage,
                   start_low_power):
         """
             Attempts to instantiate an ELM327 connection object.
+
+            With a capture path, every attempt records into memory, and
+            only the interface that is kept writes the file: the port
+            that won a scan, or the rediscovery after a stale cached
+            session. A scan in which no port connects records nothing.
         """
 
         if portstr is None:
@@ -80,28 +102,160 @@ class OBD(object):
                 logger.warning("No OBD-II adapters found")
                 return
 
-            for port in port_names:
-                logger.info("Attempting to use port: " + str(port))
-                print("Attempting to use port: " + str(port))
-                self.interface = ELM327(port, baudrate, protocol,
-                                        self.timeout, check_voltage,
-                                        start_low_power)
-                print(self.interface.status())
-                if self.interface.status() == OBDStatus.CAR_CONNECTED:
-                    break # success! stop searching for serial
-                else:
-                    continue # try other ports
+            self.interface, self.__session = self.__open_first(port_names, baudrate, protocol,
+                                                               check_voltage, start_low_power)
         else:
             logger.info("Explicit port defined")
-            self.interface = ELM327(portstr, baudrate, protocol,
-                                    self.timeout, check_voltage,
-                                    start_low_power)
+            self.interface, self.__session = self.__open(portstr, baudrate, protocol,
+                                                         check_voltage, start_low_power)
+
+        if self.capture is not None and self.interface is not None:
+            self.interface.save_capture(self.capture)
 
         # if the connection failed, close it
-        if self.interface.status() != OBDStatus.CAR_CONNECTED:
+        if self.status() != OBDStatus.CAR_CONNECTED:
             # the ELM327 class will report its own errors
             self.close()
 
+    def __open_first(self, port_names, baudrate, protocol, check_voltage,
+                     start_low_power):
+        """
+            Probes all candidate ports concurrently, and returns the
+            (interface, session) of the first one connected to a car.
+
+            A probe that raises (a busy or odd port, say) is logged and
+            skipped. The ELM327s on the losing ports are closed as soon
+            as their probe ends. Probes run on daemon threads, so a slow
+            losing probe doesn't hold up the interpreter's exit.
+        """
+
+        if len(port_names) == 1:
+            return self.__open(port_names[0], baudrate, protocol,
+                               check_voltage, start_low_power)
+
+        futures = {}  # key = Future, value = port name
+        for port in port_names:
+            logger.info("Attempting to use port: " + str(port))
+            future = Future()
+            futures[future] = port
+            threading.Thread(target=self.__probe, daemon=True,
+                             args=(future, port, baudrate, protocol,
+                                   check_voltage, start_low_power)).start()
+
+        winner = None
+        try:
+            for future in as_completed(futures):
+                if future.exception() is not None:
+                    logger.warning("Probing port %s failed: %s" % (futures[future], future.exception()))
+                    continue
+                interface, session = future.result()
+                if interface.status() == OBDStatus.CAR_CONNECTED:
+                    winner = future
+                    break  # success! stop searching for serial
+        finally:
+            for future in futures:
+                if future is not winner:
+                    # runs immediately for probes that have already finished
+                    future.add_done_callback(self.__close_probe)
+
+        if winner is None:
+            logger.warning("No port connected to a car")
+            return None, None
+
+        logger.info("Using port: " + str(winner.result()[0].port_name()))
+        return winner.result()
+
+    def __probe(self, future, *args):
+        """ runs __open() for __open_first(), reporting through the future """
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(self.__open(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    @staticmethod
+    def __close_probe(future):
+        """ closes the ELM327 opened by a losing __open_first() probe """
+        if future.exception() is None:
+            future.result()[0].close()
+
+    def __open(self, port, baudrate, protocol, check_voltage, start_low_power):
+        """
+            Instantiates an ELM327 on the given port. If a cached session
+            exists for the port, its baudrate and protocol are tried first,
+            skipping auto-detection. The session is only kept if the car
+            answers 0100 with the same ECU signature.
+
+            Returns a tuple of (interface, validated session or None)
+        """
+
+        record = True if self.capture is not None else None  # in memory, see __connect()
+        session = None
+        if self.__session_cache is not None and baudrate is None and protocol is None:
+            session = self.__session_cache.load(port)
+
+        if session is not None:
+            logger.info("Trying cached session for port: " + str(port))
+            interface = ELM327(port, session.get("baudrate"), session.get("protocol"),
+                               self.timeout, check_voltage, start_low_power,
+                               self.max_baudrate, record)
+
+            if interface.status() == OBDStatus.CAR_CONNECTED and \
+                    interface.ecu_signature() == session.get("signature"):
+                return interface, session
+
+            logger.info("Cached session for port %s is stale, rediscovering" % port)
+            interface.close()
+
+        return ELM327(port, baudrate, protocol, self.timeout,
+                      check_voltage, start_low_power, self.max_baudrate,
+                      record), None
+
+    def __restore_session(self):
+        """
+            Loads the supported commands, frame counts and ECU map from
+            the session validated by __connect(). Returns True on success.
+        """
+
+        if self.__session is None or self.status() != OBDStatus.CAR_CONNECTED:
+            return False
+
+        try:
+            ecu_map = dict((int(tx_id), ecu) for tx_id, ecu in self.__session["ecu_map"].items())
+            supported = [commands[name] for name in self.__session["supported_commands"]
+                         if commands.has_name(name)]
+            frame_counts = dict((commands[name], n) for name, n in self.__session["frame_counts"].items()
+                                if commands.has_name(name))
+        except (KeyError, TypeError, ValueError, AttributeError):
+            logger.warning("Ignoring malformed cached session")
+            return False
+
+        self.interface.ecu_map().update(ecu_map)
+        self.supported_commands.update(supported)
+        self.__frame_counts.update(frame_counts)
+        logger.info("restored cached session with %d commands supported" % len(self.supported_commands))
+        return True
+
+    def __save_session(self):
+        """ stores what was learned about this adapter and car in the session cache """
+
+        if self.__session_cache is None or self.status() != OBDStatus.CAR_CONNECTED:
+            return
+
+        self.__session_cache.save(self.port_name(), {
+            "baudrate": self.interface.boot_baudrate(),
+            "protocol": self.protocol_id(),
+            "signature": self.interface.ecu_signature(),
+            # JSON keys are strings, so the tx_ids are converted back in __restore_session()
+            "ecu_map": dict((str(tx_id), ecu) for tx_id, ecu in self.interface.ecu_map().items()
+                            if tx_id is not None),
+            "supported_commands": sorted([c.name for c in self.supported_commands
+                                          if commands.has_name(c.name)]),
+            "frame_counts": dict((c.name, n) for c, n in self.__frame_counts.items()
+                                 if commands.has_name(c.name)),
+        })
+
     def __load_commands(self):
         """
             Queries for available PIDs, sets their support status,
@@ -128,19 +282,17 @@ class OBD(object):
                 logger.info("No valid data for PID listing command: %s" % get)
                 continue
 
-            # loop through PIDs bit-array
-            for i, bit in enumerate(response.value):
-                if bit:
+            # loop through the set bits of the PIDs bit-array
+            mode = get.mode
+            for i in response.value.iter_set_bits():
+                pid = get.pid + i + 1
 
-                    mode = get.mode
-                    pid = get.pid + i + 1
+                if commands.has_pid(mode, pid):
+                    self.supported_commands.add(commands[mode][pid])
 
-                    if commands.has_pid(mode, pid):
-                        self.supported_commands.add(commands[mode][pid])
-
-                    # set support for mode 2 commands
-                    if mode == 1 and commands.has_pid(2, pid):
-                        self.supported_commands.add(commands[2][pid])
+                # set support for mode 2 commands
+                if mode == 1 and commands.has_pid(2, pid):
+                    self.supported_commands.add(commands[2][pid])
 
         logger.info("finished querying with %d commands supported" % len(self.supported_commands))
 
@@ -156,11 +308,24 @@ class OBD(object):
             return OBDResponse()
         self.__last_header = header
 
+    def _group_by_header(self, cmds):
+        """
+            Orders commands so that the ones sharing a header are sent
+            together, starting with the header that is already set.
+            Used by query_many() and the Async loop.
+        """
+        ordered, saved = group_by_header(cmds, self.__last_header)
+        if saved:
+            logger.debug("Grouping by header saved %d AT SH switches" % saved)
+            self.header_switches_saved += saved
+        return ordered
+
     def close(self):
         """
             Closes the connection, and clears supported_commands
         """
 
+        self.__save_session()  # keep the frame counts learned since connecting
         self.supported_commands = set()
 
         if self.interface is not None:
@@ -279,7 +444,7 @@ class OBD(object):
 
         self.__set_header(cmd.header)
 
-        logger.info("Sending command: %s" % str(cmd))
+        logger.info("Sending command: %s", cmd)
         cmd_string = self.__build_command_string(cmd)
         messages = self.interface.send_and_parse(cmd_string)
 
@@ -298,7 +463,139 @@ class OBD(object):
             logger.info("No valid OBD Messages returned")
             return OBDResponse()
 
-        return cmd(messages)  # compute a response object
+        return cmd(messages, raw=self.raw_values)  # compute a response object
+
+    def query_many(self, cmds, force=False):
+        """
+            Batched version of query(). Mode 01 commands are packed
+            up to six PIDs per request (ie, "010C0D05") and the single
+            response is split back into one OBDResponse per command.
+
+            Non-batchable commands, and every command on the legacy
+            (non-CAN) protocols, fall back to individual queries.
+
+            Commands are sent grouped by header, to save AT SH round
+            trips (see header_switches_saved).
+
+            Returns a dict of {OBDCommand: OBDResponse}
+        """
+
+        responses = {}
+
+        if self.status() == OBDStatus.NOT_CONNECTED:
+            logger.warning("Query failed, no connection available")
+            for cmd in cmds:
+                responses[cmd] = OBDResponse()
+            return responses
+
+        pending = []
+        for cmd in cmds:
+            if cmd in responses or cmd in pending:
+                continue
+            if not force and not self.test_cmd(cmd):
+                responses[cmd] = OBDResponse()
+            else:
+                pending.append(cmd)
+
+        # all commands in a request must share the same header, and
+        # sending each header's commands together saves AT SH round trips
+        by_header = {}
+        for cmd in self._group_by_header(pending):
+            by_header.setdefault(cmd.header, []).append(cmd)
+
+        for header, group in by_header.items():
+            batchable = []
+            for cmd in group:
+                if self.__is_batchable(cmd):
+                    batchable.append(cmd)
+                else:
+                    # when querying, only use the blocking OBD.query()
+                    # prevents problems when query is redefined in a subclass (like Async)
+                    responses[cmd] = OBD.query(self, cmd, force=True)
+
+            for i in range(0, len(batchable), self._MAX_PIDS_PER_QUERY):
+                chunk = batchable[i:i + self._MAX_PIDS_PER_QUERY]
+                responses.update(self.__query_batch(header, chunk))
+
+        return responses
+
+    def __is_batchable(self, cmd):
+        """ whether a command can be packed into a multi-PID request """
+        return (cmd.mode == 1 and
+                cmd.pid is not None and
+                cmd.bytes > 2 and
+                self.interface.protocol_id() in ["6", "7", "8", "9"])
+
+    def __query_batch(self, header, chunk):
+        """ sends a single multi-PID request, and splits the response """
+
+        if len(chunk) == 1:
+            return {chunk[0]: OBD.query(self, chunk[0], force=True)}
+
+        self.__set_header(header)
+
+        cmd_string = b"01" + b"".join([c.command[2:] for c in chunk])
+        logger.info("Sending batched command: %s" % cmd_string)
+
+        # if we sent this last time, just send a CR
+        if self.fast and (cmd_string == self.__last_command):
+            messages = self.interface.send_and_parse(b"")
+        else:
+            messages = self.interface.send_and_parse(cmd_string)
+            self.__last_command = cmd_string
+
+        by_pid = dict((c.pid, c) for c in chunk)
+        split = dict((c, []) for c in chunk)
+
+        for message in (messages or []):
+            for cmd, sub in self.__split_message(message, by_pid):
+                split[cmd].append(sub)
+
+        responses = {}
+        for cmd in chunk:
+            if split[cmd]:
+                responses[cmd] = cmd(split[cmd], raw=self.raw_values)
+            else:
+                # the ECU didn't answer this PID in the batch, ask it directly
+                logger.info("Batched response missing %s, querying alone" % str(cmd))
+                responses[cmd] = OBD.query(self, cmd, force=True)
+
+        return responses
+
+    def __split_message(self, message, by_pid):
+        """
+            splits the data of a multi-PID Mode 01 response
+
+            41 0C 1A F8 0D 32 05 5A
+               [ RPM ] [SP] [TEMP]
+
+            into per-command Messages, each carrying its own
+            mode and PID bytes (41 0C 1A F8), for the decoders
+        """
+
+        data = message.data
+        if len(data) < 2 or data[0] != 0x41:
+            return []
+
+        subs = []
+        i = 1
+        while i < len(data):
+            cmd = by_pid.get(data[i])
+            if cmd is None:
+                # without a known length, the rest can't be aligned
+                logger.debug("Unexpected PID 0x%02X in batched response" % data[i])
+                break
+
+            n = cmd.bytes - 2  # the command length includes the mode and PID bytes
+            sub = Message(message.frames)
+            sub.ecu = message.ecu
+            sub.num_frames = message.num_frames
+            sub.can = message.can
+            sub.data = bytearray([0x41, data[i]]) + data[i + 1:i + 1 + n]
+            subs.append((cmd, sub))
+            i += 1 + n
+
+        return subs
 
     def __build_command_string(self, cmd):
         """ assembles the appropriate command string """
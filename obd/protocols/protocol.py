@@ -31,12 +31,15 @@
 ########################################################################
 
 import logging
+import string
 from binascii import hexlify
 
-from obd.utils import isHex, BitArray
+from obd.utils import BitArray
 
 logger = logging.getLogger(__name__)
 
+_HEX_DIGITS = string.hexdigits.encode()
+
 """
 
 Basic data models for all protocols to use
@@ -47,6 +50,7 @@ Basic data models for all protocols to use
 class ECU_HEADER:
     """ Values for the ECU headers """
     ENGINE = b'7E0'
+    TRANSMISSION = b'7E1'
 
 
 class ECU:
@@ -64,8 +68,12 @@ class ECU:
 class Frame(object):
     """ represents a single parsed line of OBD output """
 
+    # one is created for every line from the car, so skip the per-instance dict
+    __slots__ = ("buffer", "data", "priority", "addr_mode", "rx_id", "tx_id",
+                 "type", "seq_index", "data_len")
+
     def __init__(self, raw):
-        self.raw = raw
+        self.buffer = raw  # the line from the adapter, as bytes (or str)
         self.data = bytearray()
         self.priority = None
         self.addr_mode = None
@@ -75,10 +83,23 @@ class Frame(object):
         self.seq_index = 0  # only used when type = CF
         self.data_len = None
 
+    @property
+    def raw(self):
+        """ the original line as a string, decoded on demand """
+        if isinstance(self.buffer, str):
+            return self.buffer
+        return bytes(self.buffer).decode("utf-8", "ignore")
+
+    @raw.setter
+    def raw(self, raw):
+        self.buffer = raw
+
 
 class Message(object):
     """ represents a fully parsed OBD message of one or more Frames (lines) """
 
+    __slots__ = ("frames", "ecu", "num_frames", "data", "can")
+
     def __init__(self, frames):
         self.frames = frames
         self.ecu = ECU.UNKNOWN
@@ -172,51 +193,48 @@ class Protocol(object):
         """
             Main function
 
-            accepts a list of raw strings from the car, split by lines
+            accepts a list of raw lines from the car, either as strings,
+            or as bytes-like objects (see ELM327.__read())
         """
 
         # ---------------------------- preprocess ----------------------------
 
         # Non-hex (non-OBD) lines shouldn't go through the big parsers,
         # since they are typically messages such as: "NO DATA", "CAN ERROR",
-        # "UNABLE TO CONNECT", etc, so sort them into these two lists:
-        obd_lines = []
+        # "UNABLE TO CONNECT", etc, so they are set aside. OBD lines are
+        # parsed into Frames (and grouped by transmitting ECU) in the same pass.
         non_obd_lines = []
 
-        for line in lines:
+        # frames_by_ECU[tx_id] = [Frame, Frame]
+        frames_by_ECU = {}
+        parse_frame = self.parse_frame
 
-            line_no_spaces = line.replace(' ', '')
+        for line in lines:
 
-            if isHex(line_no_spaces):
-                obd_lines.append(line_no_spaces)
-            else:
-                non_obd_lines.append(line)  # pass the original, un-scrubbed line
+            if isinstance(line, str):
+                line = line.encode()
 
-        # ---------------------- handle valid OBD lines ----------------------
+            line_no_spaces = bytes(line).translate(None, b" ")
 
-        # parse each frame (each line)
-        frames = []
-        for line in obd_lines:
+            # deleting every hex digit leaves nothing behind for OBD lines
+            if line_no_spaces.translate(None, _HEX_DIGITS):
+                non_obd_lines.append(line)  # pass the original, un-scrubbed line
+                continue
 
-            frame = Frame(line)
+            frame = Frame(line_no_spaces)
 
             # subclass function to parse the lines into Frames
             # drop frames that couldn't be parsed
-            if self.parse_frame(frame):
-                frames.append(frame)
-
-        # group frames by transmitting ECU
-        # frames_by_ECU[tx_id] = [Frame, Frame]
-        frames_by_ECU = {}
-        for frame in frames:
-            if frame.tx_id not in frames_by_ECU:
-                frames_by_ECU[frame.tx_id] = [frame]
-            else:
-                frames_by_ECU[frame.tx_id].append(frame)
+            if parse_frame(frame):
+                ecu_frames = frames_by_ECU.get(frame.tx_id)
+                if ecu_frames is None:
+                    frames_by_ECU[frame.tx_id] = [frame]
+                else:
+                    ecu_frames.append(frame)
 
         # parse frames into whole messages
         messages = []
-        for ecu in sorted(frames_by_ECU.keys()):
+        for ecu in sorted(frames_by_ECU):
 
             # new message object with a copy of the raw data
             # and frames addressed for this ecu
@@ -31,6 +31,7 @@
 ########################################################################
 
 import logging
+import struct
 from binascii import unhexlify
 
 from obd.utils import contiguous
@@ -39,6 +40,25 @@ from .protocol import Protocol
 logger = logging.getLogger(__name__)
 
 
+def _read_11bit_ids(low):
+    """ returns (addr_mode, rx_id, tx_id) for the low byte of an 11-bit header """
+    addr_mode = low & 0xF0  # 0xD0 = functional, 0xE0 = physical
+    if addr_mode == 0xD0:
+        # untested("11-bit functional request from tester")
+        # rx_id is usually (always?) 0x0F for broadcast,
+        # tx_id is made-up to mimic all other protocols
+        return addr_mode, low & 0x0F, 0xF1
+    elif low & 0x08:
+        return addr_mode, 0xF1, low & 0x07  # rx_id is made-up to mimic all other protocols
+    else:
+        # untested("11-bit message header from tester (functional or physical)")
+        return addr_mode, low & 0x07, 0xF1  # tx_id is made-up to mimic all other protocols
+
+
+# (addr_mode, rx_id, tx_id) for every low byte of an 11-bit header
+_11BIT_IDS = tuple(_read_11bit_ids(low) for low in range(256))
+
+
 class CANProtocol(Protocol):
     TX_ID_ENGINE = 0
     TX_ID_TRANSMISSION = 1
@@ -52,132 +72,124 @@ class CANProtocol(Protocol):
         # this needs to be set FIRST, since the base
         # Protocol __init__ uses the parsing system.
         self.id_bits = id_bits
-        Protocol.__init__(self, lines_0100)
 
-    def parse_frame(self, frame):
+        # pick the header layout once, instead of re-checking id_bits on every frame
+        if id_bits == 11:
+            # 7E8 is padded with one digit to make whole bytes: 07 E8
+            self.__pad = b"0"
+            self.__header = struct.Struct(">BB")
+            self.__header_digits = 3
+            self.__read_header = self.__read_11bit_header
+        else:
+            self.__pad = b""
+            self.__header = struct.Struct(">BBBB")
+            self.__header_digits = 8
+            self.__read_header = self.__read_29bit_header
+
+        # PCI frame type (the upper 4 bits of the first data byte) --> parse function
+        self.__pci_parsers = [None] * 16
+        self.__pci_parsers[self.FRAME_TYPE_SF >> 4] = self.__parse_sf
+        self.__pci_parsers[self.FRAME_TYPE_FF >> 4] = self.__parse_ff
+        self.__pci_parsers[self.FRAME_TYPE_CF >> 4] = self.__parse_cf
+        self.__pci_parsers[self.FRAME_TYPE_FC >> 4] = self.__parse_cf
 
-        raw = frame.raw
+        Protocol.__init__(self, lines_0100)
 
-        # pad 11-bit CAN headers out to 32 bits for consistency,
-        # since ELM already does this for 29-bit CAN headers
+    def parse_frame(self, frame):
 
-        #        7 E8 06 41 00 BE 7F B8 13
-        # to:
-        # 00 00 07 E8 06 41 00 BE 7F B8 13
+        raw = frame.buffer
 
-        if self.id_bits == 11:
-            raw = "00000" + raw
+        # the frame data has to be whole bytes: a PCI byte and at least
+        # one following byte (for FF frames with 12-bit length codes, or
+        # 1 byte of data), and no more than the 8 bytes of a CAN frame
+        data_digits = len(raw) - self.__header_digits
 
         # Handle odd size frames and drop
-        if len(raw) & 1:
+        if data_digits & 1:
             logger.debug("Dropping frame for being odd")
             return False
 
-        raw_bytes = bytearray(unhexlify(raw))
-
-        # check for valid size
-
-        if len(raw_bytes) < 6:
-            # make sure that we have at least a PCI byte, and one following byte
-            # for FF frames with 12-bit length codes, or 1 byte of data
-            #
-            # 00 00 07 E8 10 20 ...
-
+        if data_digits < 4:
             logger.debug("Dropped frame for being too short")
             return False
 
-        if len(raw_bytes) > 12:
+        if data_digits > 16:
             logger.debug("Dropped frame for being too long")
             return False
 
-        # read header information
-        if self.id_bits == 11:
-            # Ex.
-            #       [   ]
-            # 00 00 07 E8 06 41 00 BE 7F B8 13
-
-            frame.priority = raw_bytes[2] & 0x0F  # always 7
-            frame.addr_mode = raw_bytes[3] & 0xF0  # 0xD0 = functional, 0xE0 = physical
-
-            if frame.addr_mode == 0xD0:
-                # untested("11-bit functional request from tester")
-                frame.rx_id = raw_bytes[3] & 0x0F  # usually (always?) 0x0F for broadcast
-                frame.tx_id = 0xF1  # made-up to mimic all other protocols
-            elif raw_bytes[3] & 0x08:
-                frame.rx_id = 0xF1  # made-up to mimic all other protocols
-                frame.tx_id = raw_bytes[3] & 0x07
-            else:
-                # untested("11-bit message header from tester (functional or physical)")
-                frame.tx_id = 0xF1  # made-up to mimic all other protocols
-                frame.rx_id = raw_bytes[3] & 0x07
-
-        else:  # self.id_bits == 29:
-            frame.priority = raw_bytes[0]  # usually (always?) 0x18
-            frame.addr_mode = raw_bytes[1]  # DB = functional, DA = physical
-            frame.rx_id = raw_bytes[2]  # 0x33 = broadcast (functional)
-            frame.tx_id = raw_bytes[3]  # 0xF1 = tester ID
-
-        # extract the frame data
-        #             [      Frame       ]
-        # 00 00 07 E8 06 41 00 BE 7F B8 13
-        frame.data = raw_bytes[4:]
+        # Ex. (11-bit)               Ex. (29-bit)
+        #  [  ] [      Frame       ]  [         ] [      Frame       ]
+        # 07 E8 06 41 00 BE 7F B8 13  18 DA F1 10 06 41 00 BE 7F B8 13
+        raw_bytes = bytearray(unhexlify(self.__pad + raw))
+        self.__read_header(frame, self.__header.unpack_from(raw_bytes))
+
+        # extract the frame data, dropping the header in place
+        del raw_bytes[:self.__header.size]
+        frame.data = raw_bytes
 
         # read PCI byte (always first byte in the data section)
         #             v
         # 00 00 07 E8 06 41 00 BE 7F B8 13
-        frame.type = frame.data[0] & 0xF0
-        if frame.type not in [self.FRAME_TYPE_SF,
-                              self.FRAME_TYPE_FF,
-                              self.FRAME_TYPE_CF,
-                              self.FRAME_TYPE_FC]:
+        frame.type = raw_bytes[0] & 0xF0
+        parse = self.__pci_parsers[raw_bytes[0] >> 4]
+        if parse is None:
             logger.debug("Dropping frame carrying unknown PCI frame type")
             print("Dropping frame carrying unknown PCI frame type")
             return False
 
-        if frame.type == self.FRAME_TYPE_SF:
-            # single frames have 4 bit length codes
-            #              v
-            # 00 00 07 E8 06 41 00 BE 7F B8 13
-            frame.data_len = frame.data[0] & 0x0F
-
-            # drop frames with no data
-            if frame.data_len == 0:
-                return False
-
-        elif frame.type == self.FRAME_TYPE_FF:
-            # First frames have 12 bit length codes
-            #              v vv
-            # 00 00 07 E8 10 20 49 04 00 01 02 03
-            frame.data_len = (frame.data[0] & 0x0F) << 8
-            frame.data_len += frame.data[1]
-
-            # drop frames with no data
-            if frame.data_len == 0:
-                return False
-
-        elif frame.type == self.FRAME_TYPE_CF:
-            # Consecutive frames have 4 bit sequence indices
-            #              v
-            # 00 00 07 E8 21 04 05 06 07 08 09 0A
-            frame.seq_index = frame.data[0] & 0x0F
-        elif frame.type == self.FRAME_TYPE_FC:
-            # Consecutive frames have 4 bit sequence indices
-            #              v
-            # 00 00 07 E8 21 04 05 06 07 08 09 0A
-            frame.seq_index = frame.data[0] & 0x0F
-
+        return parse(frame)
+
+    @staticmethod
+    def __read_11bit_header(frame, header):
+        # Ex.
+        # [   ]
+        # 07 E8 06 41 00 BE 7F B8 13
+        frame.priority = header[0] & 0x0F  # always 7
+        frame.addr_mode, frame.rx_id, frame.tx_id = _11BIT_IDS[header[1]]
+
+    @staticmethod
+    def __read_29bit_header(frame, header):
+        frame.priority = header[0]  # usually (always?) 0x18
+        frame.addr_mode = header[1]  # DB = functional, DA = physical
+        frame.rx_id = header[2]  # 0x33 = broadcast (functional)
+        frame.tx_id = header[3]  # 0xF1 = tester ID
+
+    @staticmethod
+    def __parse_sf(frame):
+        # single frames have 4 bit length codes
+        #              v
+        # 00 00 07 E8 06 41 00 BE 7F B8 13
+        frame.data_len = frame.data[0] & 0x0F
+
+        # drop frames with no data
+        return frame.data_len != 0
+
+    @staticmethod
+    def __parse_ff(frame):
+        # First frames have 12 bit length codes
+        #              v vv
+        # 00 00 07 E8 10 20 49 04 00 01 02 03
+        frame.data_len = ((frame.data[0] & 0x0F) << 8) + frame.data[1]
+
+        # drop frames with no data
+        return frame.data_len != 0
+
+    @staticmethod
+    def __parse_cf(frame):
+        # Consecutive (and flow control) frames have 4 bit sequence indices
+        #              v
+        # 00 00 07 E8 21 04 05 06 07 08 09 0A
+        frame.seq_index = frame.data[0] & 0x0F
         return True
 
     def parse_message(self, message):
 
         frames = message.frames
-        print("How many frames? ", len(frames))
         message.num_frames = len(frames)
         message.can = True
         if (len(frames) >= 1) and (frames[0].type == self.FRAME_TYPE_SF):
             if len(frames) == 1:
                 frame = frames[0]
-                print("Frame type: ", frame.type)
                 if frame.type != self.FRAME_TYPE_SF:
                     logger.debug("Recieved lone frame not marked as single frame")
                     print("Recieved lone frame not marked as single frame")
@@ -192,12 +204,10 @@ class CANProtocol(Protocol):
 
 
             elif len(frames) > 1:
-                print("I AM HERE! DTC multiple frames!")
+                logger.debug("Joining %d single frames (DTCs)" % len(frames))
                 for frame in frames:
-                    print("Frame: " , frame.data)
                     message.data += frame.data[2:8]
                 #message.data =message.data.rstrip(b'\x00\x00\x00\x00')
-                print ("Message data: ", message.data)
 
 
         else:
@@ -208,7 +218,6 @@ class CANProtocol(Protocol):
             counter = 0
             for f in frames:
 
-                print("Frame type: ", f.type)
                 if f.type == self.FRAME_TYPE_FF:
                     ff.append(f)
                 elif f.type == self.FRAME_TYPE_CF:
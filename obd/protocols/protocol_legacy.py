@@ -47,23 +47,24 @@ class LegacyProtocol(Protocol):
 
     def parse_frame(self, frame):
 
-        raw = frame.raw
+        raw = frame.buffer
 
         # Handle odd size frames and drop
         if len(raw) & 1:
             logger.debug("Dropping frame for being odd")
             return False
 
-        raw_bytes = bytearray(unhexlify(raw))
-
-        if len(raw_bytes) < 6:
+        # check the size before converting, 6 to 11 bytes
+        if len(raw) < 12:
             logger.debug("Dropped frame for being too short")
             return False
 
-        if len(raw_bytes) > 11:
+        if len(raw) > 22:
             logger.debug("Dropped frame for being too long")
             return False
 
+        raw_bytes = bytearray(unhexlify(raw))
+
         # Ex.
         # [Header] [     Frame     ]
         # 48 6B 10 41 00 BE 7F B8 13 ck
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+
+########################################################################
+#                                                                      #
+# python-OBD: A python OBD-II serial module derived from pyobd         #
+#                                                                      #
+# Copyright 2004 Donour Sizemore (donour@uchicago.edu)                 #
+# Copyright 2009 Secons Ltd. (www.obdtester.com)                       #
+# Copyright 2009 Peter J. Creath                                       #
+# Copyright 2016 Brendan Whitfield (brendan-w.com)                     #
+#                                                                      #
+########################################################################
+#                                                                      #
+# replay.py                                                            #
+#                                                                      #
+# This file is part of python-OBD (a derivative of pyOBD)              #
+#                                                                      #
+# python-OBD is free software: you can redistribute it and/or modify   #
+# it under the terms of the GNU General Public License as published by #
+# the Free Software Foundation, either version 2 of the License, or    #
+# (at your option) any later version.                                  #
+#                                                                      #
+# python-OBD is distributed in the hope that it will be useful,        #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+# GNU General Public License for more details.                         #
+#                                                                      #
+# You should have received a copy of the GNU General Public License    #
+# along with python-OBD.  If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                      #
+########################################################################
+
+import io
+import logging
+import struct
+import time
+from urllib.parse import urlsplit, parse_qs
+
+logger = logging.getLogger(__name__)
+
+"""
+
+Record/replay of the raw adapter traffic
+
+A capture file starts with a magic line, followed by one record per
+write() or read() on the port. Every record is a struct header, plus
+the bytes that were written or read:
+
+    kind    1 byte   b"W" (written) or b"R" (read, possibly empty)
+    delay   float32  seconds since the previous record
+    length  uint32   number of bytes that follow
+
+Empty reads are recorded too, so that timeouts replay the same way.
+
+"""
+
+MAGIC = b"OBDCAP1\n"
+_RECORD = struct.Struct("<cfI")
+WRITE = b"W"
+READ = b"R"
+
+
+class CapturePort(object):
+    """
+        Wraps a pyserial port, and records every write and
+        every read (with its timing) to a capture file.
+
+        Without a path, the records are kept in memory until save()
+        is called, so an attempt that isn't kept never touches the file.
+    """
+
+    def __init__(self, port, path=None):
+        self.__port = port
+        self.__file = io.BytesIO() if path is None else open(path, "wb")
+        self.__file.write(MAGIC)
+        self.__last = time.monotonic()
+
+    def __record(self, kind, data):
+        now = time.monotonic()
+        self.__file.write(_RECORD.pack(kind, now - self.__last, len(data)))
+        self.__file.write(data)
+        self.__last = now
+
+    # settings forwarded to the real port
+
+    @property
+    def baudrate(self):
+        return self.__port.baudrate
+
+    @baudrate.setter
+    def baudrate(self, baudrate):
+        self.__port.baudrate = baudrate
+
+    @property
+    def timeout(self):
+        return self.__port.timeout
+
+    @timeout.setter
+    def timeout(self, timeout):
+        self.__port.timeout = timeout
+
+    @property
+    def write_timeout(self):
+        return self.__port.write_timeout
+
+    @write_timeout.setter
+    def write_timeout(self, timeout):
+        self.__port.write_timeout = timeout
+
+    def __getattr__(self, name):
+        # portstr, in_waiting, flushInput(), flush(), etc...
+        return getattr(self.__port, name)
+
+    # recorded traffic
+
+    def write(self, data):
+        self.__record(WRITE, bytes(data))
+        return self.__port.write(data)
+
+    def read(self, size=1):
+        data = self.__port.read(size)
+        self.__record(READ, data)
+        return data
+
+    def read_until(self, expected=b"\n", size=None):
+        data = self.__port.read_until(expected, size)
+        self.__record(READ, data)
+        return data
+
+    def save(self, path):
+        """
+            Writes the records kept in memory to path, and records
+            straight to that file from then on.
+        """
+        if not isinstance(self.__file, io.BytesIO):
+            return  # already recording to a file
+        f = open(path, "wb")
+        f.write(self.__file.getvalue())
+        self.__file = f
+
+    def close(self):
+        if not self.__file.closed:
+            self.__file.close()
+        self.__port.close()
+
+
+class ReplayPort(object):
+    """
+        Serial port stand-in which serves the reads of a capture
+        file back, in order, to the same sequence of writes.
+
+        speed scales the recorded timing: 1.0 replays in real time,
+        larger values replay faster, and 0 skips all delays.
+    """
+
+    def __init__(self, path, speed=1.0):
+        self.portstr = "replay://" + path
+        self.baudrate = 38400
+        self.timeout = None
+        self.write_timeout = None
+        self.is_open = True
+        self.__speed = speed
+        self.__records = self.__load(path)
+        self.__index = 0
+        self.__pending = b""  # remains of a partially read record
+        self.__last = time.monotonic()
+
+    @staticmethod
+    def __load(path):
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if not data.startswith(MAGIC):
+            raise ValueError("%s is not an OBD capture file" % path)
+
+        records = []
+        offset = len(MAGIC)
+        while offset + _RECORD.size <= len(data):
+            kind, delay, length = _RECORD.unpack_from(data, offset)
+            offset += _RECORD.size
+            records.append((kind, delay, data[offset:offset + length]))
+            offset += length
+        return records
+
+    @classmethod
+    def from_url(cls, url):
+        """ builds a ReplayPort from a URL like replay:///path/to/file.cap?speed=10 """
+        parts = urlsplit(url)
+        speed = float(parse_qs(parts.query).get("speed", ["1.0"])[0])
+        return cls(parts.netloc + parts.path, speed)
+
+    def __next(self, kind):
+        """ consumes the next record if it's of the given kind, honoring its delay """
+        if self.__index >= len(self.__records):
+            return None
+
+        k, delay, data = self.__records[self.__index]
+        if k != kind:
+            return None
+
+        if self.__speed > 0:
+            wait = (delay / self.__speed) - (time.monotonic() - self.__last)
+            if wait > 0:
+                time.sleep(wait)
+        self.__last = time.monotonic()
+        self.__index += 1
+        return data
+
+    @property
+    def in_waiting(self):
+        if self.__pending:
+            return len(self.__pending)
+        if self.__index < len(self.__records):
+            k, delay, data = self.__records[self.__index]
+            if k == READ and (self.__speed <= 0 or
+                              time.monotonic() - self.__last >= delay / self.__speed):
+                return len(data)
+        return 0
+
+    def write(self, data):
+        expected = self.__next(WRITE)
+        if expected is None:
+            logger.warning("Replay has no write left for: %s" % repr(data))
+        elif expected != bytes(data):
+            logger.debug("Replay expected write %s, got %s" % (repr(expected), repr(data)))
+        return len(data)
+
+    def read(self, size=1):
+        if not self.__pending:
+            data = self.__next(READ)
+            if data is None:
+                return b""  # the recording has nothing more to say here
+            self.__pending = data
+
+        data = self.__pending[:size]
+        self.__pending = self.__pending[size:]
+        return data
+
+    def read_until(self, expected=b"\n", size=None):
+        data = self.__pending or self.__next(READ) or b""
+        self.__pending = b""
+        return data
+
+    def done(self):
+        """ whether every record of the capture has been replayed """
+        return self.__index >= len(self.__records) and not self.__pending
+
+    def flushInput(self):
+        self.__pending = b""
+
+    reset_input_buffer = flushInput
+
+    def flushOutput(self):
+        pass
+
+    reset_output_buffer = flushOutput
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.is_open = False
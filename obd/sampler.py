@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+########################################################################
+#                                                                      #
+# python-OBD: A python OBD-II serial module derived from pyobd         #
+#                                                                      #
+# Copyright 2004 Donour Sizemore (donour@uchicago.edu)                 #
+# Copyright 2009 Secons Ltd. (www.obdtester.com)                       #
+# Copyright 2009 Peter J. Creath                                       #
+# Copyright 2016 Brendan Whitfield (brendan-w.com)                     #
+#                                                                      #
+########################################################################
+#                                                                      #
+# sampler.py                                                           #
+#                                                                      #
+# This file is part of python-OBD (a derivative of pyOBD)              #
+#                                                                      #
+# python-OBD is free software: you can redistribute it and/or modify   #
+# it under the terms of the GNU General Public License as published by #
+# the Free Software Foundation, either version 2 of the License, or    #
+# (at your option) any later version.                                  #
+#                                                                      #
+# python-OBD is distributed in the hope that it will be useful,        #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+# GNU General Public License for more details.                         #
+#                                                                      #
+# You should have received a copy of the GNU General Public License    #
+# along with python-OBD.  If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                      #
+########################################################################
+
+
+import logging
+from .obd import OBD
+from .OBDResponse import OBDResponse
+from .timeseries import TimeSeries
+
+logger = logging.getLogger(__name__)
+
+
+class Sampler:
+    """
+        Samples commands in the background on an Async connection, and
+        keeps a history of each one that all its consumers share.
+
+        Consumers (the tabs of a GUI, say) are views: each one subscribes
+        the commands it shows under its own name, and the connection
+        watches the union of the subscriptions. A command's history lives
+        as long as the sampler, so it survives unsubscribing and
+        subscribing again.
+    """
+
+    def __init__(self, connection, history=450):
+        self.__connection = connection  # an obd.Async
+        self.__history_size = history
+        self.__views = {}  # key = view name, value = set of OBDCommand
+        self.__watched = set()
+        self.__history = {}  # key = OBDCommand, value = TimeSeries of (sample number, magnitude)
+        self.__samples = {}  # key = OBDCommand, value = number of samples taken
+
+    @property
+    def connection(self):
+        return self.__connection
+
+    def supported(self, mode):
+        """
+            Returns the supported commands of the given mode, sorted by PID.
+            Uses the PID bitmaps read when the connection was made, so
+            nothing is sent to the car.
+        """
+        return sorted((c for c in self.__connection.supported_commands if c.mode == mode),
+                      key=lambda c: c.command)
+
+    def subscribe(self, view, commands):
+        """
+            Sets the commands the given view needs sampled, replacing the
+            ones it subscribed before. The watch list is only changed (and
+            the sampling thread restarted) when the union changes.
+        """
+        commands = set(commands)
+        if commands:
+            self.__views[view] = commands
+        else:
+            self.__views.pop(view, None)
+
+        watched = set().union(*self.__views.values())
+        if watched != self.__watched:
+            with self.__connection.paused():
+                for c in self.__watched - watched:
+                    self.__connection.unwatch(c)
+                for c in watched - self.__watched:
+                    if c not in self.__history:
+                        self.__history[c] = TimeSeries(self.__history_size)
+                        self.__samples[c] = 0
+                    self.__connection.watch(c, callback=self.__on_response)
+            self.__watched = watched
+            logger.debug("Sampling %d commands for %d views", len(watched), len(self.__views))
+
+        if not self.__connection.running:
+            self.__connection.start()
+
+    def unsubscribe(self, view):
+        self.subscribe(view, ())
+
+    def value(self, c):
+        """ Returns the latest response for a sampled command, without blocking """
+        return self.__connection.query(c)
+
+    def history(self, c):
+        """ Returns the TimeSeries of a command that has been subscribed, else None """
+        return self.__history.get(c)
+
+    def samples(self, c):
+        """ Returns the number of samples taken of a command, the x of the next one """
+        return self.__samples.get(c, 0)
+
+    def query(self, c, force=False):
+        """
+            A one-off blocking query, for commands that aren't sampled,
+            such as reading or clearing DTCs. Sampling pauses meanwhile.
+        """
+        if not self.__connection.is_connected():
+            return OBDResponse()
+        with self.__connection.paused():
+            return OBD.query(self.__connection, c, force)
+
+    def close(self):
+        self.__connection.close()
+
+    def __on_response(self, r):
+        # runs in the Async thread; only numeric values go into the history,
+        # pint Quantities as well as the plain numbers of raw_values connections
+        try:
+            y = float(getattr(r.value, "magnitude", r.value))
+        except (TypeError, ValueError):
+            return
+        c = r.command
+        n = self.__samples[c]
+        self.__history[c].append(n, y)
+        self.__samples[c] = n + 1
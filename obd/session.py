@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+########################################################################
+#                                                                      #
+# python-OBD: A python OBD-II serial module derived from pyobd         #
+#                                                                      #
+# Copyright 2004 Donour Sizemore (donour@uchicago.edu)                 #
+# Copyright 2009 Secons Ltd. (www.obdtester.com)                       #
+# Copyright 2009 Peter J. Creath                                       #
+# Copyright 2016 Brendan Whitfield (brendan-w.com)                     #
+#                                                                      #
+########################################################################
+#                                                                      #
+# session.py                                                           #
+#                                                                      #
+# This file is part of python-OBD (a derivative of pyOBD)              #
+#                                                                      #
+# python-OBD is free software: you can redistribute it and/or modify   #
+# it under the terms of the GNU General Public License as published by #
+# the Free Software Foundation, either version 2 of the License, or    #
+# (at your option) any later version.                                  #
+#                                                                      #
+# python-OBD is distributed in the hope that it will be useful,        #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+# GNU General Public License for more details.                         #
+#                                                                      #
+# You should have received a copy of the GNU General Public License    #
+# along with python-OBD.  If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                      #
+########################################################################
+
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+class SessionCache:
+    """
+        On-disk cache of what was learned about an adapter and the car
+        behind it, so that reconnects can skip discovery.
+
+        Sessions are keyed by port name. Each one records the baudrate,
+        protocol ID, ECU signature (the car's answer to 0100), ecu_map,
+        supported commands and learned frame counts. A session is only
+        trusted once a reconnect sees the same ECU signature again.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self, port):
+        """ returns the session dict stored for this port, or None """
+        return self.__read().get(port)
+
+    def save(self, port, session):
+        """ stores the session dict for this port """
+        sessions = self.__read()
+        sessions[port] = session
+        self.__write(sessions)
+
+    def forget(self, port):
+        """ drops the session stored for this port """
+        sessions = self.__read()
+        if sessions.pop(port, None) is not None:
+            self.__write(sessions)
+
+    def __read(self):
+        try:
+            with open(self.path, "r") as f:
+                sessions = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable session cache %s: %s" % (self.path, e))
+            return {}
+
+        if not isinstance(sessions, dict):
+            logger.warning("Ignoring malformed session cache %s" % self.path)
+            return {}
+        return sessions
+
+    def __write(self, sessions):
+        # write to a temporary file first, so readers never see a partial cache
+        tmp = self.path + ".tmp"
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp, "w") as f:
+                json.dump(sessions, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning("Failed to write session cache %s: %s" % (self.path, e))
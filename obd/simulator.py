@@ -0,0 +1,556 @@
+# -*- coding: utf-8 -*-
+
+########################################################################
+#                                                                      #
+# python-OBD: A python OBD-II serial module derived from pyobd         #
+#                                                                      #
+# Copyright 2004 Donour Sizemore (donour@uchicago.edu)                 #
+# Copyright 2009 Secons Ltd. (www.obdtester.com)                       #
+# Copyright 2009 Peter J. Creath                                       #
+# Copyright 2016 Brendan Whitfield (brendan-w.com)                     #
+#                                                                      #
+########################################################################
+#                                                                      #
+# simulator.py                                                         #
+#                                                                      #
+# This file is part of python-OBD (a derivative of pyOBD)              #
+#                                                                      #
+# python-OBD is free software: you can redistribute it and/or modify   #
+# it under the terms of the GNU General Public License as published by #
+# the Free Software Foundation, either version 2 of the License, or    #
+# (at your option) any later version.                                  #
+#                                                                      #
+# python-OBD is distributed in the hope that it will be useful,        #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+# GNU General Public License for more details.                         #
+#                                                                      #
+# You should have received a copy of the GNU General Public License    #
+# along with python-OBD.  If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                      #
+########################################################################
+
+import logging
+import math
+import os
+import random
+import threading
+import time
+from urllib.parse import urlsplit, parse_qs
+
+from .commands import commands
+from .decoders import pid as pid_decoder
+
+logger = logging.getLogger(__name__)
+
+"""
+
+An ELM327 stand-in, for testing and load testing without a car
+
+ELM327Simulator answers the AT commands used by ELM327.__init__, and the
+Mode 01/02/03/04/06/07/09 commands in commands.py, formatted as CAN
+11-bit, CAN 29-bit or legacy frames. It can be reached in-process, by
+opening the port "sim://?protocol=6&latency=0.05" with obd.OBD, or over
+a pseudo terminal (see serve_pty(), or run "python -m obd.simulator").
+
+"""
+
+_CAN_PROTOCOLS = ["6", "7", "8", "9", "A"]
+_CAN_29BIT_PROTOCOLS = ["7", "9", "A"]
+_PROTOCOLS = ["1", "2", "3", "4", "5"] + _CAN_PROTOCOLS
+
+_ERRORS = ["NO DATA", "CAN ERROR", "BUS BUSY", "STOPPED", "?"]
+
+# example DTCs, and the engine's Mode 06 test results: MID -> [(TID, UAS, value, min, max)]
+_DEFAULT_DTCS = ["P0104", "B0003", "C0123", "U0155"]
+_DEFAULT_MONITORS = {
+    0x01: [(0x01, 0x0A, 0x0380, 0x0300, 0x0400), (0x05, 0x10, 0x0048, 0x0000, 0x0064)],
+    0x21: [(0x80, 0x24, 0x0012, 0x0000, 0x0100)],
+}
+
+
+def _rpm(t):
+    rpm = 1800 + 1000 * math.sin(t / 3.0)
+    v = int(rpm * 4)
+    return bytes([v >> 8, v & 0xFF])
+
+
+def _speed(t):
+    return bytes([int(60 + 40 * math.sin(t / 7.0))])
+
+
+class ELM327Simulator(object):
+    """
+        Emulates the ELM327 command interpreter and a simulated car.
+
+        protocol   the car's protocol ID ("1" through "A")
+        ecus       number of ECUs answering (1 = engine, 2 = engine and transmission)
+        latency    seconds before the car answers an OBD request
+        jitter     random extra latency, in seconds
+        error_rate probability of answering an OBD request with an error
+        drop_rate  probability of dropping one frame of a multi-frame answer
+        seed       seed for the error injection
+    """
+
+    def __init__(self, protocol="6", ecus=1, latency=0.0, jitter=0.0,
+                 error_rate=0.0, drop_rate=0.0, seed=None):
+        if protocol not in _PROTOCOLS:
+            raise ValueError("%s is not a valid protocol" % protocol)
+
+        self.protocol = protocol
+        self.ecus = ecus
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.drop_rate = drop_rate
+        self.random = random.Random(seed)
+
+        # the car: Mode 01 values by PID, as bytes or as functions of time
+        self.values = {}
+        for c in commands[1]:
+            if c is not None and c.decode != pid_decoder and c.bytes > 2:
+                self.values[c.pid] = bytes(c.bytes - 2)
+        self.values.update({
+            0x04: b"\x40",  # 25 % load
+            0x05: b"\x7B",  # 83 C coolant
+            0x0C: _rpm,
+            0x0D: _speed,
+            0x0F: b"\x46",  # 30 C intake
+            0x10: b"\x01\x2C",  # 3 g/s
+            0x11: b"\x33",  # 20 % throttle
+            0x1C: b"\x06",  # EOBD
+            0x51: b"\x01",  # gasoline
+        })
+        self.dtcs = list(_DEFAULT_DTCS)
+        self.pending_dtcs = []
+        self.monitors = dict(_DEFAULT_MONITORS)
+        self.vin = b"1D4GP00R55B123456"
+        self.calibration_id = b"SIMULATOR-CAL-01"
+        self.cvn = b"\x12\x34\x56\x78"
+
+        self.start_time = time.monotonic()
+        self.reset()
+
+    def reset(self):
+        """ the state after ATZ """
+        self.echo = True
+        self.headers = False
+        self.linefeeds = False
+        self.spaces = True
+        self.sleeping = False
+        self.auto = True  # ATSP0
+        self.searched = False  # whether the auto search found the car
+        self.selected = "0"  # the protocol set with ATSP/ATTP
+        self.header = b"7DF"  # functional addressing, all ECUs answer
+        self.last = b""
+
+    # -------------------------------------------------------------------
+
+    def delay(self, cmd):
+        """ returns how long the answer to the given command takes """
+        cmd = cmd.replace(b" ", b"").upper() or self.last
+        if self.sleeping or cmd.startswith(b"AT") or cmd.startswith(b"ST"):
+            return 0.0
+        return self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def respond(self, cmd):
+        """ takes a command (without the CR), and returns the full answer """
+
+        if self.sleeping:
+            # any input wakes the ELM up
+            self.sleeping = False
+            return b">"
+
+        raw = cmd
+        cmd = cmd.replace(b" ", b"").upper()
+
+        # a lone CR repeats the previous command
+        if not cmd:
+            cmd = self.last
+        else:
+            self.last = cmd
+
+        if cmd.startswith(b"AT"):
+            lines = self.__at(cmd[2:])
+        elif cmd.startswith(b"ST"):
+            lines = ["?"]  # not an STN chip
+        else:
+            lines = self.__obd(cmd)
+
+        eol = b"\r\n" if self.linefeeds else b"\r"
+        response = b""
+        if self.echo and raw:
+            response += raw + b"\r"
+        if lines is None:  # ATZ
+            return response + b"\r\rELM327 v1.5\r\r>"
+        response += eol.join([l.encode() for l in lines]) + eol
+        if self.sleeping:
+            return response  # ATLP shows no prompt
+        return response + eol + b">"
+
+    def __at(self, cmd):
+        if cmd == b"Z":
+            self.reset()
+            return None
+        if cmd in (b"E0", b"E1"):
+            self.echo = cmd == b"E1"
+        elif cmd in (b"H0", b"H1"):
+            self.headers = cmd == b"H1"
+        elif cmd in (b"L0", b"L1"):
+            self.linefeeds = cmd == b"L1"
+        elif cmd in (b"S0", b"S1"):
+            self.spaces = cmd == b"S1"
+        elif cmd in (b"I", b"@1"):
+            return ["ELM327 v1.5"]
+        elif cmd == b"RV":
+            return ["12.6V"]
+        elif cmd == b"LP":
+            self.sleeping = True
+        elif cmd == b"DPN":
+            if self.auto:
+                return [("A" + self.protocol) if self.searched else "0"]
+            return [self.selected]
+        elif cmd == b"DP":
+            return ["AUTO" if self.auto else "", self.selected]
+        elif cmd[:2] in (b"SP", b"TP"):
+            p = cmd[2:].decode()
+            p = p[1:] if (len(p) > 1 and p.startswith("A")) else p
+            if p != "0" and p not in _PROTOCOLS:
+                return ["?"]
+            self.auto = p == "0"
+            self.selected = p
+            self.searched = False
+        elif cmd.startswith(b"SH"):
+            self.header = cmd[2:]
+        else:
+            return ["?"]
+        return ["OK"]
+
+    # -------------------------------------------------------------------
+
+    def __obd(self, cmd):
+        try:
+            request = bytes.fromhex(cmd.decode() if len(cmd) % 2 == 0 else cmd[:-1].decode())
+        except ValueError:
+            return ["?"]  # not hex
+
+        if not request:
+            return ["?"]
+
+        lines = []
+        if self.auto and not self.searched:
+            lines.append("SEARCHING...")
+            self.searched = True
+        elif not self.auto and self.selected != self.protocol:
+            return ["UNABLE TO CONNECT"]
+
+        if self.random.random() < self.error_rate:
+            return lines + [self.random.choice(_ERRORS)]
+
+        for ecu in range(self.ecus):
+            if not self.__addressed(ecu):
+                continue
+            payload = self.__answer(ecu, request)
+            if payload is not None:
+                lines += self.__frames(ecu, payload)
+
+        if not [l for l in lines if l != "SEARCHING..."]:
+            lines.append("NO DATA")
+        return lines
+
+    def __addressed(self, ecu):
+        """ whether the ECU answers requests sent with the current header """
+        if self.header in (b"7DF", b"DB33F1", b"686AF1", b"C133F1"):
+            return True  # functional
+        return self.header in (b"7E%d" % ecu, b"DA%02XF1" % (0x10 + 8 * ecu))
+
+    def __answer(self, ecu, request):
+        """ returns the payload of the ECU's answer (CAN style), or None """
+        mode = request[0]
+        t = time.monotonic() - self.start_time
+
+        if mode in (0x01, 0x02):
+            if ecu > 0 and any([p % 0x20 != 0 for p in request[1:]]):
+                return None  # the transmission only lists its (empty) PID support
+            payload = bytearray([0x40 + mode])
+            for p in request[1:7]:
+                data = self.__pid(p, t, ecu)
+                if data is not None:
+                    payload += bytes([p]) + data
+            return bytes(payload) if len(payload) > 1 else None
+
+        if ecu > 0:
+            return None
+
+        if mode in (0x03, 0x07):
+            dtcs = self.dtcs if mode == 0x03 else self.pending_dtcs
+            payload = bytearray([0x40 + mode, len(dtcs)])
+            for code in dtcs:
+                payload += self.__encode_dtc(code)
+            return bytes(payload)
+
+        if mode == 0x04:
+            self.dtcs = []
+            self.pending_dtcs = []
+            return b"\x44"
+
+        if mode == 0x06 and len(request) >= 2:
+            if self.protocol not in _CAN_PROTOCOLS:
+                return None
+            mid = request[1]
+            if mid % 0x20 == 0:
+                return bytes([0x46, mid]) + self.__bitmap(self.monitors.keys(), mid)
+            if mid not in self.monitors:
+                return None
+            payload = bytearray([0x46])
+            for tid, uas, value, low, high in self.monitors[mid]:
+                payload += bytes([mid, tid, uas])
+                for v in (value, low, high):
+                    payload += bytes([v >> 8, v & 0xFF])
+            return bytes(payload)
+
+        if mode == 0x09 and len(request) >= 2:
+            p = request[1]
+            items = {0x02: self.vin, 0x04: self.calibration_id, 0x06: self.cvn}
+            if p == 0x00:
+                return b"\x49\x00" + self.__bitmap([1, 2, 3, 4, 5, 6], 0)
+            if p in (0x01, 0x03, 0x05):
+                size = len(items[p + 1])
+                return bytes([0x49, p, (size + 3) // 4 if self.protocol not in _CAN_PROTOCOLS else 1])
+            if p in items:
+                return bytes([0x49, p, 0x01]) + items[p]
+
+        return None
+
+    def __pid(self, p, t, ecu):
+        """ returns the data bytes of a Mode 01 PID, or None """
+        if p % 0x20 == 0:
+            pids = [] if ecu > 0 else list(self.values.keys())
+            if ecu == 0 and p + 0x20 <= max(self.values.keys()):
+                pids.append(p + 0x20)  # the next PID listing command
+            return self.__bitmap(pids, p)
+
+        value = self.values.get(p) if ecu == 0 else None
+        if callable(value):
+            value = value(t)
+        return value
+
+    def __bitmap(self, pids, base):
+        """ builds a 4 byte PID support bitmap for PIDs base+1 through base+32 """
+        bits = 0
+        for p in pids:
+            if base < p <= base + 32:
+                bits |= 1 << (32 - (p - base))
+        return bits.to_bytes(4, "big")
+
+    def __encode_dtc(self, code):
+        first = "PCBU".index(code[0]) << 6 | int(code[1]) << 4
+        return bytes([first | int(code[2], 16), int(code[3:5], 16)])
+
+    # -------------------------------------------------------------------
+
+    def __hex(self, data):
+        return (" " if self.spaces else "").join(["%02X" % b for b in data])
+
+    def __frames(self, ecu, payload):
+        """ formats the payload as lines of frames for the car's protocol """
+        if self.protocol in _CAN_PROTOCOLS:
+            return self.__can_frames(ecu, payload)
+        return self.__legacy_frames(ecu, payload)
+
+    def __can_frames(self, ecu, payload):
+        sep = " " if self.spaces else ""
+
+        if self.protocol in _CAN_29BIT_PROTOCOLS:
+            header = self.__hex([0x18, 0xDA, 0xF1, 0x10 + 8 * ecu])
+        else:
+            header = "7E%d" % (8 + ecu)
+
+        if len(payload) <= 7:
+            if not self.headers:
+                return [self.__hex(payload)]
+            frame = bytes([len(payload)]) + payload
+            return [header + sep + self.__hex(frame.ljust(8, b"\x00"))]
+
+        # first frame with a 12 bit length, then consecutive frames
+        frames = [bytes([0x10 | (len(payload) >> 8), len(payload) & 0xFF]) + payload[:6]]
+        chunks = [payload[i:i + 7] for i in range(6, len(payload), 7)]
+        for seq, chunk in enumerate(chunks):
+            frames.append(bytes([0x20 | ((seq + 1) & 0x0F)]) + chunk.ljust(7, b"\x00"))
+
+        if len(frames) > 2 and self.random.random() < self.drop_rate:
+            frames.pop(self.random.randrange(1, len(frames)))
+
+        if not self.headers:
+            lines = ["%03X" % len(payload)]
+            return lines + ["%X:%s%s" % (i & 0x0F, sep, self.__hex(f[1:] if i else f[2:]))
+                            for i, f in enumerate(frames)]
+        return [header + sep + self.__hex(f) for f in frames]
+
+    def __legacy_frames(self, ecu, payload):
+        mode = payload[0]
+        if mode in (0x43, 0x47):
+            # no DTC count, three DTCs per frame
+            dtcs = payload[2:]
+            frames = [bytes([mode]) + dtcs[i:i + 6].ljust(6, b"\x00")
+                      for i in range(0, max(len(dtcs), 1), 6)]
+        elif mode == 0x49 and len(payload) > 7:
+            # an order byte on every frame, with 4 data bytes each
+            data = payload[3:]
+            data = data.rjust(((len(data) + 3) // 4) * 4, b"\x00")
+            frames = [bytes([0x49, payload[1], i // 4 + 1]) + data[i:i + 4]
+                      for i in range(0, len(data), 4)]
+        else:
+            frames = [payload]
+
+        if len(frames) > 1 and self.random.random() < self.drop_rate:
+            frames.pop(self.random.randrange(len(frames)))
+
+        if not self.headers:
+            return [self.__hex(f) for f in frames]
+
+        priority = 0x41 if self.protocol == "1" else 0x48
+        lines = []
+        for f in frames:
+            frame = bytes([priority, 0x6B, 0x10 + 8 * ecu]) + f
+            lines.append(self.__hex(frame + bytes([sum(frame) & 0xFF])))
+        return lines
+
+    @classmethod
+    def from_url(cls, url):
+        """ builds a simulator from a URL like sim://?protocol=7&latency=0.05 """
+        query = parse_qs(urlsplit(url).query)
+
+        def get(name, default, kind):
+            return kind(query[name][0]) if name in query else default
+
+        return cls(protocol=get("protocol", "6", str),
+                   ecus=get("ecus", 1, int),
+                   latency=get("latency", 0.0, float),
+                   jitter=get("jitter", 0.0, float),
+                   error_rate=get("error_rate", 0.0, float),
+                   drop_rate=get("drop_rate", 0.0, float),
+                   seed=get("seed", None, int))
+
+
+class SimulatorPort(object):
+    """
+        In-process serial port stand-in, connected to an ELM327Simulator.
+        Answers become readable once the simulated latency has passed.
+    """
+
+    def __init__(self, simulator, portstr="sim://"):
+        self.simulator = simulator
+        self.portstr = portstr
+        self.baudrate = 38400
+        self.timeout = 10
+        self.write_timeout = None
+        self.is_open = True
+        self.__input = b""  # the command being written
+        self.__output = bytearray()  # answers that are ready
+        self.__queued = []  # (due time, answer) for answers that aren't ready yet
+
+    @classmethod
+    def from_url(cls, url):
+        return cls(ELM327Simulator.from_url(url), url)
+
+    def __ready(self, wait=False):
+        """ moves due answers to the output, optionally waiting up to the timeout """
+        now = time.monotonic()
+        if wait and not self.__output and self.__queued:
+            due = self.__queued[0][0]
+            limit = self.timeout if self.timeout is not None else due - now
+            time.sleep(max(0.0, min(due - now, limit)))
+            now = time.monotonic()
+        while self.__queued and self.__queued[0][0] <= now:
+            self.__output += self.__queued.pop(0)[1]
+
+    @property
+    def in_waiting(self):
+        self.__ready()
+        return len(self.__output)
+
+    def write(self, data):
+        self.__input += bytes(data)
+        while b"\r" in self.__input:
+            cmd, self.__input = self.__input.split(b"\r", 1)
+            due = time.monotonic() + self.simulator.delay(cmd)
+            self.__queued.append((due, self.simulator.respond(cmd)))
+        return len(data)
+
+    def read(self, size=1):
+        self.__ready(wait=True)
+        data = bytes(self.__output[:size])
+        del self.__output[:size]
+        return data
+
+    def read_until(self, expected=b"\n", size=None):
+        self.__ready(wait=True)
+        end = self.__output.find(expected)
+        end = len(self.__output) if end < 0 else end + len(expected)
+        if size is not None:
+            end = min(end, size)
+        data = bytes(self.__output[:end])
+        del self.__output[:end]
+        return data
+
+    def flushInput(self):
+        self.__ready()
+        self.__output.clear()
+
+    reset_input_buffer = flushInput
+
+    def flushOutput(self):
+        pass
+
+    reset_output_buffer = flushOutput
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.is_open = False
+
+
+def serve_pty(simulator):
+    """
+        Serves the simulator on a pseudo terminal from a daemon thread.
+        Returns the name of the terminal to open (ie, /dev/pts/3).
+    """
+    import pty
+    import tty
+
+    master, slave = pty.openpty()
+    tty.setraw(slave)
+    name = os.ttyname(slave)
+
+    def serve():
+        buffer = b""
+        while True:
+            try:
+                data = os.read(master, 1024)
+            except OSError:
+                return
+            buffer += data
+            while b"\r" in buffer:
+                cmd, buffer = buffer.split(b"\r", 1)
+                time.sleep(simulator.delay(cmd))
+                os.write(master, simulator.respond(cmd))
+
+    thread = threading.Thread(target=serve)
+    thread.daemon = True
+    thread.start()
+    logger.info("Simulating an ELM327 on %s" % name)
+    return name
+
+
+if __name__ == "__main__":
+    import sys
+
+    sim = ELM327Simulator.from_url(sys.argv[1] if len(sys.argv) > 1 else "sim://")
+    print("Simulating an ELM327 on %s, press Ctrl+C to stop" % serve_pty(sim))
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+########################################################################
+#                                                                      #
+# python-OBD: A python OBD-II serial module derived from pyobd         #
+#                                                                      #
+# Copyright 2004 Donour Sizemore (donour@uchicago.edu)                 #
+# Copyright 2009 Secons Ltd. (www.obdtester.com)                       #
+# Copyright 2009 Peter J. Creath                                       #
+# Copyright 2016 Brendan Whitfield (brendan-w.com)                     #
+#                                                                      #
+########################################################################
+#                                                                      #
+# timeseries.py                                                        #
+#                                                                      #
+# This file is part of python-OBD (a derivative of pyOBD)              #
+#                                                                      #
+# python-OBD is free software: you can redistribute it and/or modify   #
+# it under the terms of the GNU General Public License as published by #
+# the Free Software Foundation, either version 2 of the License, or    #
+# (at your option) any later version.                                  #
+#                                                                      #
+# python-OBD is distributed in the hope that it will be useful,        #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+# GNU General Public License for more details.                         #
+#                                                                      #
+# You should have received a copy of the GNU General Public License    #
+# along with python-OBD.  If not, see <http://www.gnu.org/licenses/>.  #
+#                                                                      #
+########################################################################
+
+import numpy as np
+
+
+class TimeSeries:
+    """
+        Fixed-size history of (x, y) samples, for graphs and any other
+        consumer that keeps a sliding window (an Async callback, say).
+
+        The buffers are preallocated, and every sample is written twice
+        so that the newest samples are always contiguous: append() is
+        O(1), and x and y are views rather than copies. A view stays
+        valid for `spare` more appends (default: size), which leaves time
+        to hand it to another thread, such as the GUI's.
+
+        The x and y properties each read the window on their own, so
+        they only match on the appending thread. Other threads take both
+        at once with window().
+    """
+
+    def __init__(self, size, spare=None, dtype=float):
+        self.size = size
+        self.__capacity = size + (size if spare is None else spare)
+        self.__x = np.zeros(2 * self.__capacity, dtype)
+        self.__y = np.zeros(2 * self.__capacity, dtype)
+        self.__head = 0  # the slot the next sample goes to
+        self.__count = 0  # number of samples in the window, at most size
+
+    def append(self, x, y):
+        h = self.__head
+        c = self.__capacity
+        self.__x[h] = self.__x[h + c] = x
+        self.__y[h] = self.__y[h + c] = y
+        self.__head = h + 1 if h + 1 < c else 0
+        if self.__count < self.size:
+            self.__count += 1
+
+    def clear(self):
+        # head keeps moving on, so views handed out before stay valid
+        self.__count = 0
+
+    def __window(self, a):
+        # the upper copy of the newest sample sits just below head + capacity
+        end = self.__head + self.__capacity
+        return a[end - self.__count:end]
+
+    def window(self):
+        """
+            Returns the (x, y) views of one and the same window, even
+            while another thread appends
+        """
+        count = self.__count  # read before head, so the window never reaches unwritten slots
+        end = self.__head + self.__capacity
+        return self.__x[end - count:end], self.__y[end - count:end]
+
+    @property
+    def x(self):
+        return self.__window(self.__x)
+
+    @property
+    def y(self):
+        return self.__window(self.__y)
+
+    def __len__(self):
+        return self.__count
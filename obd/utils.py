@@ -35,6 +35,7 @@ import glob
 import logging
 import string
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import serial
 
@@ -52,53 +53,77 @@ class OBDStatus:
 
 class BitArray:
     """
-    Class for representing bitarrays (inefficiently)
+    Class for representing bitarrays
 
-    There's a nice C-optimized lib for this: https://github.com/ilanschnell/bitarray
-    but python-OBD doesn't use it enough to be worth adding the dependency.
-    But, if this class starts getting used too much, we should switch to that lib.
+    The bits are kept in a single int, so indexing, value() and num_set()
+    are a shift and a mask rather than string work. Bit 0 is the most
+    significant bit of the first byte, as the OBD-II spec numbers them.
     """
 
+    __slots__ = ("_int", "_len", "_bits")
+
     def __init__(self, _bytearray):
-        self.bits = ""
-        for b in _bytearray:
-            v = bin(b)[2:]
-            self.bits += ("0" * (8 - len(v))) + v  # pad it with zeros
+        self._int = int.from_bytes(_bytearray, "big")
+        self._len = len(_bytearray) * 8
+        self._bits = None
+
+    @property
+    def bits(self):
+        """ the bits as a string of '0' and '1' characters """
+        if self._bits is None:
+            self._bits = format(self._int, "0%db" % self._len) if self._len else ""
+        return self._bits
 
     def __getitem__(self, key):
         if isinstance(key, int):
-            if key >= 0 and key < len(self.bits):
-                return self.bits[key] == "1"
+            n = self._len
+            if 0 <= key < n:
+                return (self._int >> (n - 1 - key)) & 1 == 1
             else:
                 return False
         elif isinstance(key, slice):
-            bits = self.bits[key]
-            if bits:
-                return [b == "1" for b in bits]
-            else:
-                return []
+            bits = self._bits if self._bits is not None else self.bits
+            return [b == "1" for b in bits[key]]
 
     def num_set(self):
-        return self.bits.count("1")
+        return _popcount(self._int)
 
     def num_cleared(self):
-        return self.bits.count("0")
+        return self._len - _popcount(self._int)
+
+    def iter_set_bits(self):
+        """ yields the indices of the set bits, in ascending order """
+        n = self._len - 1
+        v = self._int
+        while v:
+            top = v.bit_length() - 1
+            yield n - top
+            v ^= 1 << top
 
     def value(self, start, stop):
-        bits = self.bits[start:stop]
-        if bits:
-            return int(bits, 2)
-        else:
-            return 0
+        n = self._len
+        if not (0 <= start <= stop <= n):  # negative or out of range bounds
+            start, stop, _ = slice(start, stop).indices(n)
+            if stop <= start:
+                return 0
+        return (self._int >> (n - stop)) & ((1 << (stop - start)) - 1)
 
     def __len__(self):
-        return len(self.bits)
+        return self._len
 
     def __str__(self):
         return self.bits
 
     def __iter__(self):
-        return [b == "1" for b in self.bits].__iter__()
+        bits = self._bits if self._bits is not None else self.bits
+        return [b == "1" for b in bits].__iter__()
+
+
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:  # python < 3.10
+    def _popcount(v):
+        return bin(v).count("1")
 
 
 def bytes_to_int(bs):
@@ -147,6 +172,36 @@ def contiguous(l, start, end):
     return True
 
 
+def header_switches(cmds, header):
+    """ counts the AT SH switches needed to send commands in order, starting from header """
+    n = 0
+    for cmd in cmds:
+        if cmd.header != header:
+            n += 1
+            header = cmd.header
+    return n
+
+
+def group_by_header(cmds, header):
+    """
+        orders commands so that the ones sharing a header are sent together,
+        starting with the current header, and keeping the order within each
+        header. Returns (ordered commands, number of AT SH switches saved)
+    """
+    groups = {}
+    for cmd in cmds:
+        groups.setdefault(cmd.header, []).append(cmd)
+
+    if len(groups) < 2:
+        return list(cmds), 0
+
+    ordered = groups.pop(header, [])
+    for group in groups.values():
+        ordered += group
+
+    return ordered, header_switches(cmds, header) - header_switches(ordered, header)
+
+
 def try_port(portStr):
     """returns boolean for port availability"""
     try:
@@ -190,8 +245,11 @@ def scan_serial():
 
     # possible_ports += glob.glob('/dev/pts/[0-9]*') # for obdsim
 
-    for port in possible_ports:
-        if try_port(port):
-            available.append(port)
+    # opening a port can block, so try them all at once
+    if possible_ports:
+        with ThreadPoolExecutor(max_workers=min(32, len(possible_ports))) as executor:
+            for port, ok in zip(possible_ports, executor.map(try_port, possible_ports)):
+                if ok:
+                    available.append(port)
     print('Available ports: '+str(available))
     return available
@@ -22,2075 +22,11 @@
 # along with pyOBD; if not, write to the Free Software
 # Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
 ###########################################################################
-pcodes = {
-	"P0001": "Řídicí obvod regulátoru objemu paliva/otevřeno",
-	"P0002": "Řídicí obvod regulátoru objemu paliva Rozsah/výkon",
-	"P0003": "Nízký řídicí obvod regulátoru objemu paliva",
-	"P0004": "Řídicí obvod regulátoru objemu paliva vysoký",
-	"P0005": "Řídicí obvod/otevřený uzavírací ventil paliva 'A'",
-	"P0006": "Nízký řídicí obvod uzavíracího ventilu paliva 'A'",
-	"P0007": "Řídicí obvod uzavíracího ventilu paliva 'A' vysoký",
-	"P0008": "Výkon polohového systému motoru",
-	"P0009": "Výkon polohového systému motoru",
-	"P0010": "Obvod pohonu polohy vačkového hřídele 'A'",
-	"P0011": "Poloha vačkového hřídele 'A' - příliš pokročilé časování nebo výkon systému",
-	"P0012": "Poloha vačkového hřídele 'A' - nadměrné časování",
-	"P0013": "Poloha vačkového hřídele 'B' - obvod akčního členu",
-	"P0014": "Poloha vačkového hřídele 'B' - příliš pokročilé časování nebo výkon systému",
-	"P0015": "Poloha vačkového hřídele 'B' - nadměrné časování",
-	"P0016": "Korelace polohy klikového hřídele a polohy vačkového hřídele",
-	"P0017": "Korelace polohy klikového hřídele a polohy vačkového hřídele",
-	"P0018": "Korelace polohy klikového hřídele a polohy vačkového hřídele",
-	"P0019": "Korelace polohy klikového hřídele a polohy vačkového hřídele",
-	"P0020": "Obvod pohonu polohy vačkového hřídele 'A'",
-	"P0021": "Poloha vačkového hřídele 'A' - příliš pokročilé časování nebo výkon systému",
-	"P0022": "Poloha vačkového hřídele 'A' - nadměrné časování",
-	"P0023": "Poloha vačkového hřídele 'B' - obvod akčního členu",
-	"P0024": "Poloha vačkového hřídele 'B' - příliš pokročilé časování nebo výkon systému",
-	"P0025": "Poloha vačkového hřídele 'B' - nadměrné časování",
-	"P0026": "Rozsah/výkon okruhu ovládání sacího ventilu elektromagnetickým ventilem",
-	"P0027": "Obvod ovládání elektromagnetického ventilu výfukového potrubí Rozsah/výkon",
-	"P0028": "Rozsah/výkon okruhu ovládání sacího ventilu elektromagnetickým ventilem",
-	"P0029": "Obvod ovládání elektromagnetického ventilu výfukového potrubí Rozsah/výkon",
-	"P0030": "Řídicí obvod ohřívače HO2S",
-	"P0031": "Nízký řídicí obvod ohřívače HO2S",
-	"P0032": "HO2S Řídicí obvod topení High",
-	"P0033": "Obvod řízení obtokového ventilu turbodmychadla",
-	"P0034": "Nízký řídicí obvod obtokového ventilu turbodmychadla",
-	"P0035": "Obvod řízení obtokového ventilu turbodmychadla High",
-	"P0036": "Řídicí obvod ohřívače HO2S",
-	"P0037": "Nízký řídicí obvod ohřívače HO2S",
-	"P0038": "HO2S Řídicí obvod topení High",
-	"P0039": "Obvod řízení obtokového ventilu turbodmychadla/nadmychadla Rozsah/výkon",
-	"P0040": "Vyměněné signály snímače O2 Snímač banky 1/ Snímač banky 2 1",
-	"P0041": "Vyměněné signály snímače O2 Snímač 1 banky 2 / Snímač 2 banky 2",
-	"P0042": "Řídicí obvod ohřívače HO2S",
-	"P0043": "Nízký řídicí obvod ohřívače HO2S",
-	"P0044": "HO2S Řídicí obvod topení High",
-	"P0045": "Obvod/rozpínací cívka ovládání zvýšení tlaku turba/nadupávacího kompresoru",
-	"P0046": "Rozsah/výkon obvodu ovládacího cívky zvyšování tlaku turba/nadupaného nabíječe",
-	"P0047": "Nízký obvod elektromagnetické regulace zvýšení tlaku turba/nadupávacího kompresoru",
-	"P0048": "Obvod elektromagnetické regulace zvýšení tlaku turba/nadupaného nabíječe High",
-	"P0049": "Nadměrné otáčky turbíny turbodmychadla/nadmychadla",
-	"P0050": "Řídicí obvod ohřívače HO2S",
-	"P0051": "Nízký řídicí obvod ohřívače HO2S",
-	"P0052": "HO2S Řídicí obvod topení High",
-	"P0053": "Odolnost ohřívače HO2S",
-	"P0054": "Odolnost ohřívače HO2S",
-	"P0055": "Odolnost ohřívače HO2S",
-	"P0056": "Řídicí obvod ohřívače HO2S",
-	"P0057": "Nízký řídicí obvod ohřívače HO2S",
-	"P0058": "HO2S Řídicí obvod topení High",
-	"P0059": "Odolnost ohřívače HO2S",
-	"P0060": "Odolnost ohřívače HO2S",
-	"P0061": "Odolnost ohřívače HO2S",
-	"P0062": "Řídicí obvod ohřívače HO2S",
-	"P0063": "Nízký řídicí obvod ohřívače HO2S",
-	"P0064": "HO2S Řídicí obvod topení High",
-	"P0065": "Řízení vstřikovačů s podporou vzduchu Rozsah/výkon",
-	"P0066": "Řídicí obvod vstřikovače s podporou vzduchu nebo nízký obvod",
-	"P0067": "Vysoký řídicí obvod vstřikovače s podporou vzduchu",
-	"P0068": "MAP/MAF - korelace polohy škrticí klapky",
-	"P0069": "Korelace absolutního tlaku v kolektoru a barometrického tlaku",
-	"P0070": "Obvod snímače teploty okolního vzduchu",
-	"P0071": "Rozsah/výkon čidla teploty okolního vzduchu",
-	"P0072": "Nízký obvod snímače teploty okolního vzduchu",
-	"P0073": "Vysoký obvod snímače teploty okolního vzduchu",
-	"P0074": "Přerušovaný obvod snímače teploty okolního vzduchu",
-	"P0075": "Elektromagnetický obvod ovládání sacího ventilu",
-	"P0076": "Nízký stav obvodu elektromagnetického ovládání sacího ventilu",
-	"P0077": "Elektromagnetický obvod ovládání sacího ventilu vysoký",
-	"P0078": "Elektromagnetický obvod ovládání výfukového ventilu",
-	"P0079": "Nízký stav obvodu elektromagnetického ovládání výfukového ventilu",
-	"P0080": "Elektromagnetický obvod ovládání výfukového ventilu vysoký",
-	"P0081": "Elektromagnetický obvod ovládání sacího ventilu",
-	"P0082": "Nízký stav obvodu elektromagnetického ovládání sacího ventilu",
-	"P0083": "Elektromagnetický obvod ovládání sacího ventilu vysoký",
-	"P0084": "Elektromagnetický obvod ovládání výfukového ventilu",
-	"P0085": "Nízký stav obvodu elektromagnetického ovládání výfukového ventilu",
-	"P0086": "Elektromagnetický obvod ovládání výfukového ventilu vysoký",
-	"P0087": "Příliš nízký tlak v palivové liště/systému",
-	"P0088": "Příliš vysoký tlak v palivové liště/systému",
-	"P0089": "Regulátor tlaku paliva 1 Performance",
-	"P0090": "Řídicí obvod regulátoru tlaku paliva 1",
-	"P0091": "Nízký řídicí obvod regulátoru tlaku paliva 1",
-	"P0092": "Řídicí obvod regulátoru tlaku paliva 1 vysoký",
-	"P0093": "Zjištěna netěsnost palivového systému - velká netěsnost",
-	"P0094": "Zjištěna netěsnost palivového systému - malá netěsnost",
-	"P0095": "Obvod čidla teploty nasávaného vzduchu 2",
-	"P0096": "Snímač teploty nasávaného vzduchu 2 Rozsah/výkon obvodu",
-	"P0097": "Nízký obvod snímače teploty nasávaného vzduchu 2",
-	"P0098": "Obvod čidla teploty nasávaného vzduchu 2 vysoký",
-	"P0099": "Snímač teploty nasávaného vzduchu 2 Obvod přerušovaný / nepravidelný",
-	"P0100": "Okruh hmotnostního nebo objemového průtoku vzduchu",
-	"P0101": "Hmotnostní nebo objemový průtok vzduchu v okruhu Rozsah/výkon",
-	"P0102": "Hmotnostní nebo objemový okruh průtoku vzduchu Nízký příkon",
-	"P0103": "Obvod hromadného nebo objemového průtoku vzduchu Vysoký příkon",
-	"P0104": "Přerušovaný okruh hmotnostního nebo objemového průtoku vzduchu",
-	"P0105": "Obvod absolutního tlaku v kolektoru/barometrického tlaku",
-	"P0106": "Rozsah/výkon obvodu absolutního tlaku v kolektoru/barometrického tlaku",
-	"P0107": "Obvod absolutního tlaku v kolektoru/barometrického tlaku Nízký vstupní signál",
-	"P0108": "Obvod absolutního tlaku v rozdělovači/barometrického tlaku Vysoký příkon",
-	"P0109": "Obvod absolutního tlaku v kolektoru/barometrického tlaku Přerušovaný",
-	"P0110": "Obvod snímače teploty nasávaného vzduchu 1",
-	"P0111": "Obvod snímače teploty nasávaného vzduchu 1 Rozsah/výkon",
-	"P0112": "Nízký obvod snímače teploty nasávaného vzduchu 1",
-	"P0113": "Obvod snímače teploty nasávaného vzduchu 1 vysoký",
-	"P0114": "Snímač teploty nasávaného vzduchu 1 Obvod přerušovaný",
-	"P0115": "Obvod teploty chladicí kapaliny motoru",
-	"P0116": "Rozsah/výkon obvodu teploty chladicí kapaliny motoru",
-	"P0117": "Nízká teplota chladicí kapaliny motoru",
-	"P0118": "Vysoká teplota chladicí kapaliny motoru",
-	"P0119": "Obvod teploty chladicí kapaliny motoru Přerušovaný",
-	"P0120": "Snímač polohy škrticí klapky/pedálu/spínač 'A' Obvod",
-	"P0121": "Snímač polohy škrticí klapky/pedálu/spínač 'A' Rozsah/výkonnost obvodu",
-	"P0122": "Snímač polohy škrticí klapky/pedálu/spínač 'A' Obvod nízký",
-	"P0123": "Snímač polohy škrticí klapky/pedálu/obvod spínače 'A' vysoký",
-	"P0124": "Snímač polohy škrticí klapky/pedálu/spínač 'A' Obvod přerušovaný",
-	"P0125": "Nedostatečná teplota chladicí kapaliny pro řízení paliva v uzavřené smyčce",
-	"P0126": "Nedostatečná teplota chladicí kapaliny pro stabilní provoz",
-	"P0127": "Příliš vysoká teplota nasávaného vzduchu",
-	"P0128": "Termostat chladicí kapaliny (teplota chladicí kapaliny pod regulační teplotou termostatu)",
-	"P0129": "Příliš nízký barometrický tlak",
-	"P0130": "Obvod snímače O2",
-	"P0131": "Nízké napětí v obvodu snímače O2",
-	"P0132": "Vysoké napětí v obvodu snímače O2",
-	"P0133": "Obvod snímače O2 s pomalou odezvou",
-	"P0134": "Obvod snímače O2 nezjištěna žádná aktivita",
-	"P0135": "Obvod ohřevu snímače O2",
-	"P0136": "Obvod snímače O2",
-	"P0137": "Nízké napětí v obvodu snímače O2",
-	"P0138": "Vysoké napětí v obvodu snímače O2",
-	"P0139": "Obvod snímače O2 s pomalou odezvou",
-	"P0140": "Obvod snímače O2 nezjištěna žádná aktivita",
-	"P0141": "Obvod ohřevu snímače O2",
-	"P0142": "Obvod snímače O2",
-	"P0143": "Nízké napětí v obvodu snímače O2",
-	"P0144": "Vysoké napětí v obvodu snímače O2",
-	"P0145": "Obvod snímače O2 s pomalou odezvou",
-	"P0146": "Obvod snímače O2 nezjištěna žádná aktivita",
-	"P0147": "Obvod ohřevu snímače O2",
-	"P0148": "Chyba dodávky paliva",
-	"P0149": "Chyba časování paliva",
-	"P0150": "Obvod snímače O2",
-	"P0151": "Nízké napětí v obvodu snímače O2",
-	"P0152": "Vysoké napětí v obvodu snímače O2",
-	"P0153": "Obvod snímače O2 s pomalou odezvou",
-	"P0154": "Obvod snímače O2 nezjištěna žádná aktivita",
-	"P0155": "Obvod ohřevu snímače O2",
-	"P0156": "Obvod snímače O2",
-	"P0157": "Nízké napětí v obvodu snímače O2",
-	"P0158": "Vysoké napětí v obvodu snímače O2",
-	"P0159": "Obvod snímače O2 s pomalou odezvou",
-	"P0160": "Obvod snímače O2 nezjištěna žádná aktivita",
-	"P0161": "Obvod ohřevu snímače O2",
-	"P0162": "Obvod snímače O2",
-	"P0163": "Nízké napětí v obvodu snímače O2",
-	"P0164": "Vysoké napětí v obvodu snímače O2",
-	"P0165": "Obvod snímače O2 s pomalou odezvou",
-	"P0166": "Obvod snímače O2 nezjištěna žádná aktivita",
-	"P0167": "Obvod ohřevu snímače O2",
-	"P0168": "Příliš vysoká teplota paliva",
-	"P0169": "Nesprávné složení paliva",
-	"P0170": "Ořezávání paliva",
-	"P0171": "Příliš štíhlý systém",
-	"P0172": "Příliš bohatý systém",
-	"P0173": "Ořezávání paliva",
-	"P0174": "Příliš štíhlý systém",
-	"P0175": "Příliš bohatý systém",
-	"P0176": "Obvod snímače složení paliva",
-	"P0177": "Rozsah/výkon obvodu snímače složení paliva",
-	"P0178": "Nízký obvod snímače složení paliva",
-	"P0179": "Vysoký obvod snímače složení paliva",
-	"P0180": "Obvod A snímače teploty paliva",
-	"P0181": "Snímač teploty paliva A Rozsah/výkon obvodu",
-	"P0182": "Nízký obvod snímače teploty paliva A",
-	"P0183": "Vysoký obvod snímače teploty paliva A",
-	"P0184": "Obvod A snímače teploty paliva přerušovaný",
-	"P0185": "Obvod B snímače teploty paliva",
-	"P0186": "Snímač teploty paliva B Rozsah/výkon obvodu",
-	"P0187": "Nízký obvod snímače teploty paliva B",
-	"P0188": "Vysoký obvod snímače teploty paliva B",
-	"P0189": "Obvod snímače teploty paliva B Přerušovaný",
-	"P0190": "Obvod snímače tlaku palivové lišty",
-	"P0191": "Rozsah/výkon obvodu snímače tlaku palivové lišty",
-	"P0192": "Nízký obvod snímače tlaku palivové lišty",
-	"P0193": "Vysoký obvod snímače tlaku palivové lišty",
-	"P0194": "Přerušovaný obvod snímače tlaku palivové lišty",
-	"P0195": "Snímač teploty motorového oleje",
-	"P0196": "Snímač teploty motorového oleje Rozsah/výkon",
-	"P0197": "Snímač teploty motorového oleje nízký",
-	"P0198": "Snímač teploty motorového oleje vysoký",
-	"P0199": "Snímač teploty motorového oleje Přerušovaný",
-	"P0200": "Vstřikovací obvod/otevřený",
-	"P0201": "Vstřikovací okruh/otevřený - válec 1",
-	"P0202": "Vstřikovací okruh/otevřený - válec 2",
-	"P0203": "Vstřikovací okruh/otevřený - válec 3",
-	"P0204": "Vstřikovací okruh/otevřený - válec 4",
-	"P0205": "Vstřikovací okruh/otevřený - válec 5",
-	"P0206": "Vstřikovací okruh/otevřený - válec 6",
-	"P0207": "Vstřikovací okruh/otevřený - válec 7",
-	"P0208": "Vstřikovací okruh/otevřený - válec 8",
-	"P0209": "Vstřikovací okruh/otevřený - válec 9",
-	"P0210": "Vstřikovací okruh/otevřený - válec 10",
-	"P0211": "Vstřikovací okruh/otevřený - válec 11",
-	"P0212": "Vstřikovací okruh/otevřený - válec 12",
-	"P0213": "Vstřikovač pro studený start 1",
-	"P0214": "Vstřikovač pro studený start 2",
-	"P0215": "Vypínací elektromagnet motoru",
-	"P0216": "Řídicí obvod vstřikovače/časování vstřikování",
-	"P0217": "Stav překročení teploty chladicí kapaliny motoru",
-	"P0218": "Stav přehřátí převodové kapaliny",
-	"P0219": "Stav překročení otáček motoru",
-	"P0220": "Snímač polohy škrticí klapky/pedálu/obvod spínače 'B'",
-	"P0221": "Snímač polohy škrticí klapky/pedálu/spínač 'B' Rozsah/výkonnost obvodu",
-	"P0222": "Snímač polohy škrticí klapky/pedálu/obvod spínače 'B' nízký",
-	"P0223": "Snímač polohy škrticí klapky/pedálu/obvod spínače 'B' vysoký",
-	"P0224": "Snímač polohy škrticí klapky/pedálu/spínač 'B' Obvod přerušovaný",
-	"P0225": "Snímač polohy škrticí klapky/pedálu/obvod spínače 'C'",
-	"P0226": "Snímač polohy škrticí klapky/pedálu/spínač 'C' Rozsah/výkonnost obvodu",
-	"P0227": "Snímač polohy škrticí klapky/pedálu/spínač 'C' Obvod nízký",
-	"P0228": "Snímač polohy škrticí klapky/pedálu/obvod spínače 'C' vysoký",
-	"P0229": "Snímač polohy škrticí klapky/pedálu/spínač 'C' Obvod přerušovaný",
-	"P0230": "Primární okruh palivového čerpadla",
-	"P0231": "Nízký sekundární okruh palivového čerpadla",
-	"P0232": "Vysoký sekundární okruh palivového čerpadla",
-	"P0233": "Přerušovaný sekundární okruh palivového čerpadla",
-	"P0234": "Stav přeplňování turbodmychadla/nadupaného nabíječe",
-	"P0235": "Obvod 'A' snímače zvýšení tlaku turba/nadupaného nabíječe",
-	"P0236": "Snímač zvýšení tlaku turba/supernabíječky Obvod 'A' Rozsah/výkon",
-	"P0237": "Nízká úroveň obvodu 'A' snímače zvýšení tlaku turba/nadupávacího kompresoru",
-	"P0238": "Obvod 'A' snímače zvýšení tlaku turba/ supernabíječky vysoký",
-	"P0239": "Obvod 'B' snímače zvýšení tlaku turba/supernabíječky",
-	"P0240": "Snímač zvýšení tlaku turba/nadupávacího kompresoru Obvod 'B' Rozsah/výkon",
-	"P0241": "Nízký obvod snímače zvýšení tlaku 'B' turba/supernabíječky",
-	"P0242": "Obvod 'B' snímače zvýšení tlaku turba/nadupaného nabíječe vysoký",
-	"P0243": "Wastegate solenoid 'A' turbodmychadla/superdmychadla",
-	"P0244": "Wastegate Solenoid 'A' pro turbodmychadla a superdmychadla Rozsah/výkon",
-	"P0245": "Nízká hodnota Wastegate solenoidu 'A' turbodmychadla/superdmychadla",
-	"P0246": "Turbodmychadlo / superdmychadlo Wastegate Solenoid 'A' High",
-	"P0247": "Solenoid Wastegate 'B' turbodmychadla/superdmychadla",
-	"P0248": "Wastegate Solenoid 'B' pro turbodmychadla a superdmychadla Rozsah/Výkon",
-	"P0249": "Nízký ventil Wastegate 'B' turbodmychadla/superdmychadla",
-	"P0250": "Turbodmychadlo / superdmychadlo Wastegate Solenoid 'B' High",
-	"P0251": "Vstřikovací čerpadlo Řízení dávkování paliva 'A' (vačka/motor/vstřikovač)",
-	"P0252": "Vstřikovací čerpadlo Řízení dávkování paliva 'A' Rozsah/výkon (vačka/motor/vstřikovač)",
-	"P0253": "Vstřikovací čerpadlo Řízení dávkování paliva 'A' nízké (vačka/motor/vstřikovač)",
-	"P0254": "Vstřikovací čerpadlo Řízení dávkování paliva 'A' High (vačka/motor/vstřikovač)",
-	"P0255": "Vstřikovací čerpadlo Řízení dávkování paliva 'A' přerušované (vačka/motor/vstřikovač)",
-	"P0256": "Řízení dávkování paliva vstřikovacího čerpadla 'B' (vačka/motor/vstřikovač)",
-	"P0257": "Vstřikovací čerpadlo Řízení dávkování paliva 'B' Rozsah/výkon (vačka/motor/vstřikovač)",
-	"P0258": "Řídicí jednotka dávkování paliva vstřikovacího čerpadla 'B' nízká (vačka/motor/vstřikovač)",
-	"P0259": "Řízení dávkování paliva vstřikovacího čerpadla 'B' High (vačka/motor/vstřikovač)",
-	"P0260": "Vstřikovací čerpadlo Řízení dávkování paliva 'B' přerušované (vačka/motor/vstřikovač)",
-	"P0261": "Nízká úroveň vstřikovacího okruhu válce 1",
-	"P0262": "Vysoký obvod vstřikovače válce 1",
-	"P0263": "Válec 1 Příspěvek/Zůstatek",
-	"P0264": "Nízký vstřikovací okruh válce 2",
-	"P0265": "Vysoký obvod vstřikovače válce 2",
-	"P0266": "Válec 2 Příspěvek/Zůstatek",
-	"P0267": "Nízký vstřikovací okruh válce 3",
-	"P0268": "Vysoký obvod vstřikovače válce 3",
-	"P0269": "Válec 3 Příspěvek/Zůstatek",
-	"P0270": "Nízký vstřikovací okruh válce 4",
-	"P0271": "Vysoký obvod vstřikovače válce 4",
-	"P0272": "Příspěvek/vyvážení válce 4",
-	"P0273": "Nízký vstřikovací okruh válce 5",
-	"P0274": "Vysoký obvod vstřikovače válce 5",
-	"P0275": "Válec 5 Příspěvek/Zůstatek",
-	"P0276": "Nízký vstřikovací okruh válce 6",
-	"P0277": "Vysoký obvod vstřikovače válce 6",
-	"P0278": "Příspěvek/vyvážení válce 6",
-	"P0279": "Nízký obvod vstřikovače válce 7",
-	"P0280": "Vysoký obvod vstřikovače válce 7",
-	"P0281": "Válec 7 Příspěvek/Zůstatek",
-	"P0282": "Nízký vstřikovací okruh válce 8",
-	"P0283": "Vysoký obvod vstřikovače válce 8",
-	"P0284": "Válec 8 Příspěvek/vyrovnání",
-	"P0285": "Nízký obvod vstřikovače válce 9",
-	"P0286": "Vysoký obvod vstřikovače válce 9",
-	"P0287": "Válec 9 Příspěvek/Zůstatek",
-	"P0288": "Nízký obvod vstřikovače válce 10",
-	"P0289": "Vysoký obvod vstřikovače válce 10",
-	"P0290": "Válec 10 Příspěvek/Zůstatek",
-	"P0291": "Nízký obvod vstřikovače válce 11",
-	"P0292": "Vysoký obvod vstřikovače válce 11",
-	"P0293": "Válec 11 Příspěvek/Zůstatek",
-	"P0294": "Nízký obvod vstřikovače válce 12",
-	"P0295": "Vysoký obvod vstřikovače válce 12",
-	"P0296": "Válec 12 Příspěvek/Zůstatek",
-	"P0297": "Stav překročení rychlosti vozidla",
-	"P0298": "Přehřátí motorového oleje",
-	"P0299": "Turbodmychadlo/nadmychadlo Underboost",
-	"P0300": "Zjištěn náhodný/vícečetný nesprávný zážeh válců",
-	"P0301": "Zjištěn nesprávný zážeh válce 1",
-	"P0302": "Zjištěn nesprávný zážeh válce 2",
-	"P0303": "Zjištěn nesprávný zážeh válce 3",
-	"P0304": "Zjištěn nesprávný zážeh válce 4",
-	"P0305": "Zjištěn nesprávný zážeh válce 5",
-	"P0306": "Zjištěn nesprávný zážeh válce 6",
-	"P0307": "Zjištěn nesprávný zážeh válce 7",
-	"P0308": "Zjištěn nesprávný zážeh válce 8",
-	"P0309": "Zjištěn nesprávný zážeh válce 9",
-	"P0310": "Zjištěn nesprávný zážeh válce 10",
-	"P0311": "Zjištěn nesprávný zážeh válce 11",
-	"P0312": "Zjištěn nesprávný zážeh válce 12",
-	"P0313": "Zjištěn nesprávný zážeh při nízkém množství paliva",
-	"P0314": "Chybný zážeh jednoho válce (válec není uveden)",
-	"P0315": "Varianta systému polohy klikového hřídele Nebyla zjištěna",
-	"P0316": "Zjištěn chybný zážeh motoru při startu (prvních 1000 otáček)",
-	"P0317": "Hardware pro hrubé cesty není přítomen",
-	"P0318": "Signální obvod snímače nerovností 'A'",
-	"P0319": "Senzor Rough Road 'B'",
-	"P0320": "Vstupní obvod otáček zapalování/rozdělovače motoru",
-	"P0321": "Zapalování/rozdělovač Vstupní obvod otáček motoru Rozsah/výkon",
-	"P0322": "Vstupní obvod otáček zapalování/rozdělovače motoru bez signálu",
-	"P0323": "Vstupní obvod otáček zapalování/rozdělovače motoru Přerušovaný",
-	"P0324": "Chyba systému kontroly klepání",
-	"P0325": "Obvod snímače klepání 1",
-	"P0326": "Rozsah/výkon obvodu snímače klepání 1",
-	"P0327": "Nízký obvod snímače klepání 1",
-	"P0328": "Obvod snímače klepání 1 vysoký",
-	"P0329": "Vstupní obvod snímače klepání 1 přerušovaný",
-	"P0330": "Obvod snímače klepání 2",
-	"P0331": "Rozsah/výkon obvodu snímače klepání 2",
-	"P0332": "Nízký obvod snímače klepání 2",
-	"P0333": "Vysoký obvod snímače klepání 2",
-	"P0334": "Vstupní obvod snímače klepání 2 přerušovaný",
-	"P0335": "Obvod 'A' snímače polohy klikového hřídele",
-	"P0336": "Obvod snímače polohy klikového hřídele 'A' Rozsah/výkon",
-	"P0337": "Nízký obvod snímače polohy klikového hřídele 'A'",
-	"P0338": "Obvod snímače polohy klikového hřídele 'A' vysoký",
-	"P0339": "Obvod snímače polohy klikového hřídele 'A' přerušovaný",
-	"P0340": "Obvod 'A' snímače polohy vačkového hřídele",
-	"P0341": "Rozsah/výkon obvodu 'A' snímače polohy vačkového hřídele",
-	"P0342": "Nízký obvod snímače polohy vačkového hřídele 'A'",
-	"P0343": "Vysoký obvod snímače polohy vačkového hřídele 'A'",
-	"P0344": "Přerušovaný obvod snímače polohy vačkového hřídele 'A'",
-	"P0345": "Obvod 'A' snímače polohy vačkového hřídele",
-	"P0346": "Rozsah/výkon obvodu 'A' snímače polohy vačkového hřídele",
-	"P0347": "Nízký obvod snímače polohy vačkového hřídele 'A'",
-	"P0348": "Vysoký obvod snímače polohy vačkového hřídele 'A'",
-	"P0349": "Přerušovaný obvod snímače polohy vačkového hřídele 'A'",
-	"P0350": "Primární/sekundární obvod zapalovací cívky",
-	"P0351": "Primární/sekundární obvod zapalovací cívky 'A'",
-	"P0352": "Primární/sekundární obvod zapalovací cívky 'B'",
-	"P0353": "Primární/sekundární obvod zapalovací cívky 'C'",
-	"P0354": "Primární/sekundární obvod zapalovací cívky 'D'",
-	"P0355": "Primární/sekundární obvod zapalovací cívky 'E'",
-	"P0356": "Primární/sekundární obvod zapalovací cívky 'F'",
-	"P0357": "Primární/sekundární obvod zapalovací cívky 'G'",
-	"P0358": "Primární/sekundární obvod zapalovací cívky 'H'",
-	"P0359": "Primární/sekundární obvod zapalovací cívky 'I'",
-	"P0360": "Primární/sekundární obvod zapalovací cívky 'J'",
-	"P0361": "Primární/sekundární obvod zapalovací cívky 'K'",
-	"P0362": "Primární/sekundární obvod zapalovací cívky 'L'",
-	"P0363": "Zjištěn chybný zážeh - vypnuto doplňování paliva",
-	"P0364": "Rezervováno",
-	"P0365": "Obvod 'B' snímače polohy vačkového hřídele",
-	"P0366": "Obvod snímače polohy vačkového hřídele 'B' Rozsah/výkon",
-	"P0367": "Nízký obvod snímače polohy vačkového hřídele 'B'",
-	"P0368": "Vysoký obvod snímače polohy vačkového hřídele 'B'",
-	"P0369": "Obvod snímače polohy vačkového hřídele 'B' přerušovaný",
-	"P0370": "Referenční časování Signál s vysokým rozlišením 'A'",
-	"P0371": "Referenční časování Signál s vysokým rozlišením 'A' Příliš mnoho impulzů",
-	"P0372": "Referenční časování Signál s vysokým rozlišením 'A' Příliš málo impulzů",
-	"P0373": "Referenční časování Signál s vysokým rozlišením 'A' Přerušované/nepravidelné impulsy",
-	"P0374": "Referenční časování Signál s vysokým rozlišením 'A' Bez pulzu",
-	"P0375": "Referenční časování Signál s vysokým rozlišením 'B'",
-	"P0376": "Referenční časování Signál s vysokým rozlišením 'B' Příliš mnoho impulzů",
-	"P0377": "Referenční časování Signál s vysokým rozlišením 'B' Příliš málo impulzů",
-	"P0378": "Referenční časování Signál s vysokým rozlišením 'B' Přerušované/nepravidelné impulsy",
-	"P0379": "Referenční časování Signál s vysokým rozlišením 'B' Žádné impulsy",
-	"P0380": "Obvod žhavicí svíčky/ohřívače 'A'",
-	"P0381": "Obvod žhavicí svíčky/indikátoru topení",
-	"P0382": "Obvod žhavicí svíčky/ohřívače 'B'",
-	"P0383": "Vyhrazeno podle SAE J2012",
-	"P0384": "Vyhrazeno podle SAE J2012",
-	"P0385": "Obvod 'B' snímače polohy klikového hřídele",
-	"P0386": "Obvod snímače polohy klikového hřídele 'B' Rozsah/výkon",
-	"P0387": "Nízký obvod snímače polohy klikového hřídele 'B'",
-	"P0388": "Obvod snímače polohy klikového hřídele 'B' vysoký",
-	"P0389": "Obvod snímače polohy klikového hřídele 'B' Přerušovaný",
-	"P0390": "Obvod 'B' snímače polohy vačkového hřídele",
-	"P0391": "Obvod snímače polohy vačkového hřídele 'B' Rozsah/výkon",
-	"P0392": "Nízký obvod snímače polohy vačkového hřídele 'B'",
-	"P0393": "Vysoký obvod snímače polohy vačkového hřídele 'B'",
-	"P0394": "Obvod snímače polohy vačkového hřídele 'B' přerušovaný",
-	"P0400": "Průtok recirkulace výfukových plynů",
-	"P0401": "Zjištěn nedostatečný průtok recirkulace výfukových plynů",
-	"P0402": "Zjištěn nadměrný průtok recirkulace výfukových plynů",
-	"P0403": "Řídicí obvod recirkulace výfukových plynů",
-	"P0404": "Řídicí okruh recirkulace výfukových plynů Rozsah/výkon",
-	"P0405": "Nízký obvod čidla recirkulace výfukových plynů 'A'",
-	"P0406": "Vysoký obvod čidla recirkulace výfukových plynů 'A'",
-	"P0407": "Nízký obvod snímače recirkulace výfukových plynů 'B'",
-	"P0408": "Vysoký obvod snímače recirkulace výfukových plynů 'B'",
-	"P0409": "Obvod 'A' snímače recirkulace výfukových plynů",
-	"P0410": "Systém sekundárního vstřikování vzduchu",
-	"P0411": "Zjištěn nesprávný průtok v systému sekundárního vstřikování vzduchu",
-	"P0412": "Obvod přepínacího ventilu 'A' systému sekundárního vstřikování vzduchu",
-	"P0413": "Otevřený okruh spínacího ventilu 'A' systému sekundárního vstřikování vzduchu",
-	"P0414": "Zkrat spínacího ventilu 'A' systému sekundárního vstřikování vzduchu",
-	"P0415": "Obvod spínacího ventilu 'B' systému sekundárního vstřikování vzduchu",
-	"P0416": "Otevřený okruh spínacího ventilu 'B' systému sekundárního vstřikování vzduchu",
-	"P0417": "Zkrat spínacího ventilu 'B' systému sekundárního vstřikování vzduchu",
-	"P0418": "Řídicí okruh 'A' systému sekundárního vstřikování vzduchu",
-	"P0419": "Řídicí okruh 'B' systému sekundárního vstřikování vzduchu",
-	"P0420": "Účinnost systému katalyzátoru pod prahovou hodnotou",
-	"P0421": "Účinnost zahřívacího katalyzátoru pod prahovou hodnotou",
-	"P0422": "Účinnost hlavního katalyzátoru pod prahovou hodnotou",
-	"P0423": "Účinnost vyhřívaného katalyzátoru pod prahovou hodnotou",
-	"P0424": "Teplota vyhřívaného katalyzátoru pod prahovou hodnotou",
-	"P0425": "Snímač teploty katalyzátoru",
-	"P0426": "Rozsah/výkon snímače teploty katalyzátoru",
-	"P0427": "Nízký teplotní snímač katalyzátoru",
-	"P0428": "Snímač teploty katalyzátoru vysoký",
-	"P0429": "Řídicí obvod ohřívače katalyzátoru",
-	"P0430": "Účinnost systému katalyzátoru pod prahovou hodnotou",
-	"P0431": "Účinnost zahřívacího katalyzátoru pod prahovou hodnotou",
-	"P0432": "Účinnost hlavního katalyzátoru pod prahovou hodnotou",
-	"P0433": "Účinnost vyhřívaného katalyzátoru pod prahovou hodnotou",
-	"P0434": "Teplota vyhřívaného katalyzátoru pod prahovou hodnotou",
-	"P0435": "Snímač teploty katalyzátoru",
-	"P0436": "Rozsah/výkon snímače teploty katalyzátoru",
-	"P0437": "Nízký teplotní snímač katalyzátoru",
-	"P0438": "Snímač teploty katalyzátoru vysoký",
-	"P0439": "Řídicí obvod ohřívače katalyzátoru",
-	"P0440": "Systém odpařovacích emisí",
-	"P0441": "Systém odpařovacích emisí Nesprávný průtok proplachu",
-	"P0442": "Zjištěna netěsnost systému odpařovacích emisí (malá netěsnost)",
-	"P0443": "Obvod řídicího ventilu proplachovacího systému odpařovacích emisí",
-	"P0444": "Otevřený okruh ventilu proplachování systému odpařovacích emisí",
-	"P0445": "Zkrat řídicího ventilu proplachování výfukových plynů",
-	"P0446": "Řídicí okruh odpařovacích emisí",
-	"P0447": "Otevřený okruh regulace odpařovacích emisí",
-	"P0448": "Zkrat řídicího obvodu odpařovacího systému",
-	"P0449": "Odvzdušňovací ventil/elektromagnetický okruh systému odpařovacích emisí",
-	"P0450": "Snímač/spínač tlaku v systému odpařovacích emisí",
-	"P0451": "Snímač/spínač tlaku v systému odpařovacích emisí Rozsah/výkon",
-	"P0452": "Snímač/spínač tlaku v systému odpařovacích emisí nízký",
-	"P0453": "Snímač/spínač tlaku v systému odpařovacích emisí vysoký",
-	"P0454": "Snímač/spínač tlaku v systému odpařovacích emisí Přerušovaný",
-	"P0455": "Zjištěna netěsnost systému odpařovacích emisí (velká netěsnost)",
-	"P0456": "Zjištěna netěsnost systému odpařovacích emisí (velmi malá netěsnost)",
-	"P0457": "Zjištěn únik z odpařovacího emisního systému (uvolněný/odstraněný uzávěr palivové nádrže)",
-	"P0458": "Nízký obvod ventilu proplachování výfukových plynů",
-	"P0459": "Obvod řídicího ventilu proplachování systému odpařovacích emisí vysoký",
-	"P0460": "Obvod 'A' snímače hladiny paliva",
-	"P0461": "Obvod snímače hladiny paliva 'A' Rozsah/výkon",
-	"P0462": "Nízký stav obvodu snímače hladiny paliva 'A'",
-	"P0463": "Vysoký obvod snímače hladiny paliva 'A'",
-	"P0464": "Obvod snímače hladiny paliva 'A' přerušovaný",
-	"P0465": "Obvod snímače průtoku EVAP",
-	"P0466": "Rozsah/výkon obvodu snímače proplachování EVAP",
-	"P0467": "Nízký obvod snímače průtoku EVAP",
-	"P0468": "Obvod snímače průtoku EVAP vysoký",
-	"P0469": "Přerušovaný obvod snímače průtoku EVAP",
-	"P0470": "Snímač tlaku ve výfuku",
-	"P0471": "Snímač tlaku ve výfuku Rozsah/výkon",
-	"P0472": "Nízký snímač tlaku ve výfuku",
-	"P0473": "Snímač tlaku ve výfuku vysoký",
-	"P0474": "Snímač tlaku ve výfuku Přerušovaný",
-	"P0475": "Regulační ventil výfukového tlaku",
-	"P0476": "Regulační ventil výfukového tlaku Rozsah/výkon",
-	"P0477": "Nízký řídicí ventil výfukového tlaku",
-	"P0478": "Regulační ventil výfukového tlaku High",
-	"P0479": "Přerušovaný ventil regulace tlaku výfukových plynů",
-	"P0480": "Řídicí obvod ventilátoru 1",
-	"P0481": "Řídicí obvod ventilátoru 2",
-	"P0482": "Řídicí obvod ventilátoru 3",
-	"P0483": "Kontrola racionality ventilátoru",
-	"P0484": "Nadměrný proud v obvodu ventilátoru",
-	"P0485": "Napájení ventilátoru/zemní obvod",
-	"P0486": "Obvod B snímače recirkulace výfukových plynů",
-	"P0487": "Obvod řízení polohy škrticí klapky recirkulace výfukových plynů",
-	"P0488": "Recirkulace výfukových plynů Řízení polohy škrticí klapky Rozsah/výkon",
-	"P0489": "Nízký řídicí obvod recirkulace výfukových plynů",
-	"P0490": "Řídicí obvod recirkulace výfukových plynů vysoký",
-	"P0491": "Nedostatečný průtok sekundárního vstřikování vzduchu",
-	"P0492": "Nedostatečný průtok sekundárního vstřikování vzduchu",
-	"P0493": "Nadměrné otáčky ventilátoru",
-	"P0494": "Nízká rychlost ventilátoru",
-	"P0495": "Vysoká rychlost ventilátoru",
-	"P0496": "Vysoký průtok odpařovacího systému",
-	"P0497": "Systém odpařovacích emisí s nízkým průtokem proplachu",
-	"P0498": "Nízký řídicí obvod ventilu odpařovacích emisí",
-	"P0499": "Vysoký řídicí obvod ventilu odpařovacích emisí",
-	"P0500": "Snímač rychlosti vozidla 'A'",
-	"P0501": "Snímač rychlosti vozidla 'A' Rozsah/výkon",
-	"P0502": "Nízký vstup obvodu 'A' snímače rychlosti vozidla",
-	"P0503": "Snímač rychlosti vozidla 'A' Přerušovaný/nepravidelný/vysoký",
-	"P0504": "Korelace brzdového spínače 'A'/'B'",
-	"P0505": "Systém regulace volnoběžných otáček",
-	"P0506": "Nižší než očekávané otáčky systému regulace volnoběžných otáček",
-	"P0507": "Otáčky systému regulace volnoběžných otáček vyšší, než se očekávalo",
-	"P0508": "Nízký obvod systému řízení volnoběžných otáček",
-	"P0509": "Obvod systému řízení volnoběžných otáček vysoký",
-	"P0510": "Zavřený spínač polohy škrticí klapky",
-	"P0511": "Obvod řízení volnoběžných otáček",
-	"P0512": "Obvod požadavku na startér",
-	"P0513": "Nesprávný klíč k imobilizéru",
-	"P0514": "Rozsah/výkon obvodu snímače teploty baterie",
-	"P0515": "Obvod snímače teploty baterie",
-	"P0516": "Nízký stav obvodu snímače teploty baterie",
-	"P0517": "Vysoký obvod snímače teploty baterie",
-	"P0518": "Obvod regulace volnoběžného vzduchu Přerušovaný",
-	"P0519": "Výkon systému regulace volnoběžných otáček",
-	"P0520": "Obvod snímače/spínače tlaku motorového oleje",
-	"P0521": "Snímač/spínač tlaku motorového oleje Rozsah/výkon",
-	"P0522": "Nízké napětí snímače/spínače tlaku motorového oleje",
-	"P0523": "Snímač/spínač tlaku motorového oleje Vysoké napětí",
-	"P0524": "Příliš nízký tlak motorového oleje",
-	"P0525": "Řídicí obvod servořízení tempomatu Rozsah/výkon",
-	"P0526": "Obvod snímače otáček ventilátoru",
-	"P0527": "Rozsah/výkon obvodu snímače otáček ventilátoru",
-	"P0528": "Obvod snímače otáček ventilátoru bez signálu",
-	"P0529": "Přerušovaný obvod snímače otáček ventilátoru",
-	"P0530": "Obvod 'A' snímače tlaku chladiva klimatizace",
-	"P0531": "Snímač tlaku chladiva v okruhu 'A' klimatizace Rozsah/výkon",
-	"P0532": "Snímač tlaku chladiva v klimatizační jednotce 'A' je nízký",
-	"P0533": "Vysoký obvod čidla tlaku chladiva klimatizace 'A'",
-	"P0534": "Úbytek chladiva v klimatizačním zařízení",
-	"P0535": "Obvod snímače teploty výparníku klimatizace",
-	"P0536": "Rozsah/výkon obvodu snímače teploty výparníku klimatizace",
-	"P0537": "Nízký obvod snímače teploty výparníku klimatizace",
-	"P0538": "Vysoký obvod snímače teploty výparníku klimatizace",
-	"P0539": "Obvod snímače teploty výparníku klimatizace Přerušovaný provoz",
-	"P0540": "Okruh A ohřívače nasávaného vzduchu",
-	"P0541": "Nízký stav okruhu ohřívače nasávaného vzduchu 'A'",
-	"P0542": "Okruh ohřívače nasávaného vzduchu 'A' vysoký",
-	"P0543": "Otevřený okruh ohřívače nasávaného vzduchu 'A'",
-	"P0544": "Obvod snímače teploty výfukových plynů",
-	"P0545": "Nízký obvod snímače teploty výfukových plynů",
-	"P0546": "Vysoký obvod snímače teploty výfukových plynů",
-	"P0547": "Obvod snímače teploty výfukových plynů",
-	"P0548": "Nízký obvod snímače teploty výfukových plynů",
-	"P0549": "Vysoký obvod snímače teploty výfukových plynů",
-	"P0550": "Obvod snímače/spínače tlaku posilovače řízení",
-	"P0551": "Snímač tlaku posilovače řízení/spínač obvodu Rozsah/výkon",
-	"P0552": "Snímač tlaku posilovače řízení/obvod přepínače s nízkým vstupem",
-	"P0553": "Obvod snímače tlaku posilovače řízení/spínače s vysokým vstupem",
-	"P0554": "Obvod snímače tlaku posilovače řízení/spínače přerušovaný",
-	"P0555": "Obvod snímače tlaku v posilovači brzd",
-	"P0556": "Obvod snímače tlaku v posilovači brzd Rozsah/výkon",
-	"P0557": "Obvod snímače tlaku v posilovači brzd Nízký vstup",
-	"P0558": "Obvod snímače tlaku v posilovači brzd Vysoký vstup",
-	"P0559": "Obvod snímače tlaku v posilovači brzd Přerušovaný",
-	"P0560": "Napětí systému",
-	"P0561": "Nestabilní napětí systému",
-	"P0562": "Nízké napětí systému",
-	"P0563": "Vysoké napětí systému",
-	"P0564": "Multifunkční vstupní obvod 'A' tempomatu",
-	"P0565": "Signál zapnutého tempomatu",
-	"P0566": "Signál vypnutí tempomatu",
-	"P0567": "Signál obnovení tempomatu",
-	"P0568": "Signál nastavení tempomatu",
-	"P0569": "Tempomat Pobřežní signál",
-	"P0570": "Tempomat Signál zrychlení",
-	"P0571": "Obvod brzdového spínače 'A'",
-	"P0572": "Nízký obvod brzdového spínače 'A'",
-	"P0573": "Obvod brzdového spínače 'A' vysoký",
-	"P0574": "Tempomat - příliš vysoká rychlost vozidla",
-	"P0575": "Vstupní obvod tempomatu",
-	"P0576": "Nízký vstupní obvod tempomatu",
-	"P0577": "Vysoký vstupní obvod tempomatu",
-	"P0578": "Zaseknutý obvod multifunkčního vstupu 'A' tempomatu",
-	"P0579": "Multifunkční vstupní obvod 'A' tempomatu Rozsah/výkon",
-	"P0580": "Nízký obvod multifunkčního vstupu 'A' tempomatu",
-	"P0581": "Multifunkční vstupní obvod 'A' tempomatu vysoký",
-	"P0582": "Vakuový obvod ovládání tempomatu/otevřeno",
-	"P0583": "Nízký obvod vakuového ovládání tempomatu",
-	"P0584": "Obvod vakuového ovládání tempomatu High",
-	"P0585": "Korelace multifunkčního vstupu 'A'/'B' tempomatu",
-	"P0586": "Obvod ovládání ventilace tempomatu/otevřený",
-	"P0587": "Nízký obvod řízení ventilace tempomatu",
-	"P0588": "Obvod řízení ventilace tempomatu vysoký",
-	"P0589": "Multifunkční vstupní obvod 'B' tempomatu",
-	"P0590": "Zaseknutý obvod multifunkčního vstupu 'B' tempomatu",
-	"P0591": "Multifunkční vstupní obvod 'B' tempomatu Rozsah/výkon",
-	"P0592": "Nízký obvod multifunkčního vstupu 'B' tempomatu",
-	"P0593": "Multifunkční vstupní obvod 'B' tempomatu vysoký",
-	"P0594": "Řídicí obvod servořízení tempomatu/otevřeno",
-	"P0595": "Nízký obvod ovládání tempomatu",
-	"P0596": "Obvod řízení tempomatu High",
-	"P0597": "Řídicí obvod/otevřený okruh termostatu ohřívače",
-	"P0598": "Nízký řídicí obvod termostatu",
-	"P0599": "Řídicí obvod termostatu topení High",
-	"P0600": "Sériové komunikační spojení",
-	"P0601": "Chyba součtu kontrol paměti interního řídicího modulu",
-	"P0602": "Chyba programování řídicího modulu",
-	"P0603": "Chyba interního řídicího modulu Keep Alive Memory (KAM)",
-	"P0604": "Chyba interního řídicího modulu paměti s náhodným přístupem (RAM)",
-	"P0605": "Chyba interní řídicí paměti (ROM)",
-	"P0606": "Procesor ECM/PCM",
-	"P0607": "Výkon řídicího modulu",
-	"P0608": "Výstup VSS řídicího modulu 'A'",
-	"P0609": "Výstup VSS řídicího modulu 'B'",
-	"P0610": "Chyba řídicího modulu Možnosti vozidla",
-	"P0611": "Řídicí modul vstřikovače paliva Performance",
-	"P0612": "Řídicí modul vstřikovače paliva Řídicí relé",
-	"P0613": "Procesor TCM",
-	"P0614": "Nekompatibilní ECM / TCM",
-	"P0615": "Obvod startovacího relé",
-	"P0616": "Nízký obvod relé startéru",
-	"P0617": "Vysoký obvod relé startéru",
-	"P0618": "Chyba řídicího modulu alternativního paliva KAM",
-	"P0619": "Chyba RAM/ROM řídicího modulu alternativního paliva",
-	"P0620": "Řídicí obvod generátoru",
-	"P0621": "Svorkovnice generátoru/L Obvod svorkovnice",
-	"P0622": "Svorkovnice generátoru Pole/F",
-	"P0623": "Řídicí obvod lampy generátoru",
-	"P0624": "Obvod ovládání kontrolky víčka palivové nádrže",
-	"P0625": "Nízký obvod svorky generátoru Field/F",
-	"P0626": "Obvod svorek generátoru Field/F High",
-	"P0627": "Řídicí obvod palivového čerpadla 'A' /otevřeno",
-	"P0628": "Nízký řídicí obvod palivového čerpadla 'A'",
-	"P0629": "Vysoký řídicí obvod palivového čerpadla 'A'",
-	"P0630": "VIN není naprogramován nebo je nekompatibilní - ECM/PCM",
-	"P0631": "VIN není naprogramován nebo je nekompatibilní - TCM",
-	"P0632": "Nenaprogramovaný tachometr - ECM/PCM",
-	"P0633": "Klíč imobilizéru není naprogramován - ECM/PCM",
-	"P0634": "Příliš vysoká vnitřní teplota PCM/ECM/TCM",
-	"P0635": "Řídicí obvod posilovače řízení",
-	"P0636": "Nízký řídicí obvod posilovače řízení",
-	"P0637": "Řídicí obvod posilovače řízení vysoký",
-	"P0638": "Rozsah/výkon ovládání škrticí klapky",
-	"P0639": "Rozsah/výkon ovládání škrticí klapky",
-	"P0640": "Řídicí obvod ohřívače nasávaného vzduchu",
-	"P0641": "Referenční napětí snímače 'A' Obvod/Open",
-	"P0642": "Nízké referenční napětí obvodu 'A' snímače",
-	"P0643": "Referenční napětí snímače 'A' Obvod High",
-	"P0644": "Řidič Displej Sériový komunikační obvod",
-	"P0645": "Řídicí obvod relé spojky klimatizace",
-	"P0646": "Nízký řídicí obvod relé spojky klimatizace",
-	"P0647": "Řídicí obvod relé spojky klimatizace vysoký",
-	"P0648": "Obvod řízení světel imobilizéru",
-	"P0649": "Řídicí obvod lampy pro regulaci otáček",
-	"P0650": "Řídicí obvod kontrolky poruchy (MIL)",
-	"P0651": "Referenční napětí snímače 'B' Obvod/Open",
-	"P0652": "Nízké referenční napětí obvodu 'B' snímače",
-	"P0653": "Referenční napětí snímače 'B' Obvod High",
-	"P0654": "Výstupní obvod otáček motoru",
-	"P0655": "Řídicí obvod výstupu horké žárovky motoru",
-	"P0656": "Výstupní obvod hladiny paliva",
-	"P0657": "Napájecí napětí akčního členu 'A' obvod/otevřeno",
-	"P0658": "Nízké napájecí napětí obvodu 'A' akčního členu",
-	"P0659": "Vysoké napájecí napětí obvodu 'A' akčního členu",
-	"P0660": "Řídicí obvod/otevřený okruh sacího ventilu",
-	"P0661": "Nízký řídicí obvod sacího potrubí pro ladění ventilů",
-	"P0662": "Řídicí obvod ventilu sacího potrubí High",
-	"P0663": "Řídicí obvod/otevřený okruh sacího ventilu",
-	"P0664": "Nízký řídicí obvod sacího potrubí pro ladění ventilů",
-	"P0665": "Řídicí obvod ventilu sacího potrubí High",
-	"P0666": "Obvod snímače vnitřní teploty PCM/ECM/TCM",
-	"P0667": "Rozsah/výkon čidla vnitřní teploty PCM/ECM/TCM",
-	"P0668": "Nízký obvod snímače vnitřní teploty PCM/ECM/TCM",
-	"P0669": "Vysoký obvod snímače vnitřní teploty PCM/ECM/TCM",
-	"P0670": "Řídicí obvod modulu žhavicích svíček",
-	"P0671": "Obvod žhavicích svíček válce 1",
-	"P0672": "Obvod žhavicích svíček válce 2",
-	"P0673": "Obvod žhavicích svíček válce 3",
-	"P0674": "Obvod žhavicích svíček válce 4",
-	"P0675": "Obvod žhavicích svíček válce 5",
-	"P0676": "Obvod žhavicích svíček válce 6",
-	"P0677": "Obvod žhavicích svíček válce 7",
-	"P0678": "Obvod žhavicích svíček válce 8",
-	"P0679": "Obvod žhavicích svíček válce 9",
-	"P0680": "Obvod žhavicích svíček válce 10",
-	"P0681": "Obvod žhavicích svíček válce 11",
-	"P0682": "Obvod žhavicích svíček válce 12",
-	"P0683": "Komunikační obvod řídicího modulu žhavicích svíček s PCM",
-	"P0684": "Komunikační obvod řídicího modulu žhavicích svíček s PCM Rozsah/výkon",
-	"P0685": "Řídicí obvod výkonového relé ECM/PCM /otevřeno",
-	"P0686": "Řídicí obvod relé ECM/PCM Power Low",
-	"P0687": "Řídicí obvod výkonového relé ECM/PCM vysoký",
-	"P0688": "Senzorový obvod výkonového relé ECM/PCM /otevřeno",
-	"P0689": "Senzorový obvod napájecího relé ECM/PCM nízký",
-	"P0690": "Senzorový obvod výkonového relé ECM/PCM vysoký",
-	"P0691": "Nízký řídicí obvod ventilátoru 1",
-	"P0692": "Řídicí obvod ventilátoru 1 vysoký",
-	"P0693": "Nízký řídicí obvod ventilátoru 2",
-	"P0694": "Řídicí obvod ventilátoru 2 vysoký",
-	"P0695": "Nízký řídicí obvod ventilátoru 3",
-	"P0696": "Řídicí obvod ventilátoru 3 vysoký",
-	"P0697": "Referenční napětí snímače 'C' Obvod/Open",
-	"P0698": "Referenční napětí snímače 'C' obvodu nízké",
-	"P0699": "Referenční napětí snímače 'C' obvodu vysoké",
-	"P0700": "Systém řízení přenosu (požadavek MIL)",
-	"P0701": "Řídicí systém převodovky Rozsah/výkon",
-	"P0702": "Řídicí systém převodovky Elektrický",
-	"P0703": "Obvod brzdového spínače 'B'",
-	"P0704": "Porucha vstupního obvodu spínače spojky",
-	"P0705": "Porucha obvodu snímače rozsahu převodovky (vstup PRNDL)",
-	"P0706": "Obvod snímače rozsahu převodovky Rozsah/výkon",
-	"P0707": "Nízký obvod snímače rozsahu převodovky",
-	"P0708": "Vysoký obvod snímače rozsahu převodovky",
-	"P0709": "Přerušovaný obvod snímače rozsahu převodovky",
-	"P0710": "Obvod 'A' snímače teploty převodové kapaliny",
-	"P0711": "Snímač teploty převodové kapaliny 'A' Rozsah/výkon obvodu",
-	"P0712": "Nízký obvod snímače teploty převodové kapaliny 'A'",
-	"P0713": "Vysoký obvod snímače teploty převodové kapaliny 'A'",
-	"P0714": "Obvod snímače teploty převodové kapaliny 'A' Přerušovaný provoz",
-	"P0715": "Vstupní obvod/obvod snímače otáček turbíny 'A'",
-	"P0716": "Rozsah/výkon vstupního obvodu/obvodu snímače otáček turbíny 'A'",
-	"P0717": "Vstupní obvod/obvod snímače otáček turbíny 'A' bez signálu",
-	"P0718": "Obvod 'A' vstupního snímače otáček/turbíny Přerušovaný provoz",
-	"P0719": "Nízký obvod brzdového spínače 'B'",
-	"P0720": "Výstupní obvod snímače otáček",
-	"P0721": "Rozsah/výkon výstupního obvodu snímače otáček",
-	"P0722": "Výstupní obvod snímače rychlosti bez signálu",
-	"P0723": "Přerušovaný obvod výstupního snímače otáček",
-	"P0724": "Obvod brzdového spínače 'B' vysoký",
-	"P0725": "Vstupní obvod otáček motoru",
-	"P0726": "Rozsah/výkon vstupního obvodu otáček motoru",
-	"P0727": "Vstupní obvod otáček motoru bez signálu",
-	"P0728": "Vstupní obvod otáček motoru přerušovaný",
-	"P0729": "Nesprávný převodový poměr převodovky 6",
-	"P0730": "Nesprávný převodový poměr",
-	"P0731": "Nesprávný převodový poměr převodovky 1",
-	"P0732": "Nesprávný převodový poměr převodovky 2",
-	"P0733": "Nesprávný převodový poměr převodovky 3",
-	"P0734": "Nesprávný převodový poměr převodovky 4",
-	"P0735": "Nesprávný převodový poměr převodovky 5",
-	"P0736": "Obrácený nesprávný poměr",
-	"P0737": "Výstupní obvod otáček motoru TCM",
-	"P0738": "Nízký výstupní obvod otáček motoru TCM",
-	"P0739": "Vysoký výstupní obvod otáček motoru TCM",
-	"P0740": "Obvod spojky měniče krouticího momentu/otevřený",
-	"P0741": "Obvod spojky měniče krouticího momentu Výkon nebo zaseknuté vypnutí",
-	"P0742": "Zapnutý obvod spojky měniče točivého momentu",
-	"P0743": "Obvod spojky měniče krouticího momentu Elektrický obvod",
-	"P0744": "Obvod spojky měniče krouticího momentu Přerušovaný",
-	"P0745": "Solenoid pro regulaci tlaku 'A'",
-	"P0746": "Výkon nebo zaseknutí ovládacího elektromagnetu 'A'",
-	"P0747": "Zaseknutý elektromagnetický ventil regulace tlaku 'A'",
-	"P0748": "Elektrická ovládací cívka tlaku 'A'",
-	"P0749": "Elektromagnetická cívka regulace tlaku 'A' Přerušovaná",
-	"P0750": "Řadicí cívka 'A'",
-	"P0751": "Výkonnost nebo zaseknutí elektromagnetické cívky řazení 'A' ve vypnutém stavu",
-	"P0752": "Zapnutý elektromagnetický ventil řazení 'A'",
-	"P0753": "Elektrický obvod elektromagnetické cívky řazení 'A'",
-	"P0754": "Přerušovaný elektromagnet řazení 'A'",
-	"P0755": "Řadicí cívka 'B'",
-	"P0756": "Výkonnost nebo zaseknutí elektromagnetické cívky řazení 'B' ve vypnutém stavu",
-	"P0757": "Zapnutý elektromagnetický ventil řazení 'B'",
-	"P0758": "Elektrický obvod elektromagnetické cívky řazení 'B'",
-	"P0759": "Přerušovaný elektromagnetický ventil řazení 'B'",
-	"P0760": "Řadicí cívka 'C'",
-	"P0761": "Výkonnost nebo zaseknutí elektromagnetické cívky řazení 'C' ve vypnutém stavu",
-	"P0762": "Zapnutý elektromagnetický ventil řazení 'C'",
-	"P0763": "Elektrická cívka řazení 'C'",
-	"P0764": "Přerušovaný elektromagnet řazení 'C'",
-	"P0765": "Řadicí cívka 'D'",
-	"P0766": "Výkonnost nebo zaseknutí elektromagnetu řazení 'D' ve vypnutém stavu",
-	"P0767": "Zapnutý elektromagnetický ventil řazení 'D'",
-	"P0768": "Elektrická cívka řazení 'D'",
-	"P0769": "Přerušovaný elektromagnetický ventil řazení 'D'",
-	"P0770": "Řadicí cívka 'E'",
-	"P0771": "Výkon nebo zaseknutí vypnutého elektromagnetu řazení 'E'",
-	"P0772": "Zapnutý elektromagnetický ventil řazení 'E'",
-	"P0773": "Elektrická cívka řazení 'E'",
-	"P0774": "Přerušovaný elektromagnetický ventil řazení 'E'",
-	"P0775": "Solenoid pro regulaci tlaku 'B'",
-	"P0776": "Výkon nebo zaseknutí ovládacího elektromagnetu 'B'",
-	"P0777": "Zaseknutý elektromagnetický ventil regulace tlaku 'B'",
-	"P0778": "Elektrická ovládací cívka tlaku 'B'",
-	"P0779": "Elektromagnetický ventil pro regulaci tlaku 'B' Přerušovaný",
-	"P0780": "Chyba posunu",
-	"P0781": "1-2 směna",
-	"P0782": "2-3 směny",
-	"P0783": "3-4 směna",
-	"P0784": "4-5 směna",
-	"P0785": "Solenoid pro řazení/časování",
-	"P0786": "Rozsah/výkon cívky pro řazení/časování",
-	"P0787": "Nízký stav cívky řazení/časování",
-	"P0788": "Solenoid řazení/časování vysoký",
-	"P0789": "Přerušovaná cívka řazení/časování",
-	"P0790": "Normální/výkonnostní spínací obvod",
-	"P0791": "Obvod snímače otáček mezinápravového hřídele 'A'",
-	"P0792": "Snímač otáček mezinápravového hřídele 'A' Rozsah/výkon obvodu",
-	"P0793": "Obvod 'A' snímače otáček mezinápravového hřídele bez signálu",
-	"P0794": "Obvod snímače otáček mezinápravového hřídele 'A' přerušovaný",
-	"P0795": "Solenoid pro regulaci tlaku 'C'",
-	"P0796": "Výkon nebo zaseknutí ovládacího elektromagnetu 'C'",
-	"P0797": "Zaseknutý elektromagnetický ventil regulace tlaku 'C'",
-	"P0798": "Elektrická ovládací cívka tlaku 'C'",
-	"P0799": "Elektromagnetický ventil pro regulaci tlaku 'C' Přerušovaný",
-	"P0800": "Systém řízení převodovky (požadavek MIL)",
-	"P0801": "Řídicí obvod zpětné inhibice",
-	"P0802": "Řídicí systém přenosu MIL Request Circuit/Open",
-	"P0803": "1-4 Obvod ovládání elektromagnetického obvodu pro řazení nahoru (přeskočení řazení)",
-	"P0804": "1-4 Obvod ovládání světelného zdroje s posunem nahoru (Skip Shift)",
-	"P0805": "Obvod snímače polohy spojky",
-	"P0806": "Rozsah/výkon obvodu snímače polohy spojky",
-	"P0807": "Nízký obvod snímače polohy spojky",
-	"P0808": "Vysoký obvod snímače polohy spojky",
-	"P0809": "Přerušovaný obvod snímače polohy spojky",
-	"P0810": "Chyba ovládání polohy spojky",
-	"P0811": "Nadměrný prokluz spojky",
-	"P0812": "Reverzní vstupní obvod",
-	"P0813": "Reverzní výstupní obvod",
-	"P0814": "Obvod zobrazení rozsahu přenosu",
-	"P0815": "Obvod přepínače Upshift",
-	"P0816": "Obvod spínače řazení dolů",
-	"P0817": "Obvod pro vypnutí startéru",
-	"P0818": "Vstupní obvod odpojovače hnacího ústrojí",
-	"P0819": "Vztah mezi přepínačem řazení nahoru a dolů a rozsahem převodovky",
-	"P0820": "Obvod snímače polohy X-Y řadicí páky",
-	"P0821": "Obvod polohy X řadicí páky",
-	"P0822": "Obvod polohy Y řadicí páky",
-	"P0823": "Obvod polohy X řadicí páky přerušovaný",
-	"P0824": "Obvod polohy Y řadicí páky přerušovaný",
-	"P0825": "Přepínač řadicí páky Push-Pull (předvídání řazení)",
-	"P0826": "Obvod přepínače řazení nahoru a dolů",
-	"P0827": "Nízký obvod přepínače řazení nahoru a dolů",
-	"P0828": "Obvod přepínače řazení nahoru a dolů High",
-	"P0829": "5-6 směna",
-	"P0830": "Obvod 'A' spínače pedálu spojky",
-	"P0831": "Nízký obvod spínače pedálu spojky 'A'",
-	"P0832": "Vysoký obvod spínače pedálu spojky 'A'",
-	"P0833": "Obvod 'B' spínače pedálu spojky",
-	"P0834": "Nízký obvod spínače spojkového pedálu 'B'",
-	"P0835": "Vysoký obvod spínače spojkového pedálu 'B'",
-	"P0836": "Obvod spínače pohonu všech kol (4WD)",
-	"P0837": "Obvod přepínače pohonu všech kol (4WD) Rozsah/výkon",
-	"P0838": "Obvod spínače pohonu všech kol (4WD) Nízká úroveň",
-	"P0839": "Obvod spínače pohonu všech kol (4WD) High (vysoký)",
-	"P0840": "Snímač tlaku převodové kapaliny/spínač obvodu 'A'",
-	"P0841": "Snímač tlaku převodové kapaliny/spínač 'A' Rozsah/výkon obvodu",
-	"P0842": "Nízký obvod snímače tlaku převodové kapaliny/spínače 'A'",
-	"P0843": "Vysoký obvod snímače tlaku převodové kapaliny/spínače 'A'",
-	"P0844": "Snímač tlaku převodové kapaliny/spínač 'A' Obvod přerušovaný",
-	"P0845": "Snímač tlaku převodové kapaliny/spínač obvodu 'B'",
-	"P0846": "Snímač tlaku převodové kapaliny/spínač obvodu 'B' Rozsah/výkonnost",
-	"P0847": "Nízký obvod snímače tlaku převodové kapaliny/spínače 'B'",
-	"P0848": "Vysoký obvod snímače tlaku převodové kapaliny/spínače 'B'",
-	"P0849": "Snímač tlaku převodové kapaliny/spínač 'B' Obvod přerušovaný",
-	"P0850": "Vstupní obvod parkovacího/neutrálního spínače",
-	"P0851": "Nízký vstupní obvod parkovacího/neutrálního spínače",
-	"P0852": "Vysoký vstupní obvod parkovacího/neutrálního spínače",
-	"P0853": "Vstupní obvod spínače pohonu",
-	"P0854": "Vstupní obvod spínače pohonu nízký",
-	"P0855": "Vstupní obvod spínače pohonu High",
-	"P0856": "Vstupní signál řízení trakce",
-	"P0857": "Rozsah/výkon vstupního signálu řízení trakce",
-	"P0858": "Nízký vstupní signál řízení trakce",
-	"P0859": "Vysoký vstupní signál řízení trakce",
-	"P0860": "Komunikační obvod modulu řazení",
-	"P0861": "Nízký komunikační obvod modulu řazení",
-	"P0862": "Komunikační obvod modulu řazení vysokého stupně",
-	"P0863": "Komunikační obvod TCM",
-	"P0864": "Rozsah/výkon komunikačního obvodu TCM",
-	"P0865": "Nízký komunikační obvod TCM",
-	"P0866": "Komunikační obvod TCM High",
-	"P0867": "Tlak převodové kapaliny",
-	"P0868": "Nízký tlak převodové kapaliny",
-	"P0869": "Vysoký tlak převodové kapaliny",
-	"P0870": "Snímač tlaku převodové kapaliny/spínač obvodu 'C'",
-	"P0871": "Snímač tlaku převodové kapaliny/spínač 'C' Rozsah/výkon obvodu",
-	"P0872": "Nízký obvod snímače tlaku převodové kapaliny/spínače 'C'",
-	"P0873": "Vysoký obvod snímače tlaku převodové kapaliny/spínače 'C'",
-	"P0874": "Snímač tlaku převodové kapaliny/spínač 'C' Obvod přerušovaný",
-	"P0875": "Snímač tlaku převodové kapaliny/spínač obvodu 'D'",
-	"P0876": "Snímač tlaku převodové kapaliny/spínač obvodu 'D' Rozsah/výkonnost",
-	"P0877": "Snímač tlaku převodové kapaliny / obvod spínače 'D' nízký",
-	"P0878": "Vysoký obvod snímače tlaku převodové kapaliny/spínače 'D'",
-	"P0879": "Snímač tlaku převodové kapaliny/spínač 'D' Obvod přerušovaný",
-	"P0880": "Vstupní napájecí signál TCM",
-	"P0881": "Rozsah/výkon vstupního signálu TCM",
-	"P0882": "Nízký vstupní napájecí signál TCM",
-	"P0883": "Vysoký vstupní signál TCM",
-	"P0884": "Přerušovaný vstupní napájecí signál TCM",
-	"P0885": "Řídicí obvod relé napájení TCM/otevřeno",
-	"P0886": "Nízký řídicí obvod napájecího relé TCM",
-	"P0887": "Řídicí obvod napájecího relé TCM High",
-	"P0888": "Senzorový obvod napájecího relé TCM",
-	"P0889": "Snímací obvod výkonového relé TCM Rozsah/výkon",
-	"P0890": "Nízký obvod snímače napájecího relé TCM",
-	"P0891": "Senzorový obvod napájecího relé TCM vysoký",
-	"P0892": "Přerušovaný obvod snímače napájecího relé TCM",
-	"P0893": "Zapojení více převodových stupňů",
-	"P0894": "Prokluzování součásti převodovky",
-	"P0895": "Příliš krátká doba směny",
-	"P0896": "Příliš dlouhá doba směny",
-	"P0897": "Zhoršená kvalita převodové kapaliny",
-	"P0898": "Nízký obvod požadavku MIL systému řízení přenosu",
-	"P0899": "Obvod požadavku na MIL systému řízení přenosu vysoký",
-	"P0900": "Obvod spojkového pohonu/otevřený",
-	"P0901": "Rozsah/výkon obvodu spojkového pohonu",
-	"P0902": "Nízký stav obvodu spojkového pohonu",
-	"P0903": "Vysoký obvod spojkového pohonu",
-	"P0904": "Obvod volby polohy brány",
-	"P0905": "Rozsah/výkon obvodu volby polohy brány",
-	"P0906": "Obvod volby polohy brány Low",
-	"P0907": "Obvod volby polohy brány High",
-	"P0908": "Obvod volby polohy brány přerušovaný",
-	"P0909": "Chyba řízení výběru brány",
-	"P0910": "Obvod pohonu volby brány/otevření",
-	"P0911": "Rozsah/výkon obvodu aktuátoru Gate Select",
-	"P0912": "Nízký obvod pohonu volby brány",
-	"P0913": "Vysoký obvod pohonu volby brány",
-	"P0914": "Obvod pro řazení rychlostních stupňů",
-	"P0915": "Rozsah/výkon obvodu řazení rychlostních stupňů",
-	"P0916": "Obvod polohy řazení nízké",
-	"P0917": "Obvod pro řazení rychlostních stupňů High",
-	"P0918": "Obvod polohy řazení přerušovaný",
-	"P0919": "Chyba kontroly polohy řazení",
-	"P0920": "Okruh/otevřený ovladač řazení rychlostních stupňů dopředu",
-	"P0921": "Rozsah/výkon obvodu řadicí páky pro řazení dopředu",
-	"P0922": "Nízký obvod ovládání řadicí páky dopředu",
-	"P0923": "Obvod řadicí páky pro řazení vpřed vysoký",
-	"P0924": "Obvod/otevřený obvod zpětného chodu řadicí páky",
-	"P0925": "Rozsah/výkon obvodu ovládání zpětného chodu řadicí páky",
-	"P0926": "Nízký obvod ovládání zpětného chodu řadicí páky",
-	"P0927": "Obvod reverzace řadicí páky vysoký",
-	"P0928": "Ovládací obvod elektromagnetického zámku řazení/otevřeno",
-	"P0929": "Řídicí obvod elektromagnetického zámku řazení Rozsah/výkon",
-	"P0930": "Nízká úroveň ovládacího obvodu elektromagnetického zámku řazení",
-	"P0931": "Vysoký řídicí obvod elektromagnetického zámku řazení",
-	"P0932": "Obvod snímače hydraulického tlaku",
-	"P0933": "Rozsah/výkon hydraulického snímače tlaku",
-	"P0934": "Nízký obvod snímače hydraulického tlaku",
-	"P0935": "Vysoký obvod snímače hydraulického tlaku",
-	"P0936": "Přerušovaný obvod snímače hydraulického tlaku",
-	"P0937": "Obvod snímače teploty hydraulického oleje",
-	"P0938": "Rozsah/výkon čidla teploty hydraulického oleje",
-	"P0939": "Nízký obvod snímače teploty hydraulického oleje",
-	"P0940": "Vysoký obvod snímače teploty hydraulického oleje",
-	"P0941": "Přerušovaný obvod snímače teploty hydraulického oleje",
-	"P0942": "Hydraulická tlaková jednotka",
-	"P0943": "Příliš krátká doba cyklování hydraulické tlakové jednotky",
-	"P0944": "Hydraulická tlaková jednotka Ztráta tlaku",
-	"P0945": "Obvod relé hydraulického čerpadla/rozpojení",
-	"P0946": "Rozsah/výkon obvodu relé hydraulického čerpadla",
-	"P0947": "Nízký obvod relé hydraulického čerpadla",
-	"P0948": "Vysoký obvod relé hydraulického čerpadla",
-	"P0949": "Automatické řazení Manuální adaptivní učení není dokončeno",
-	"P0950": "Obvod automatického manuálního řazení",
-	"P0951": "Automatické řazení Ruční ovládání Obvod Rozsah/výkon",
-	"P0952": "Obvod automatického manuálního řazení Nízká",
-	"P0953": "Automatické řazení Manuální ovládací obvod Vysoký",
-	"P0954": "Automatické řazení Manuální ovládací obvod Přerušovaný",
-	"P0955": "Obvod pro automatické řazení v manuálním režimu",
-	"P0956": "Automatické řazení Manuální režim Rozsah/výkon okruhu",
-	"P0957": "Automatické řazení Manuální režim Obvod nízký",
-	"P0958": "Automatické řazení Manuální režim Obvod High",
-	"P0959": "Automatické řazení Manuální režim Přerušovaný okruh",
-	"P0960": "Řídicí obvod/otevřený okruh ovládacího elektromagnetu 'A' pro regulaci tlaku",
-	"P0961": "Ovládací obvod ovládacího elektromagnetu 'A' Rozsah/výkon",
-	"P0962": "Nízký řídicí okruh ovládacího elektromagnetu 'A'",
-	"P0963": "Řídicí obvod ovládacího elektromagnetu 'A' Vysoký",
-	"P0964": "Řídicí obvod ovládacího elektromagnetu 'B'/otevřeno",
-	"P0965": "Ovládací obvod elektromagnetu 'B' Rozsah/výkonnost",
-	"P0966": "Nízký řídicí okruh ovládacího elektromagnetu 'B'",
-	"P0967": "Řídicí obvod elektromagnetu 'B' pro regulaci tlaku High (vysoký)",
-	"P0968": "Řídicí obvod C ovládacího elektromagnetu 'C'/otevřeno",
-	"P0969": "Řídicí obvod elektromagnetu 'C' Rozsah/výkon",
-	"P0970": "Nízký řídicí obvod elektromagnetu 'C' pro regulaci tlaku",
-	"P0971": "Ovládací obvod elektromagnetu 'C' Vysoký tlak",
-	"P0972": "Řídicí obvod elektromagnetu řazení 'A' Rozsah/výkon",
-	"P0973": "Řídicí obvod elektromagnetické cívky řazení 'A' nízký",
-	"P0974": "Řídicí obvod elektromagnetické cívky řazení 'A' vysoký",
-	"P0975": "Řídicí obvod elektromagnetu řazení 'B' Rozsah/výkon",
-	"P0976": "Řídicí obvod elektromagnetu řazení 'B' nízký",
-	"P0977": "Řídicí obvod elektromagnetu řazení 'B' vysoký",
-	"P0978": "Řídicí obvod elektromagnetu řazení 'C' Rozsah/výkon",
-	"P0979": "Nízký řídicí obvod elektromagnetické cívky řazení 'C'",
-	"P0980": "Řídicí obvod elektromagnetické cívky 'C' vysoký",
-	"P0981": "Řídicí obvod elektromagnetu řazení 'D' Rozsah/výkon",
-	"P0982": "Nízký řídicí obvod elektromagnetu řazení 'D'",
-	"P0983": "Řídicí obvod elektromagnetu řazení 'D' vysoký",
-	"P0984": "Řídicí obvod elektromagnetu řazení 'E' Rozsah/výkon",
-	"P0985": "Nízký řídicí obvod elektromagnetu řazení 'E'",
-	"P0986": "Řídicí obvod elektromagnetické cívky 'E' vysoký",
-	"P0987": "Obvod snímače tlaku převodové kapaliny/spínače 'E'",
-	"P0988": "Snímač tlaku převodové kapaliny/spínač 'E' Rozsah/výkon obvodu",
-	"P0989": "Nízký obvod snímače tlaku převodové kapaliny/spínače 'E'",
-	"P0990": "Vysoký obvod snímače tlaku převodové kapaliny/spínače 'E'",
-	"P0991": "Snímač tlaku převodové kapaliny/spínač 'E' Obvod přerušovaný",
-	"P0992": "Snímač tlaku převodové kapaliny/spínač obvodu 'F'",
-	"P0993": "Snímač tlaku převodové kapaliny/spínač obvodu 'F' Rozsah/výkonnost",
-	"P0994": "Nízký obvod snímače tlaku převodové kapaliny/spínače 'F'",
-	"P0995": "Vysoký obvod snímače tlaku převodové kapaliny/spínače 'F'",
-	"P0996": "Snímač tlaku převodové kapaliny/spínač 'F' Obvod přerušovaný",
-	"P0997": "Řídicí obvod elektromagnetické cívky 'F' Rozsah/výkon",
-	"P0998": "Řídicí obvod elektromagnetické cívky 'F' nízký",
-	"P0999": "Řídicí obvod elektromagnetické cívky 'F' vysoký",
-	"P0A00": "Obvod snímače teploty chladicí kapaliny v elektronice motoru",
-	"P0A01": "Snímač teploty chladicí kapaliny v elektronice motoru Rozsah/výkon",
-	"P0A02": "Nízký obvod snímače teploty chladicí kapaliny v elektronice motoru",
-	"P0A03": "Obvod snímače teploty chladicí kapaliny v elektronice motoru vysoký",
-	"P0A04": "Obvod snímače teploty chladicí kapaliny v elektronice motoru Přerušovaný provoz",
-	"P0A05": "Řídicí obvod čerpadla chladicí kapaliny motoru/otevřený obvod",
-	"P0A06": "Nízký řídicí obvod čerpadla chladicí kapaliny motoru",
-	"P0A07": "Řídicí obvod čerpadla chladicí kapaliny motoru",
-	"P0A08": "Stavový obvod měniče DC/DC",
-	"P0A09": "Stavový obvod DC/DC měniče Nízký vstup",
-	"P0A10": "Stavový obvod DC/DC měniče Vysoký vstup",
-	"P0A11": "Povolovací obvod DC/DC měniče/otevřený obvod",
-	"P0A12": "Obvod povolení DC/DC měniče Low",
-	"P0A13": "Obvod povolení DC/DC měniče High",
-	"P0A14": "Řídicí obvod/otevřený okruh montáže motoru",
-	"P0A15": "Nízký řídicí obvod uložení motoru",
-	"P0A16": "Obvod ovládání montáže motoru High",
-	"P0A17": "Obvod snímače točivého momentu motoru",
-	"P0A18": "Rozsah/výkon obvodu snímače točivého momentu motoru",
-	"P0A19": "Nízký obvod snímače točivého momentu motoru",
-	"P0A20": "Vysoký obvod snímače točivého momentu motoru",
-	"P0A21": "Přerušovaný obvod snímače točivého momentu motoru",
-	"P0A22": "Obvod snímače točivého momentu generátoru",
-	"P0A23": "Rozsah/výkon obvodu snímače točivého momentu generátoru",
-	"P0A24": "Nízký obvod snímače točivého momentu generátoru",
-	"P0A25": "Vysoký obvod snímače točivého momentu generátoru",
-	"P0A26": "Přerušovaný obvod snímače točivého momentu generátoru",
-	"P0A27": "Obvod pro vypnutí napájení z baterie",
-	"P0A28": "Nízký stav obvodu vypnutí baterie",
-	"P0A29": "Vypínací obvod baterie vysoký",
-	"P2000": "Účinnost lapače NOx pod prahovou hodnotou",
-	"P2001": "Účinnost lapače NOx pod prahovou hodnotou",
-	"P2002": "Účinnost lapače částic pod prahovou hodnotou",
-	"P2003": "Účinnost lapače částic pod prahovou hodnotou",
-	"P2004": "Otevřené ovládání sacího potrubí",
-	"P2005": "Otevřené ovládání sacího potrubí",
-	"P2006": "Ovládání sacího potrubí uvízlo v poloze zavřeno",
-	"P2007": "Ovládání sacího potrubí uvízlo v poloze zavřeno",
-	"P2008": "Řídicí obvod sacího potrubí/otevřený okruh",
-	"P2009": "Nízký řídicí obvod sacího potrubí",
-	"P2010": "Řídicí obvod sacího potrubí High",
-	"P2011": "Řídicí obvod sacího potrubí/otevřený okruh",
-	"P2012": "Nízký řídicí obvod sacího potrubí",
-	"P2013": "Řídicí obvod sacího potrubí High",
-	"P2014": "Obvod snímače polohy sacího potrubí/spínače",
-	"P2015": "Snímač polohy sacího potrubí/spínač Obvod Rozsah/výkon",
-	"P2016": "Snímač polohy sacího potrubí/obvod spínače nízký",
-	"P2017": "Obvod snímače polohy sacího potrubí/spínače vysoký",
-	"P2018": "Obvod snímače polohy sacího potrubí/spínače Přerušovaný",
-	"P2019": "Obvod snímače polohy sacího potrubí/spínače",
-	"P2020": "Snímač polohy sacího potrubí/spínač Obvod Rozsah/výkon",
-	"P2021": "Snímač polohy sacího potrubí/obvod spínače nízký",
-	"P2022": "Obvod snímače polohy sacího potrubí/spínače vysoký",
-	"P2023": "Obvod snímače polohy sacího potrubí/spínače Přerušovaný",
-	"P2024": "Obvod snímače teploty par paliva (EVAP)",
-	"P2025": "Výkon snímače teploty par paliva (EVAP)",
-	"P2026": "Obvod snímače teploty par paliva (EVAP) Nízké napětí",
-	"P2027": "Obvod snímače teploty par paliva (EVAP) Vysoké napětí",
-	"P2028": "Obvod snímače teploty palivových par (EVAP) Přerušovaný provoz",
-	"P2029": "Vypnuté topení na palivo",
-	"P2030": "Výkon ohřívače na paliva",
-	"P2031": "Obvod snímače teploty výfukových plynů",
-	"P2032": "Nízký obvod snímače teploty výfukových plynů",
-	"P2033": "Vysoký obvod snímače teploty výfukových plynů",
-	"P2034": "Obvod snímače teploty výfukových plynů",
-	"P2035": "Nízký obvod snímače teploty výfukových plynů",
-	"P2036": "Vysoký obvod snímače teploty výfukových plynů",
-	"P2037": "Obvod snímače tlaku vzduchu při vstřikování redukčního média",
-	"P2038": "Obvod snímače tlaku vzduchu pro redukční vstřikování Rozsah/výkon",
-	"P2039": "Obvod snímače tlaku vzduchu při vstřikování redukčního média Nízký příkon",
-	"P2040": "Obvod snímače tlaku vzduchu při vstřikování redukčního média Vysoký příkon",
-	"P2041": "Obvod snímače tlaku vzduchu při vstřikování redukčního média Přerušovaný provoz",
-	"P2042": "Redukční obvod snímače teploty",
-	"P2043": "Rozsah/výkon obvodu snímače teploty reduktoru",
-	"P2044": "Nízký vstup obvodu snímače teploty reduktoru",
-	"P2045": "Obvod snímače teploty reduktoru Vysoký vstup",
-	"P2046": "Přerušovaný obvod snímače teploty reduktoru",
-	"P2047": "Redukční vstřikovací okruh/otevřený okruh",
-	"P2048": "Redukční obvod vstřikovače nízký",
-	"P2049": "Redukční obvod vstřikovače vysoký",
-	"P2050": "Redukční vstřikovací okruh/otevřený okruh",
-	"P2051": "Redukční obvod vstřikovače nízký",
-	"P2052": "Redukční obvod vstřikovače vysoký",
-	"P2053": "Redukční vstřikovací okruh/otevřený okruh",
-	"P2054": "Redukční obvod vstřikovače nízký",
-	"P2055": "Redukční obvod vstřikovače vysoký",
-	"P2056": "Redukční vstřikovací okruh/otevřený okruh",
-	"P2057": "Redukční obvod vstřikovače nízký",
-	"P2058": "Redukční obvod vstřikovače vysoký",
-	"P2059": "Řídicí okruh čerpadla redukčního vzduchu/otevřeno",
-	"P2060": "Řídicí obvod čerpadla redukčního vzduchu nízký",
-	"P2061": "Řídicí obvod čerpadla redukovaného vstřikovacího vzduchu High",
-	"P2062": "Řídicí obvod redukčního napájení/otevřený",
-	"P2063": "Nízký řídicí obvod redukčního zdroje",
-	"P2064": "Řídicí obvod redukčního zdroje vysoký",
-	"P2065": "Obvod snímače hladiny paliva 'B'",
-	"P2066": "Výkon snímače hladiny paliva 'B'",
-	"P2067": "Nízký obvod snímače hladiny paliva 'B'",
-	"P2068": "Vysoký obvod snímače hladiny paliva 'B'",
-	"P2069": "Obvod snímače hladiny paliva 'B' Přerušovaný",
-	"P2070": "Otevřený ventil sacího potrubí (IMT)",
-	"P2071": "Zavřený ventil sacího potrubí (IMT)",
-	"P2075": "Obvod snímače polohy ventilu/spínače sacího potrubí (IMT)",
-	"P2076": "Ladění sacího potrubí (IMT) Snímač polohy ventilů/obvod přepínače Rozsah/výkonnost",
-	"P2077": "Nízký obvod snímače polohy ventilu/spínače sacího potrubí (IMT)",
-	"P2078": "Obvod snímače polohy ventilů/spínače sacího potrubí (IMT) vysoký",
-	"P2079": "Obvod snímače polohy ventilů/spínače sacího potrubí (IMT) přerušovaný",
-	"P2080": "Rozsah/výkon obvodu snímače teploty výfukových plynů",
-	"P2081": "Přerušovaný obvod snímače teploty výfukových plynů",
-	"P2082": "Rozsah/výkon obvodu snímače teploty výfukových plynů",
-	"P2083": "Přerušovaný obvod snímače teploty výfukových plynů",
-	"P2084": "Rozsah/výkon obvodu snímače teploty výfukových plynů",
-	"P2085": "Přerušovaný obvod snímače teploty výfukových plynů",
-	"P2086": "Rozsah/výkon obvodu snímače teploty výfukových plynů",
-	"P2087": "Přerušovaný obvod snímače teploty výfukových plynů",
-	"P2088": "'A' Řídicí obvod ovladače polohy vačkového hřídele Nízká hodnota",
-	"P2089": "'A' Obvod řízení polohy vačkového hřídele vysoký",
-	"P2090": "'B' Řídicí obvod ovladače polohy vačkového hřídele Nízká hodnota",
-	"P2091": "'B' Řídicí obvod ovladače polohy vačkového hřídele vysoký",
-	"P2092": "'A' Řídicí obvod ovladače polohy vačkového hřídele Nízká hodnota",
-	"P2093": "'A' Obvod řízení polohy vačkového hřídele vysoký",
-	"P2094": "'B' Řídicí obvod ovladače polohy vačkového hřídele Nízká hodnota",
-	"P2095": "'B' Řídicí obvod ovladače polohy vačkového hřídele vysoký",
-	"P2096": "Příliš chudý systém trimování paliva po katalyzátoru",
-	"P2097": "Příliš bohatý systém trimování paliva po katalyzátoru",
-	"P2098": "Příliš chudý systém trimování paliva po katalyzátoru",
-	"P2099": "Příliš bohatý systém trimování paliva po katalyzátoru",
-	"P2100": "Obvod motoru ovládání škrticí klapky/otevřeno",
-	"P2101": "Obvod ovládání motoru škrticí klapky Rozsah/výkon",
-	"P2102": "Nízký obvod motoru ovládání škrticí klapky",
-	"P2103": "Obvod ovládacího motoru škrticí klapky vysoký",
-	"P2104": "Systém ovládání škrticí klapky - nucený volnoběh",
-	"P2105": "Systém ovládání škrticí klapky - nucené vypnutí motoru",
-	"P2106": "Systém ovládání škrticí klapky - nucený omezený výkon",
-	"P2107": "Procesor řídicího modulu škrticí klapky",
-	"P2108": "Výkon řídicího modulu škrticí klapky",
-	"P2109": "Snímač polohy škrticí klapky/pedálu 'A' Minimální brzdný výkon",
-	"P2110": "Systém ovládání škrticí klapky - nuceně omezené otáčky",
-	"P2111": "Systém ovládání škrticí klapky - zaseknutí v otevřené poloze",
-	"P2112": "Systém ovládání škrticí klapky - zaseknutý v zavřené poloze",
-	"P2113": "Snímač polohy škrticí klapky/pedálu 'B' Minimální brzdný výkon",
-	"P2114": "Snímač polohy škrticí klapky/pedálu 'C' Minimální brzdný výkon",
-	"P2115": "Snímač polohy škrticí klapky/pedálu 'D' Minimální brzdný výkon",
-	"P2116": "Snímač polohy škrticí klapky/pedálu 'E' Minimální brzdný výkon",
-	"P2117": "Snímač polohy škrticí klapky/pedálu 'F' Minimální brzdný výkon",
-	"P2118": "Rozsah/výkon proudu motoru ovládání škrticí klapky",
-	"P2119": "Ovládání škrticí klapky Rozsah/výkon škrticí klapky",
-	"P2120": "Snímač polohy škrticí klapky/pedálu/obvod 'D' přepínače",
-	"P2121": "Snímač polohy škrticí klapky/pedálu/spínač 'D' Rozsah/výkon",
-	"P2122": "Snímač polohy škrticí klapky/pedálu/obvod spínače 'D' Nízký vstup",
-	"P2123": "Snímač polohy škrticí klapky/pedálu/obvod spínače 'D' Vysoký vstup",
-	"P2124": "Snímač polohy škrticí klapky/pedálu/spínač 'D' Obvod přerušovaný",
-	"P2125": "Snímač polohy škrticí klapky/pedálu/spínač 'E' Obvod",
-	"P2126": "Snímač polohy škrticí klapky/pedálu/spínač 'E' Rozsah/výkonnost obvodu",
-	"P2127": "Snímač polohy škrticí klapky/pedálu/obvod spínače 'E' Nízký vstup",
-	"P2128": "Snímač polohy škrticí klapky/pedálu/obvod přepínače 'E' Vysoký vstup",
-	"P2129": "Snímač polohy škrticí klapky/pedálu/spínač 'E' Obvod přerušovaný",
-	"P2130": "Snímač polohy škrticí klapky/pedálu/obvod spínače 'F'",
-	"P2131": "Snímač polohy škrticí klapky/pedálu/spínač 'F' Rozsah výkonu",
-	"P2132": "Snímač polohy škrticí klapky/pedálu/obvod spínače 'F' Nízký vstup",
-	"P2133": "Snímač polohy škrticí klapky/pedálu/obvod přepínače 'F' Vysoký vstup",
-	"P2134": "Snímač polohy škrticí klapky/pedálu/spínač 'F' Obvod přerušovaný",
-	"P2135": "Korelace napětí snímače polohy škrticí klapky/pedálu/spínače 'A' / 'B'",
-	"P2136": "Korelace napětí snímače polohy škrticí klapky/pedálu/spínače 'A' / 'C'",
-	"P2137": "Korelace napětí snímače polohy škrticí klapky/pedálu/spínače 'B' / 'C'",
-	"P2138": "Korelace napětí snímače polohy škrticí klapky/pedálu/spínače 'D' / 'E'",
-	"P2139": "Korelace napětí snímače polohy škrticí klapky/pedálu/spínače 'D' / 'F'",
-	"P2140": "Korelace napětí snímače polohy škrticí klapky/pedálu/spínače 'E' / 'F'",
-	"P2141": "Nízký obvod ovládání škrticí klapky recirkulace výfukových plynů",
-	"P2142": "Obvod ovládání škrticí klapky recirkulace výfukových plynů vysoký",
-	"P2143": "Řídicí okruh/otevřený okruh recirkulace výfukových plynů",
-	"P2144": "Nízký řídicí okruh recirkulace výfukových plynů",
-	"P2145": "Řídicí okruh recirkulace výfukových plynů vysoký",
-	"P2146": "Obvod napájecího napětí skupiny vstřikovačů paliva 'A' / otevřeno",
-	"P2147": "Nízký napájecí obvod skupiny vstřikovačů paliva 'A'",
-	"P2148": "Vysoký obvod napájecího napětí skupiny vstřikovačů paliva 'A'",
-	"P2149": "Obvod napájecího napětí skupiny vstřikovačů paliva 'B' / otevřeno",
-	"P2150": "Nízký napájecí obvod skupiny vstřikovačů paliva 'B'",
-	"P2151": "Vysoký napájecí obvod skupiny vstřikovačů paliva 'B'",
-	"P2152": "Obvod napájecího napětí skupiny vstřikovačů paliva 'C' / otevřeno",
-	"P2153": "Nízký napájecí obvod skupiny vstřikovačů paliva 'C'",
-	"P2154": "Vysoký napájecí obvod skupiny vstřikovačů paliva 'C'",
-	"P2155": "Obvod napájecího napětí skupiny vstřikovačů paliva 'D' / otevřeno",
-	"P2156": "Nízký napájecí obvod skupiny vstřikovačů paliva 'D'",
-	"P2157": "Vysoký napájecí obvod skupiny vstřikovačů paliva 'D'",
-	"P2158": "Snímač rychlosti vozidla 'B'",
-	"P2159": "Snímač rychlosti vozidla 'B' Rozsah/výkon",
-	"P2160": "Nízký obvod snímače rychlosti vozidla 'B'",
-	"P2161": "Snímač rychlosti vozidla 'B' Přerušovaný/nepravidelný",
-	"P2162": "Korelace snímače rychlosti vozidla 'A' / 'B'",
-	"P2163": "Snímač polohy škrticí klapky/pedálu 'A' Maximální výkon při zastavení",
-	"P2164": "Snímač polohy škrticí klapky/pedálu 'B' Maximální výkon při zastavení",
-	"P2165": "Snímač polohy škrticí klapky/pedálu 'C' Maximální výkon při zastavení",
-	"P2166": "Snímač polohy škrticí klapky/pedálu 'D' Maximální výkon při zastavení",
-	"P2167": "Snímač polohy škrticí klapky/pedálu 'E' Maximální výkon při zastavení",
-	"P2168": "Snímač polohy škrticí klapky/pedálu 'F' Maximální výkon při zastavení",
-	"P2169": "Ovládací obvod elektromagnetického ventilu regulátoru výfukového tlaku/otevřeno",
-	"P2170": "Nízký řídicí obvod elektromagnetického ventilu regulátoru výfukového tlaku",
-	"P2171": "Ovládací obvod elektromagnetického ventilu regulátoru výfukového tlaku High",
-	"P2172": "Systém ovládání škrticí klapky - detekován náhlý vysoký průtok vzduchu",
-	"P2173": "Systém ovládání škrticí klapky - detekován vysoký průtok vzduchu",
-	"P2174": "Systém ovládání škrticí klapky - náhlá detekce nízkého průtoku vzduchu",
-	"P2175": "Systém ovládání škrticí klapky - detekován nízký průtok vzduchu",
-	"P2176": "Systém ovládání škrticí klapky - volnoběžná poloha není naučená",
-	"P2177": "Příliš chudý systém při volnoběhu",
-	"P2178": "Příliš bohatý systém při volnoběhu",
-	"P2179": "Příliš chudý systém při volnoběhu",
-	"P2180": "Příliš bohatý systém při volnoběhu",
-	"P2181": "Výkon chladicího systému",
-	"P2182": "Obvod čidla teploty chladicí kapaliny motoru 2",
-	"P2183": "Snímač teploty chladicí kapaliny motoru 2 Rozsah/výkon obvodu",
-	"P2184": "Nízký obvod snímače teploty chladicí kapaliny motoru 2",
-	"P2185": "Obvod čidla teploty chladicí kapaliny motoru 2 vysoký",
-	"P2186": "Snímač teploty chladicí kapaliny motoru 2 Obvod přerušovaný/nepravidelný",
-	"P2187": "Příliš chudý systém při volnoběhu",
-	"P2188": "Příliš bohatý systém při volnoběhu",
-	"P2189": "Příliš chudý systém při volnoběhu",
-	"P2190": "Příliš bohatý systém při volnoběhu",
-	"P2191": "Příliš chudý systém při vyšším zatížení",
-	"P2192": "Příliš bohatý systém při vyšším zatížení",
-	"P2193": "Příliš chudý systém při vyšším zatížení",
-	"P2194": "Příliš bohatý systém při vyšším zatížení",
-	"P2195": "Signál snímače O2 uvízl v chudém stavu",
-	"P2196": "Signál snímače O2 uvízl v bohatém stavu",
-	"P2197": "Signál snímače O2 uvízl v chudém stavu",
-	"P2198": "Signál snímače O2 uvízl v bohatém stavu",
-	"P2199": "Snímač teploty nasávaného vzduchu 1 / 2 Korelace",
-	"P2200": "Obvod snímače NOx",
-	"P2201": "Rozsah/výkon obvodu snímače NOx",
-	"P2202": "Nízký vstup obvodu snímače NOx",
-	"P2203": "Vysoký vstup obvodu snímače NOx",
-	"P2204": "Přerušovaný vstup obvodu snímače NOx",
-	"P2205": "Řídicí obvod ohřívače snímače NOx/otevřeno",
-	"P2206": "Nízký stav řídicího obvodu ohřevu snímače NOx",
-	"P2207": "Vysoký řídicí obvod ohřívače snímače NOx",
-	"P2208": "Senzor NOx Senzorový obvod ohřevu",
-	"P2209": "Senzor NOx Senzorový obvod ohřevu Rozsah/výkon",
-	"P2210": "Snímač NOx Obvod snímače ohřevu nízký vstup",
-	"P2211": "Senzor NOx Senzor ohřevu Obvod vysokého vstupu",
-	"P2212": "Senzor NOx Senzor topení Obvod přerušovaný",
-	"P2213": "Obvod snímače NOx",
-	"P2214": "Rozsah/výkon obvodu snímače NOx",
-	"P2215": "Nízký vstup obvodu snímače NOx",
-	"P2216": "Vysoký vstup obvodu snímače NOx",
-	"P2217": "Přerušovaný vstup obvodu snímače NOx",
-	"P2218": "Řídicí obvod ohřívače snímače NOx/otevřeno",
-	"P2219": "Nízký stav řídicího obvodu ohřevu snímače NOx",
-	"P2220": "Vysoký řídicí obvod ohřívače snímače NOx",
-	"P2221": "Senzor NOx Senzorový obvod ohřevu",
-	"P2222": "Senzor NOx Senzorový obvod ohřevu Rozsah/výkon",
-	"P2223": "Snímač NOx Snímač ohřevu obvodu nízký",
-	"P2224": "Senzor NOx Senzor ohřevu obvodu High",
-	"P2225": "Senzor NOx Senzor topení Obvod přerušovaný",
-	"P2226": "Obvod barometrického tlaku",
-	"P2227": "Rozsah/výkon obvodu barometrického tlaku",
-	"P2228": "Nízký obvod barometrického tlaku",
-	"P2229": "Vysoký obvod barometrického tlaku",
-	"P2230": "Obvod barometrického tlaku Přerušovaný",
-	"P2231": "Signální obvod snímače O2 zkratován na obvod topení",
-	"P2232": "Signální obvod snímače O2 zkratován na obvod topení",
-	"P2233": "Signální obvod snímače O2 zkratován na obvod topení",
-	"P2234": "Signální obvod snímače O2 zkratován na obvod topení",
-	"P2235": "Signální obvod snímače O2 zkratován na obvod topení",
-	"P2236": "Signální obvod snímače O2 zkratován na obvod topení",
-	"P2237": "Řídicí obvod kladného proudu snímače O2/otevřeno",
-	"P2238": "Nízký kladný proudový řídicí obvod snímače O2",
-	"P2239": "Obvod řízení kladného proudu snímače O2 vysoký",
-	"P2240": "Řídicí obvod kladného proudu snímače O2/otevřeno",
-	"P2241": "Nízký kladný proudový řídicí obvod snímače O2",
-	"P2242": "Obvod řízení kladného proudu snímače O2 vysoký",
-	"P2243": "Referenční napěťový obvod snímače O2/otevřeno",
-	"P2244": "Výkonnost referenčního napětí snímače O2",
-	"P2245": "Nízký obvod referenčního napětí snímače O2",
-	"P2246": "Vysoký obvod referenčního napětí snímače O2",
-	"P2247": "Referenční napěťový obvod snímače O2/otevřeno",
-	"P2248": "Výkonnost referenčního napětí snímače O2",
-	"P2249": "Nízký obvod referenčního napětí snímače O2",
-	"P2250": "Vysoký obvod referenčního napětí snímače O2",
-	"P2251": "Řídicí obvod záporného proudu snímače O2/otevřeno",
-	"P2252": "Nízký záporný proud řídicího obvodu snímače O2",
-	"P2253": "Vysoký záporný proudový řídicí obvod snímače O2",
-	"P2254": "Řídicí obvod záporného proudu snímače O2/otevřeno",
-	"P2255": "Nízký záporný proud řídicího obvodu snímače O2",
-	"P2256": "Vysoký záporný proudový řídicí obvod snímače O2",
-	"P2257": "Nízký řídicí okruh 'A' systému sekundárního vstřikování vzduchu",
-	"P2258": "Vysoký řídicí okruh 'A' systému sekundárního vstřikování vzduchu",
-	"P2259": "Nízký řídicí okruh 'B' systému sekundárního vstřikování vzduchu",
-	"P2260": "Řídicí okruh 'B' systému sekundárního vstřikování vzduchu vysoký",
-	"P2261": "Obtokový ventil turbodmychadla/nadmychadla - mechanický",
-	"P2262": "Není detekován tlak turba - mechanické zařízení",
-	"P2263": "Výkonnost systému Turbo/Supercharger Boost",
-	"P2264": "Voda v obvodu palivového senzoru",
-	"P2265": "Voda v obvodu snímače paliva Rozsah/výkon",
-	"P2266": "Nízká hladina vody v obvodu palivového senzoru",
-	"P2267": "Voda v obvodu palivového senzoru vysoká",
-	"P2268": "Voda v obvodu snímače paliva Přerušovaný provoz",
-	"P2269": "Voda v palivu",
-	"P2270": "Signál snímače O2 uvízl v chudém stavu",
-	"P2271": "Signál snímače O2 uvízl v bohatém stavu",
-	"P2272": "Signál snímače O2 uvízl v chudém stavu",
-	"P2273": "Signál snímače O2 uvízl v bohatém stavu",
-	"P2274": "Signál snímače O2 uvízl v chudém stavu",
-	"P2275": "Signál snímače O2 uvízl v bohatém stavu",
-	"P2276": "Signál snímače O2 uvízl v chudém stavu",
-	"P2277": "Signál snímače O2 uvízl v bohatém stavu",
-	"P2278": "Vyměněné signály snímače O2 Snímač banky 1 3 / Snímač banky 2 3",
-	"P2279": "Netěsnost systému sání vzduchu",
-	"P2280": "Omezení průtoku vzduchu / únik vzduchu mezi vzduchovým filtrem a MAF",
-	"P2281": "Únik vzduchu mezi MAF a škrticí klapkou",
-	"P2282": "Únik vzduchu mezi škrticí klapkou a sacími ventily",
-	"P2283": "Obvod snímače řídicího tlaku vstřikovače",
-	"P2284": "Rozsah/výkon obvodu snímače řídicího tlaku vstřikovače",
-	"P2285": "Nízký obvod snímače řídicího tlaku vstřikovače",
-	"P2286": "Vysoký obvod snímače řídicího tlaku vstřikovače",
-	"P2287": "Přerušovaný obvod snímače řídicího tlaku vstřikovače",
-	"P2288": "Příliš vysoký řídicí tlak vstřikovače",
-	"P2289": "Příliš vysoký řídicí tlak ve vstřikovači - vypnutý motor",
-	"P2290": "Příliš nízký řídicí tlak vstřikovače",
-	"P2291": "Příliš nízký řídicí tlak ve vstřikovači - motor se vytáčí",
-	"P2292": "Chybný řídicí tlak vstřikovače",
-	"P2293": "Regulátor tlaku paliva 2 Výkon",
-	"P2294": "Řídicí obvod regulátoru tlaku paliva 2",
-	"P2295": "Nízký řídicí obvod regulátoru tlaku paliva 2",
-	"P2296": "Regulátor tlaku paliva 2 Řídicí okruh vysoký",
-	"P2297": "Snímač O2 mimo rozsah při zpomalování",
-	"P2298": "Snímač O2 mimo rozsah při zpomalování",
-	"P2299": "Neslučitelná poloha brzdového pedálu / pedálu akcelerátoru",
-	"P2300": "Nízký primární řídicí obvod zapalovací cívky 'A'",
-	"P2301": "Primární řídicí obvod zapalovací cívky 'A' vysoký",
-	"P2302": "Sekundární obvod zapalovací cívky 'A'",
-	"P2303": "Nízký primární řídicí obvod zapalovací cívky 'B'",
-	"P2304": "Primární řídicí obvod zapalovací cívky 'B' vysoký",
-	"P2305": "Sekundární obvod zapalovací cívky 'B'",
-	"P2306": "Nízký primární řídicí obvod zapalovací cívky 'C'",
-	"P2307": "Primární řídicí obvod zapalovací cívky 'C' vysoký",
-	"P2308": "Sekundární obvod zapalovací cívky 'C'",
-	"P2309": "Nízký primární řídicí obvod zapalovací cívky 'D'",
-	"P2310": "Primární řídicí obvod zapalovací cívky 'D' vysoký",
-	"P2311": "Sekundární obvod zapalovací cívky 'D'",
-	"P2312": "Nízký primární řídicí obvod zapalovací cívky 'E'",
-	"P2313": "Primární řídicí obvod zapalovací cívky 'E' vysoký",
-	"P2314": "Sekundární obvod zapalovací cívky 'E'",
-	"P2315": "Nízký primární řídicí obvod zapalovací cívky 'F'",
-	"P2316": "Primární řídicí obvod zapalovací cívky 'F' vysoký",
-	"P2317": "Sekundární obvod zapalovací cívky 'F'",
-	"P2318": "Nízký primární řídicí obvod zapalovací cívky 'G'",
-	"P2319": "Primární řídicí obvod zapalovací cívky 'G' vysoký",
-	"P2320": "Sekundární obvod zapalovací cívky 'G'",
-	"P2321": "Nízký primární řídicí obvod zapalovací cívky 'H'",
-	"P2322": "Primární řídicí obvod zapalovací cívky 'H' vysoký",
-	"P2323": "Sekundární obvod zapalovací cívky 'H'",
-	"P2324": "Nízký primární řídicí obvod zapalovací cívky 'I'",
-	"P2325": "Primární řídicí obvod zapalovací cívky 'I' vysoký",
-	"P2326": "Sekundární obvod zapalovací cívky 'I'",
-	"P2327": "Nízký primární řídicí obvod zapalovací cívky 'J'",
-	"P2328": "Primární řídicí obvod zapalovací cívky 'J' vysoký",
-	"P2329": "Sekundární obvod zapalovací cívky 'J'",
-	"P2330": "Nízký primární řídicí obvod zapalovací cívky 'K'",
-	"P2331": "Primární řídicí obvod zapalovací cívky 'K' vysoký",
-	"P2332": "Sekundární obvod zapalovací cívky 'K'",
-	"P2333": "Nízký primární řídicí obvod zapalovací cívky 'L'",
-	"P2334": "Primární řídicí obvod zapalovací cívky 'L' vysoký",
-	"P2335": "Sekundární obvod zapalovací cívky 'L'",
-	"P2336": "Válec č. 1 nad prahovou hodnotou klepání",
-	"P2337": "Válec č. 2 nad prahovou hodnotou klepání",
-	"P2338": "Válec č. 3 nad prahovou hodnotou klepání",
-	"P2339": "Válec č. 4 nad prahovou hodnotou klepání",
-	"P2340": "Válec č. 5 nad prahovou hodnotou klepání",
-	"P2341": "Válec č. 6 nad prahovou hodnotou klepání",
-	"P2342": "Válec č. 7 nad prahovou hodnotou klepání",
-	"P2343": "Válec č. 8 nad prahovou hodnotou klepání",
-	"P2344": "Válec č. 9 nad prahem klepání",
-	"P2345": "Válec č. 10 nad prahem klepání",
-	"P2346": "Válec č. 11 nad prahem klepání",
-	"P2347": "Válec č. 12 nad prahem klepání",
-	"P2400": "Systém detekce netěsnosti odpařovacích emisí Řídicí obvod čerpadla/otevřený okruh",
-	"P2401": "Nízký řídicí obvod čerpadla pro detekci netěsnosti systému výparů",
-	"P2402": "Systém detekce netěsnosti čerpadla odpařovacích emisí Vysoký řídicí obvod",
-	"P2403": "Systém detekce netěsnosti odpařovacích emisí Senzorový obvod čerpadla/otevřený obvod",
-	"P2404": "Systém detekce netěsnosti odpařovacích emisí Obvod detekce čerpadla Rozsah/výkon",
-	"P2405": "Systém detekce netěsnosti odpařovacích emisí Obvod detekce čerpadla nízký",
-	"P2406": "Obvod detekce netěsnosti čerpadla odpařovacího systému vysoký",
-	"P2407": "Systém detekce netěsnosti odpařovacích emisí Obvod detekce čerpadla Přerušovaný/nefunkční",
-	"P2408": "Obvod snímače/spínače víčka palivové nádrže",
-	"P2409": "Senzor/spínač palivového uzávěru Rozsah/výkon obvodu",
-	"P2410": "Nízký obvod snímače/spínače víčka palivové nádrže",
-	"P2411": "Vysoký obvod snímače/spínače víčka palivové nádrže",
-	"P2412": "Obvod snímače/spínače víčka palivové nádrže Přerušovaný/nepřetržitý provoz",
-	"P2413": "Výkon systému recirkulace výfukových plynů",
-	"P2414": "Chyba vzorku výfukových plynů snímače O2",
-	"P2415": "Chyba vzorku výfukových plynů snímače O2",
-	"P2416": "Vyměněné signály snímače O2 Snímač 1 banky 2 / Snímač 1 banky 3",
-	"P2417": "Vyměněné signály snímače O2 Snímač 2 banky 2 / Snímač 3 banky 2",
-	"P2418": "Řídicí obvod spínacího ventilu systému odpařovacích emisí / otevřeno",
-	"P2419": "Nízký řídicí obvod spínacího ventilu systému odpařovacích emisí",
-	"P2420": "Vysoký řídicí obvod spínacího ventilu systému odpařovacích emisí",
-	"P2421": "Otevřený odvzdušňovací ventil odpařovacího systému",
-	"P2422": "Zavřený odvzdušňovací ventil odpařovacího systému",
-	"P2423": "Účinnost adsorpčního katalyzátoru HC pod prahovou hodnotou",
-	"P2424": "Účinnost adsorpčního katalyzátoru HC pod prahovou hodnotou",
-	"P2425": "Řídicí obvod/otevřený ventil chlazení recirkulace výfukových plynů",
-	"P2426": "Nízký řídicí obvod chladicího ventilu recirkulace výfukových plynů",
-	"P2427": "Řídicí obvod chladicího ventilu recirkulace výfukových plynů vysoký",
-	"P2428": "Příliš vysoká teplota výfukových plynů",
-	"P2429": "Příliš vysoká teplota výfukových plynů",
-	"P2430": "Systém sekundárního vstřikování vzduchu Obvod snímače průtoku/tlaku vzduchu",
-	"P2431": "Systém sekundárního vstřikování vzduchu Obvod snímače průtoku/tlaku vzduchu Rozsah/výkon",
-	"P2432": "Nízký obvod snímače průtoku/tlaku vzduchu v systému sekundárního vstřikování vzduchu",
-	"P2433": "Systém sekundárního vstřikování vzduchu Obvod snímače průtoku/tlaku vzduchu Vysoký",
-	"P2434": "Systém sekundárního vstřikování vzduchu Obvod snímače průtoku/tlaku vzduchu Přerušovaný/nepravidelný",
-	"P2435": "Systém sekundárního vstřikování vzduchu Obvod snímače průtoku/tlaku vzduchu",
-	"P2436": "Systém sekundárního vstřikování vzduchu Obvod snímače průtoku/tlaku vzduchu Rozsah/výkon",
-	"P2437": "Nízký obvod snímače průtoku/tlaku vzduchu v systému sekundárního vstřikování vzduchu",
-	"P2438": "Systém sekundárního vstřikování vzduchu Obvod snímače průtoku/tlaku vzduchu Vysoký",
-	"P2439": "Systém sekundárního vstřikování vzduchu Obvod snímače průtoku/tlaku vzduchu Přerušovaný/nepravidelný",
-	"P2440": "Otevřený přepínací ventil systému sekundárního vstřikování vzduchu",
-	"P2441": "Uzavřený přepínací ventil systému sekundárního vstřikování vzduchu",
-	"P2442": "Otevřený přepínací ventil systému sekundárního vstřikování vzduchu",
-	"P2443": "Uzavřený přepínací ventil systému sekundárního vstřikování vzduchu",
-	"P2444": "Zaseknuté čerpadlo sekundárního vstřikování vzduchu",
-	"P2445": "Čerpadlo systému sekundárního vstřikování vzduchu se zaseklo ve vypnutém stavu",
-	"P2446": "Zaseknuté čerpadlo sekundárního vstřikování vzduchu",
-	"P2447": "Čerpadlo systému sekundárního vstřikování vzduchu se zaseklo ve vypnutém stavu",
-	"P2500": "Nízký stav lampy generátoru / koncového obvodu",
-	"P2501": "Vysoký obvod lampy generátoru / koncového obvodu",
-	"P2502": "Napětí nabíjecího systému",
-	"P2503": "Nízké napětí nabíjecího systému",
-	"P2504": "Vysoké napětí nabíjecího systému",
-	"P2505": "Vstupní napájecí signál ECM/PCM",
-	"P2506": "Rozsah/výkon vstupního signálu ECM/PCM",
-	"P2507": "Nízký vstupní napájecí signál ECM/PCM",
-	"P2508": "Vstupní signál napájení ECM/PCM vysoký",
-	"P2509": "Přerušovaný vstupní napájecí signál ECM/PCM",
-	"P2510": "ECM/PCM Senzorový obvod výkonového relé Rozsah/výkon",
-	"P2511": "ECM/PCM Senzorický obvod výkonového relé Přerušovaný provoz",
-	"P2512": "Okruh požadavku na záznamník dat událostí/otevřený",
-	"P2513": "Obvod požadavku na záznamník dat událostí Low",
-	"P2514": "Obvod požadavku na záznamník dat událostí High",
-	"P2515": "Obvod B snímače tlaku chladiva klimatizace",
-	"P2516": "Snímač tlaku chladiva v okruhu 'B' klimatizace Rozsah/výkon",
-	"P2517": "Snímač tlaku chladiva klimatizace 'B' nízký obvod",
-	"P2518": "Vysoký obvod čidla tlaku chladiva klimatizace 'B'",
-	"P2519": "Požadavek na okruh A klimatizace",
-	"P2520": "Nízká úroveň okruhu A požadavku na klimatizaci",
-	"P2521": "Požadavek na okruh 'A' klimatizace vysoký",
-	"P2522": "Požadavek na okruh A/C 'B'",
-	"P2523": "Nízká úroveň okruhu B požadavku na klimatizaci",
-	"P2524": "Požadavek na okruh A/C 'B' vysoký",
-	"P2525": "Obvod snímače tlaku vakuové nádrže",
-	"P2526": "Rozsah/výkon obvodu snímače tlaku vakuové nádrže",
-	"P2527": "Nízký obvod snímače tlaku ve vakuové nádrži",
-	"P2528": "Vysoký obvod snímače tlaku vakuové nádrže",
-	"P2529": "Přerušovaný obvod snímače tlaku vakuové nádrže",
-	"P2530": "Obvod spínače zapalování v poloze chodu",
-	"P2531": "Nízký obvod spínače zapalování v poloze chodu",
-	"P2532": "Obvod spínače zapalování v pracovní poloze High",
-	"P2533": "Obvod polohy spínače zapalování Spuštění/nastartování",
-	"P2534": "Nízký obvod polohy spínače zapalování Run/Start",
-	"P2535": "Obvod spínače zapalování v poloze spuštění/startování vysoký",
-	"P2536": "Obvod polohy příslušenství spínače zapalování",
-	"P2537": "Nízký obvod polohy příslušenství spínače zapalování",
-	"P2538": "Vysoký obvod polohy příslušenství spínače zapalování",
-	"P2539": "Obvod snímače nízkého tlaku palivového systému",
-	"P2540": "Snímač nízkého tlaku palivové soustavy Rozsah/výkon",
-	"P2541": "Snímač nízkého tlaku palivového systému Nízký obvod",
-	"P2542": "Obvod snímače nízkého tlaku palivového systému vysoký",
-	"P2543": "Přerušovaný obvod snímače nízkého tlaku palivového systému",
-	"P2544": "Vstupní signál 'A' požadavku na řízení točivého momentu",
-	"P2545": "Požadavek na řízení točivého momentu Vstupní signál 'A' Rozsah/výkonnost",
-	"P2546": "Požadavek na řízení točivého momentu Vstupní signál 'A' nízký",
-	"P2547": "Požadavek na řízení točivého momentu Vstupní signál 'A' vysoký",
-	"P2548": "Vstupní signál 'B' požadavku na řízení točivého momentu",
-	"P2549": "Požadavek na řízení točivého momentu Vstupní signál 'B' Rozsah/výkonnost",
-	"P2550": "Požadavek na řízení točivého momentu Vstupní signál 'B' nízký",
-	"P2551": "Požadavek na řízení točivého momentu Vstupní signál 'B' vysoký",
-	"P2552": "Obvod inhibice škrticí klapky/paliva",
-	"P2553": "Obvod škrticí klapky/zábrany přívodu paliva Rozsah/výkon",
-	"P2554": "Nízká hodnota obvodu inhibice plynu/paliva",
-	"P2555": "Obvod inhibice škrticí klapky/paliva vysoký",
-	"P2556": "Obvod snímače/spínače hladiny chladicí kapaliny motoru",
-	"P2557": "Snímač/spínač hladiny chladicí kapaliny motoru Rozsah/výkon obvodu",
-	"P2558": "Snímač/spínač hladiny chladicí kapaliny motoru Nízký obvod",
-	"P2559": "Vysoký obvod snímače/spínače hladiny chladicí kapaliny motoru",
-	"P2560": "Nízká hladina chladicí kapaliny motoru",
-	"P2561": "Požadované osvětlení MIL řídicího modulu klimatizace",
-	"P2562": "Obvod snímače polohy řízení zvýšení tlaku turbodmychadla",
-	"P2563": "Obvod snímače polohy regulace zvýšení tlaku turbodmychadla Rozsah/výkon",
-	"P2564": "Nízký obvod snímače polohy regulace zvýšení tlaku turbodmychadla",
-	"P2565": "Vysoký obvod snímače polohy regulace zvýšení tlaku turbodmychadla",
-	"P2566": "Obvod snímače polohy regulace zvyšování tlaku turbodmychadla Přerušovaný",
-	"P2567": "Obvod snímače teploty katalyzátoru přímé redukce ozonu",
-	"P2568": "Obvod snímače teploty katalyzátoru přímé redukce ozonu Rozsah/výkon",
-	"P2569": "Obvod snímače teploty katalyzátoru pro přímou redukci ozonu Nízká hodnota",
-	"P2570": "Obvod snímače teploty katalyzátoru pro přímou redukci ozonu Vysoký",
-	"P2571": "Obvod snímače teploty katalyzátoru přímé redukce ozonu Přerušený/nefunkční",
-	"P2572": "Přímý obvod snímače zhoršení stavu katalyzátoru redukce ozonu",
-	"P2573": "Přímý snímač degradace katalyzátoru redukce ozonu Rozsah/výkonnost obvodu",
-	"P2574": "Přímá redukce ozonu Katalyzátor Zhoršení stavu obvodu snímače Nízká hodnota",
-	"P2575": "Přímá redukce ozonu Obvod snímače zhoršení stavu katalyzátoru Vysoký",
-	"P2576": "Přímá redukce ozonu Katalyzátor zhoršení kvality Obvod snímače přerušovaný/chybový",
-	"P2577": "Účinnost katalyzátoru pro přímou redukci ozonu pod prahovou hodnotou",
-	"P2600": "Řídicí obvod čerpadla chladicí kapaliny/otevřený",
-	"P2601": "Řídicí obvod čerpadla chladicí kapaliny Rozsah/výkon",
-	"P2602": "Nízký řídicí obvod čerpadla chladicí kapaliny",
-	"P2603": "Vysoký řídicí obvod čerpadla chladicí kapaliny",
-	"P2604": "Rozsah/výkon okruhu ohřívače nasávaného vzduchu 'A'",
-	"P2605": "Okruh A ohřívače nasávaného vzduchu/otevřeno",
-	"P2606": "Rozsah/výkon okruhu ohřívače nasávaného vzduchu 'B'",
-	"P2607": "Nízký obvod ohřívače nasávaného vzduchu 'B'",
-	"P2608": "Obvod ohřívače nasávaného vzduchu 'B' vysoký",
-	"P2609": "Výkon systému ohřívače nasávaného vzduchu",
-	"P2610": "Výkon interního časovače vypnutí motoru ECM/PCM",
-	"P2611": "Řídicí okruh/otevřený distribuční ventil chladiva klimatizace",
-	"P2612": "Nízký řídicí obvod ventilu rozvodu chladiva klimatizace",
-	"P2613": "Vysoký řídicí obvod ventilu rozvodu chladiva klimatizace",
-	"P2614": "Výstupní obvod signálu polohy vačkového hřídele/otevřeno",
-	"P2615": "Nízký výstupní obvod signálu polohy vačkového hřídele",
-	"P2616": "Výstupní obvod signálu polohy vačkového hřídele vysoký",
-	"P2617": "Výstupní obvod signálu polohy klikového hřídele/otevřeno",
-	"P2618": "Nízký výstupní obvod signálu polohy klikového hřídele",
-	"P2619": "Výstupní obvod signálu polohy klikového hřídele vysoký",
-	"P2620": "Výstupní obvod polohy škrticí klapky/otevřeno",
-	"P2621": "Nízký výstupní obvod polohy škrticí klapky",
-	"P2622": "Výstupní obvod polohy škrticí klapky vysoký",
-	"P2623": "Obvod regulátoru řídicího tlaku vstřikovače/otevřeno",
-	"P2624": "Nízký obvod regulátoru řídicího tlaku vstřikovače",
-	"P2625": "Obvod regulátoru řídicího tlaku vstřikovače vysoký",
-	"P2626": "Snímač O2 čerpacího proudu Trimovací obvod/otevřený obvod",
-	"P2627": "Nízký proudový obvod trimování snímače O2",
-	"P2628": "Vysoký proudový obvod trimování snímače O2",
-	"P2629": "Snímač O2 čerpacího proudu Trimovací obvod/otevřený obvod",
-	"P2630": "Nízký proudový obvod trimování snímače O2",
-	"P2631": "Vysoký proudový obvod trimování snímače O2",
-	"P2632": "Řídicí obvod palivového čerpadla 'B' /otevřeno",
-	"P2633": "Nízký řídicí obvod palivového čerpadla 'B'",
-	"P2634": "Vysoký řídicí obvod palivového čerpadla 'B'",
-	"P2635": "Palivové čerpadlo 'A' nízký průtok / výkon",
-	"P2636": "Palivové čerpadlo 'B' Low Flow / Performance",
-	"P2637": "Signál zpětné vazby řízení točivého momentu 'A'",
-	"P2638": "Signál zpětné vazby řízení točivého momentu 'A' Rozsah/výkon",
-	"P2639": "Signál zpětné vazby řízení točivého momentu 'A' nízký",
-	"P2640": "Signál zpětné vazby řízení točivého momentu 'A' vysoký",
-	"P2641": "Signál zpětné vazby řízení točivého momentu 'B'",
-	"P2642": "Signál zpětné vazby řízení točivého momentu 'B' Rozsah/výkon",
-	"P2643": "Signál zpětné vazby řízení točivého momentu 'B' nízký",
-	"P2644": "Signál zpětné vazby řízení točivého momentu 'B' vysoký",
-	"P2645": "Ovládací obvod/otevřený obvod pohonu vahadla 'A'",
-	"P2646": "Systém pohonu vahadla 'A' Výkon nebo zaseknutí ve vypnutém stavu",
-	"P2647": "Systém pohonu vahadla 'A' se zasekl",
-	"P2648": "'A' Ovládací obvod pohonu vahadla nízký",
-	"P2649": "Obvod ovládání pohonu vahadla 'A' vysoký",
-	"P2650": "Ovládací obvod/otevřený obvod pohonu vahadla 'B'",
-	"P2651": "Systém pohonu vahadla 'B' Výkon nebo zaseknutí ve vypnutém stavu",
-	"P2652": "Systém pohonu vahadla 'B' zaseklý",
-	"P2653": "'B' Ovládací obvod pohonu vahadla nízký",
-	"P2654": "Obvod ovládání pohonu vahadla 'B' vysoký",
-	"P2655": "Ovládací obvod/otevřený obvod pohonu vahadla 'A'",
-	"P2656": "Systém pohonu vahadla 'A' Výkon nebo zaseknutí ve vypnutém stavu",
-	"P2657": "Systém pohonu vahadla 'A' se zasekl",
-	"P2658": "'A' Ovládací obvod pohonu vahadla nízký",
-	"P2659": "Obvod ovládání pohonu vahadla 'A' vysoký",
-	"P2660": "Ovládací obvod/otevřený obvod pohonu vahadla 'B'",
-	"P2661": "Systém pohonu vahadla 'B' Výkon nebo zaseknutí ve vypnutém stavu",
-	"P2662": "Systém pohonu vahadla 'B' zaseklý",
-	"P2663": "'B' Ovládací obvod pohonu vahadla nízký",
-	"P2664": "Obvod ovládání pohonu vahadla 'B' vysoký",
-	"P2665": "Řídicí obvod/otevřený uzavírací ventil paliva 'B'",
-	"P2666": "Nízký řídicí obvod uzavíracího ventilu paliva 'B'",
-	"P2667": "Řídicí obvod uzavíracího ventilu paliva 'B' vysoký",
-	"P2668": "Řídicí obvod kontrolky palivového režimu",
-	"P2669": "Napájecí napětí akčního členu obvod 'B' /otevřeno",
-	"P2670": "Nízké napájecí napětí obvodu 'B' akčního členu",
-	"P2671": "Vysoké napájecí napětí obvodu 'B' akčního členu",
-	"P2700": "Třecí prvek převodovky 'A' Časový rozsah/výkon použití",
-	"P2701": "Třecí prvek převodovky 'B' Časový rozsah/výkon použití",
-	"P2702": "Třecí prvek převodovky 'C' Časový rozsah/výkon použití",
-	"P2703": "Třecí prvek převodovky 'D' Časový rozsah/výkon použití",
-	"P2704": "Třecí prvek převodovky 'E' Časový rozsah/výkon použití",
-	"P2705": "Třecí prvek převodovky 'F' Časový rozsah/výkon použití",
-	"P2706": "Elektromagnetická cívka řazení 'F'",
-	"P2707": "Výkonnost nebo zaseknutí elektromagnetického ventilu řazení 'F' ve vypnutém stavu",
-	"P2708": "Zapnutý elektromagnetický ventil řazení 'F'",
-	"P2709": "Elektrická cívka řazení 'F'",
-	"P2710": "Přerušovaný elektromagnetický ventil řazení 'F'",
-	"P2711": "Neočekávané mechanické rozpojení převodovky",
-	"P2712": "Netěsnost hydraulické pohonné jednotky",
-	"P2713": "Solenoid pro regulaci tlaku 'D'",
-	"P2714": "Výkon nebo zaseknutí elektromagnetu regulace tlaku 'D' ve vypnutém stavu",
-	"P2715": "Zapnutý elektromagnetický ventil regulace tlaku 'D'",
-	"P2716": "Elektrická ovládací cívka tlaku 'D'",
-	"P2717": "Elektromagnetický ovladač tlaku 'D' Přerušovaný",
-	"P2718": "Řídicí obvod 'D' ovládacího elektromagnetu / otevřeno",
-	"P2719": "Řídicí obvod elektromagnetu 'D' Rozsah/výkon",
-	"P2720": "Nízký řídicí okruh ovládacího elektromagnetu 'D'",
-	"P2721": "Řídicí obvod 'D' ovládacího cívkového ventilu vysoký",
-	"P2722": "Solenoid pro regulaci tlaku 'E'",
-	"P2723": "Výkon nebo zaseknutí elektromagnetu regulace tlaku 'E' ve vypnutém stavu",
-	"P2724": "Zapnutý elektromagnetický ventil regulace tlaku 'E'",
-	"P2725": "Elektrická ovládací cívka tlaku 'E'",
-	"P2726": "Elektromagnetický ventil pro regulaci tlaku 'E' Přerušovaný",
-	"P2727": "Řídicí obvod ovládacího elektromagnetu 'E' / otevřeno",
-	"P2728": "Solenoid pro regulaci tlaku 'E' Rozsah/výkon regulačního obvodu",
-	"P2729": "Nízký řídicí okruh ovládacího elektromagnetu 'E'",
-	"P2730": "Ovládací obvod elektromagnetu 'E' Vysoký tlak",
-	"P2731": "Solenoid pro regulaci tlaku 'F'",
-	"P2732": "Výkon nebo zaseknutí vypnutého elektromagnetu regulace tlaku 'F'",
-	"P2733": "Zapnutý elektromagnetický ventil regulace tlaku 'F'",
-	"P2734": "Elektrická ovládací cívka tlaku 'F'",
-	"P2735": "Elektromagnetický ventil pro regulaci tlaku 'F' Přerušovaný",
-	"P2736": "Řídicí obvod F ovládacího elektromagnetu 'F'/otevřeno",
-	"P2737": "Řídicí elektromagnet 'F' Rozsah/výkon řídicího obvodu",
-	"P2738": "Nízký řídicí okruh ovládacího elektromagnetu 'F'",
-	"P2739": "Řídicí obvod 'F' ovládacího cívky tlaku High",
-	"P2740": "Obvod snímače teploty převodové kapaliny 'B'",
-	"P2741": "Snímač teploty převodové kapaliny obvodu 'B' Výkonnostní rozsah",
-	"P2742": "Nízký obvod snímače teploty převodové kapaliny 'B'",
-	"P2743": "Vysoký obvod snímače teploty převodové kapaliny 'B'",
-	"P2744": "Obvod snímače teploty převodové kapaliny 'B' Přerušovaný provoz",
-	"P2745": "Obvod snímače otáček mezinápravového hřídele 'B'",
-	"P2746": "Snímač otáček mezinápravového hřídele obvod 'B' Rozsah/výkon",
-	"P2747": "Snímač otáček mezinápravového hřídele obvod 'B' bez signálu",
-	"P2748": "Obvod snímače otáček mezinápravového hřídele 'B' přerušovaný",
-	"P2749": "Obvod C snímače otáček mezinápravového hřídele",
-	"P2750": "Snímač otáček mezilehlého hřídele Obvod 'C' Rozsah/výkon",
-	"P2751": "Obvod 'C' snímače otáček mezinápravového hřídele bez signálu",
-	"P2752": "Snímač otáček mezinápravového hřídele Obvod 'C' Přerušovaný",
-	"P2753": "Řídicí okruh chladiče převodové kapaliny/otevřeno",
-	"P2754": "Nízký řídicí obvod chladiče převodové kapaliny",
-	"P2755": "Řídicí obvod chladiče převodové kapaliny vysoký",
-	"P2756": "Ovládací cívka tlaku spojky měniče krouticího momentu",
-	"P2757": "Ovládací obvod elektromagnetické cívky měniče krouticího momentu Výkon nebo zaseknutí ve vypnutém stavu",
-	"P2758": "Zapnutý ovládací obvod elektromagnetického řízení tlaku spojky měniče krouticího momentu",
-	"P2759": "Ovládací obvod elektromagnetického ovládání spojky měniče točivého momentu Elektrický obvod",
-	"P2760": "Ovládací obvod elektromagnetického ovládání tlaku spojky měniče krouticího momentu Přerušovaný",
-	"P2761": "Řídicí obvod/rozpínací obvod elektromagnetu ovládání tlaku spojky měniče krouticího momentu",
-	"P2762": "Ovládací obvod elektromagnetu pro řízení tlaku spojky měniče krouticího momentu Rozsah/výkon",
-	"P2763": "Ovládací obvod elektromagnetického ovládání tlaku spojky měniče točivého momentu vysoký",
-	"P2764": "Řídicí obvod elektromagnetu ovládání tlaku spojky měniče krouticího momentu nízký",
-	"P2765": "Vstupní obvod/obvod snímače otáček turbíny 'B'",
-	"P2766": "Vstupní obvod / obvod snímače otáček turbíny 'B' Rozsah/výkon",
-	"P2767": "Vstupní obvod/obvod snímače otáček turbíny 'B' bez signálu",
-	"P2768": "Obvod vstupního snímače otáček turbíny 'B' Přerušovaný",
-	"P2769": "Nízký obvod spojky měniče točivého momentu",
-	"P2770": "Vysoký obvod spojky měniče točivého momentu",
-	"P2771": "Obvod nízkého spínače pohonu všech kol (4WD)",
-	"P2772": "Nízký spínací obvod pohonu všech kol (4WD) Rozsah/výkon",
-	"P2773": "Nízký spínací obvod pohonu všech kol (4WD) Nízký",
-	"P2774": "Obvod nízkého spínače pohonu všech kol (4WD) Vysoký",
-	"P2775": "Rozsah/výkon obvodu přepínače Upshift",
-	"P2776": "Nízký obvod spínače Upshift",
-	"P2777": "Obvod přepínače Upshift High",
-	"P2778": "Přerušovaný/nepravidelný obvod spínače Upshift",
-	"P2779": "Obvod spínače řazení dolů Rozsah/výkon",
-	"P2780": "Nízký obvod spínače řazení",
-	"P2781": "Vysoký obvod spínače řazení dolů",
-	"P2782": "Obvod spínače řazení dolů přerušovaný/nepravidelný",
-	"P2783": "Příliš vysoká teplota měniče točivého momentu",
-	"P2784": "Korelace mezi vstupem a snímačem otáček turbíny 'A'/'B'",
-	"P2785": "Příliš vysoká teplota spojkového pohonu",
-	"P2786": "Příliš vysoká teplota ovladače řazení",
-	"P2787": "Příliš vysoká teplota spojky",
-	"P2788": "Automatické řazení Manuální adaptivní učení na limitu",
-	"P2789": "Adaptivní učení spojky na limitu",
-	"P2790": "Obvod pro výběr směru brány",
-	"P2791": "Obvod volby směru brány nízký",
-	"P2792": "Obvod volby směru brány High",
-	"P2793": "Obvod směru řazení",
-	"P2794": "Obvod směru řazení nízký",
-	"P2795": "Obvod směru řazení rychlostních stupňů High",
-	"P2A00": "Rozsah/výkon obvodu snímače O2",
-	"P2A01": "Rozsah/výkon obvodu snímače O2",
-	"P2A02": "Rozsah/výkon obvodu snímače O2",
-	"P2A03": "Rozsah/výkon obvodu snímače O2",
-	"P2A04": "Rozsah/výkon obvodu snímače O2",
-	"P2A05": "Rozsah/výkon obvodu snímače O2",
-	"P3400": "Systém deaktivace válců",
-	"P3401": "Obvod ovládání deaktivace/sacího ventilu válce 1/otevřeno",
-	"P3402": "Deaktivace válce 1/řízení sacích ventilů Performance",
-	"P3403": "Deaktivace válce 1 / řídicí obvod sacího ventilu nízký",
-	"P3404": "Vysoký obvod řízení deaktivace/sacího ventilu válce 1",
-	"P3405": "Řídicí obvod/otevření výfukového ventilu válce 1",
-	"P3406": "Výkon ovládání výfukového ventilu válce 1",
-	"P3407": "Nízký řídicí obvod výfukového ventilu válce 1",
-	"P3408": "Obvod ovládání výfukového ventilu válce 1 vysoký",
-	"P3409": "Obvod ovládání deaktivace/sacího ventilu válce 2/otevřeno",
-	"P3410": "Deaktivace válce 2/řízení sacích ventilů Performance",
-	"P3411": "Nízký obvod řízení deaktivace/sacího ventilu válce 2",
-	"P3412": "Obvod deaktivace/ovládání sacího ventilu válce 2 vysoký",
-	"P3413": "Řídicí obvod/otevření výfukového ventilu válce 2",
-	"P3414": "Řízení výfukových ventilů válce 2",
-	"P3415": "Nízký řídicí obvod výfukového ventilu válce 2",
-	"P3416": "Obvod ovládání výfukového ventilu válce 2 vysoký",
-	"P3417": "Obvod ovládání deaktivace/sacího ventilu válce 3/otevřeno",
-	"P3418": "Deaktivace válce 3/řízení sacích ventilů Performance",
-	"P3419": "Deaktivace válce 3 / řídicí obvod sacího ventilu nízký",
-	"P3420": "Obvod řízení deaktivace / sacího ventilu válce 3 vysoký",
-	"P3421": "Řídicí obvod/otevření výfukového ventilu válce 3",
-	"P3422": "Výkon řízení výfukových ventilů válce 3",
-	"P3423": "Nízký řídicí obvod výfukového ventilu válce 3",
-	"P3424": "Obvod ovládání výfukového ventilu válce 3 vysoký",
-	"P3425": "Deaktivace válce 4 / obvod ovládání sacích ventilů / otevření",
-	"P3426": "Deaktivace válce 4/řízení sacích ventilů Performance",
-	"P3427": "Deaktivace válce 4/obvod řízení sacích ventilů nízký",
-	"P3428": "Deaktivace válce 4/obvod ovládání sacích ventilů vysoký",
-	"P3429": "Řídicí obvod/otevření výfukového ventilu válce 4",
-	"P3430": "Řízení výfukových ventilů válce 4",
-	"P3431": "Nízký řídicí obvod výfukového ventilu válce 4",
-	"P3432": "Obvod ovládání výfukového ventilu válce 4 vysoký",
-	"P3433": "Obvod řízení deaktivace/sacího ventilu válce 5/otevřeno",
-	"P3434": "Deaktivace válce 5/řízení sacích ventilů Performance",
-	"P3435": "Deaktivace válce 5/obvod ovládání sacích ventilů nízký",
-	"P3436": "Deaktivace válce 5/obvod ovládání sacích ventilů vysoký",
-	"P3437": "Řídicí obvod/otevření výfukového ventilu válce 5",
-	"P3438": "Výkon řízení výfukových ventilů válce 5",
-	"P3439": "Nízký řídicí obvod výfukového ventilu válce 5",
-	"P3440": "Obvod ovládání výfukového ventilu válce 5 vysoký",
-	"P3441": "Obvod řízení deaktivace/sacího ventilu válce 6/otevřeno",
-	"P3442": "Deaktivace válce 6/řízení sacích ventilů Performance",
-	"P3443": "Deaktivace válce 6/obvod řízení sacích ventilů nízký",
-	"P3444": "Deaktivace válce 6/obvod ovládání sacích ventilů vysoký",
-	"P3445": "Obvod řízení výfukového ventilu válce 6/otevřeno",
-	"P3446": "Výkon řízení výfukových ventilů válce 6",
-	"P3447": "Nízký řídicí obvod výfukového ventilu válce 6",
-	"P3448": "Obvod řízení výfukových ventilů válce 6 vysoký",
-	"P3449": "Deaktivace válce 7/obvod ovládání sacího ventilu/otevřeno",
-	"P3450": "Deaktivace válce 7/řízení sacích ventilů Performance",
-	"P3451": "Deaktivace válce 7/obvod ovládání sacího ventilu nízký",
-	"P3452": "Deaktivace válce 7/obvod ovládání sacího ventilu vysoký",
-	"P3453": "Válec 7 Řídicí obvod výfukového ventilu/otevřeno",
-	"P3454": "Výkonnost ovládání výfukových ventilů válce 7",
-	"P3455": "Nízký řídicí obvod výfukového ventilu válce 7",
-	"P3456": "Obvod ovládání výfukového ventilu 7 vysoký",
-	"P3457": "Obvod řízení deaktivace/sacího ventilu válce 8/otevřeno",
-	"P3458": "Deaktivace válce 8/řízení sacích ventilů Performance",
-	"P3459": "Deaktivace válce 8/obvod ovládání sacích ventilů nízký",
-	"P3460": "Deaktivace válce 8/obvod ovládání sacích ventilů vysoký",
-	"P3461": "Obvod ovládání výfukového ventilu válce 8/otevřeno",
-	"P3462": "Výkon řízení výfukových ventilů válce 8",
-	"P3463": "Nízký řídicí obvod výfukového ventilu válce 8",
-	"P3464": "Obvod ovládání výfukového ventilu válce 8 vysoký",
-	"P3465": "Obvod řízení deaktivace/sacího ventilu/otevření válce 9",
-	"P3466": "Deaktivace válce 9/řízení sacích ventilů Performance",
-	"P3467": "Deaktivace válce 9/obvod ovládání sacího ventilu nízký",
-	"P3468": "Deaktivace válce 9/obvod ovládání sacího ventilu vysoký",
-	"P3469": "Válec 9 Obvod ovládání výfukového ventilu/otevřený ventil",
-	"P3470": "Výkonnost ovládání výfukového ventilu válce 9",
-	"P3471": "Nízký řídicí obvod výfukového ventilu válce 9",
-	"P3472": "Obvod ovládání výfukového ventilu válce 9 vysoký",
-	"P3473": "Obvod ovládání deaktivace/sacího ventilu válce 10/otevřeno",
-	"P3474": "Deaktivace válce 10/řízení sacích ventilů Performance",
-	"P3475": "Nízký obvod ovládání deaktivace / sacího ventilu válce 10",
-	"P3476": "Obvod řízení deaktivace/ sacího ventilu válce 10 vysoký",
-	"P3477": "Válec 10 Řídicí obvod výfukového ventilu/otevřený ventil",
-	"P3478": "Válec 10 Řízení výfukových ventilů Výkon",
-	"P3479": "Nízký řídicí obvod výfukového ventilu válce 10",
-	"P3480": "Obvod ovládání výfukového ventilu válce 10 vysoký",
-	"P3481": "Obvod řízení deaktivace/sacího ventilu/otevření válce 11",
-	"P3482": "Deaktivace válce 11/řízení sacích ventilů Performance",
-	"P3483": "Deaktivace válce 11/obvod ovládání sacího ventilu nízký",
-	"P3484": "Deaktivace válce 11 / obvod ovládání sacího ventilu vysoký",
-	"P3485": "Válec 11 Řídicí obvod výfukového ventilu/otevřený ventil",
-	"P3486": "Válec 11 Řízení výfukových ventilů",
-	"P3487": "Válec 11 Nízký řídicí obvod výfukového ventilu",
-	"P3488": "Obvod ovládání výfukového ventilu 11 vysoký",
-	"P3489": "Obvod řízení deaktivace/sacího ventilu válce 12/otevřeno",
-	"P3490": "Deaktivace válce 12/řízení sacích ventilů Performance",
-	"P3491": "Deaktivace válce 12/obvod ovládání sacího ventilu nízký",
-	"P3492": "Deaktivace válce 12/obvod ovládání sacího ventilu vysoký",
-	"P3493": "Válec 12 Řídicí obvod výfukového ventilu/otevřený ventil",
-	"P3494": "Válec 12 Řízení výfukových ventilů Výkon",
-	"P3495": "Nízký řídicí obvod výfukového ventilu válce 12",
-	"P3496": "Obvod ovládání výfukového ventilu válce 12 vysoký",
-	"P3497": "Systém deaktivace válců",
-        "U0001" : "Vysokorychlostní komunikační sběrnice CAN" , 
-	"U0002" : "Vysokorychlostní komunikační sběrnice CAN (výkon)" , 
-	"U0003" : "Vysokorychlostní komunikační sběrnice CAN (otevřená)" , 
-	"U0004" : "Vysokorychlostní komunikační sběrnice CAN (nízká)" , 
-	"U0005" : "Vysokorychlostní komunikační sběrnice CAN (High)" , 
-	"U0006" : "Vysokorychlostní komunikační sběrnice CAN (otevřená)" , 
-	"U0007" : "Vysokorychlostní komunikační sběrnice CAN (nízká)" , 
-	"U0008" : "Vysokorychlostní komunikační sběrnice CAN (High)" , 
-	"U0009" : "Vysokorychlostní komunikační sběrnice CAN (zkratovaná na sběrnici)" , 
-	"U0010" : "Středně rychlá komunikační sběrnice CAN" , 
-	"U0011" : "Středně rychlá komunikační sběrnice CAN (výkon)" , 
-	"U0012" : "Středně rychlá komunikační sběrnice CAN (otevřená)" , 
-	"U0013" : "Středně rychlá komunikační sběrnice CAN (nízká)" , 
-	"U0014" : "Středně rychlá komunikační sběrnice CAN (vysoká)" , 
-	"U0015" : "Středně rychlá komunikační sběrnice CAN (otevřená)" , 
-	"U0016" : "Středně rychlá komunikační sběrnice CAN (nízká)" , 
-	"U0017" : "Středně rychlá komunikační sběrnice CAN (vysoká)" , 
-	"U0018" : "Středně rychlá komunikační sběrnice CAN (zkratovaná na sběrnici)" , 
-	"U0019" : "Nízkorychlostní komunikační sběrnice CAN" , 
-	"U0020" : "Nízkorychlostní komunikační sběrnice CAN (výkon)" , 
-	"U0021" : "Nízkorychlostní komunikační sběrnice CAN (otevřená)" , 
-	"U0022" : "Nízkorychlostní komunikační sběrnice CAN (nízká)" , 
-	"U0023" : "Nízkorychlostní komunikační sběrnice CAN (vysoká)" , 
-	"U0024" : "Nízkorychlostní komunikační sběrnice CAN (otevřená)" , 
-	"U0025" : "Nízkorychlostní komunikační sběrnice CAN (nízká)" , 
-	"U0026" : "Nízkorychlostní komunikační sběrnice CAN (vysoká)" , 
-	"U0027" : "Nízkorychlostní komunikační sběrnice CAN (zkratovaná na sběrnici)" , 
-	"U0028" : "Komunikační sběrnice vozidla A" , 
-	"U0029" : "Komunikační sběrnice vozidla A (výkon)" , 
-	"U0030" : "Komunikační sběrnice vozidla A (otevřená)" , 
-	"U0031" : "Komunikační sběrnice vozidla A (nízká)" , 
-	"U0032" : "Komunikační sběrnice vozidla A (vysoká)" , 
-	"U0033" : "Komunikační sběrnice vozidla A (otevřená)" , 
-	"U0034" : "Komunikační sběrnice vozidla A (nízká)" , 
-	"U0035" : "Komunikační sběrnice vozidla A (vysoká)" , 
-	"U0036" : "Komunikační sběrnice vozidla A (zkratovaná na sběrnici A)" , 
-	"U0037" : "Komunikační sběrnice vozidla B" , 
-	"U0038" : "Komunikační sběrnice vozidla B (výkon)" , 
-	"U0039" : "Komunikační sběrnice vozidla B (otevřená)" , 
-	"U0040" : "Komunikační sběrnice vozidla B (nízká)" , 
-	"U0041" : "Komunikační sběrnice vozidla B (vysoká)" , 
-	"U0042" : "Komunikační sběrnice vozidla B (otevřená)" , 
-	"U0043" : "Komunikační sběrnice vozidla B (nízká)" , 
-	"U0044" : "Komunikační sběrnice vozidla B (vysoká)" , 
-	"U0045" : "Komunikační sběrnice vozidla B (zkratovaná na sběrnici B)" , 
-	"U0046" : "Komunikační sběrnice vozidla C" , 
-	"U0047" : "Komunikační sběrnice vozidla C (výkon)" , 
-	"U0048" : "Komunikační sběrnice vozidla C (otevřená)" , 
-	"U0049" : "Komunikační sběrnice vozidla C (nízká)" , 
-	"U0050" : "Komunikační sběrnice vozidla C (vysoká)" , 
-	"U0051" : "Komunikační sběrnice vozidla C (otevřená)" , 
-	"U0052" : "Komunikační sběrnice vozidla C (nízká)" , 
-	"U0053" : "Komunikační sběrnice vozidla C (vysoká)" , 
-	"U0054" : "Komunikační sběrnice vozidla C (zkratovaná na sběrnici C)" , 
-	"U0055" : "Komunikační sběrnice vozidla D" , 
-	"U0056" : "Komunikační sběrnice vozidla D (výkon)" , 
-	"U0057" : "Komunikační sběrnice vozidla D (otevřená)" , 
-	"U0058" : "Komunikační sběrnice vozidla D (nízká)" , 
-	"U0059" : "Komunikační sběrnice vozidla D (vysoká)" , 
-	"U0060" : "Komunikační sběrnice vozidla D (otevřená)" , 
-	"U0061" : "Komunikační sběrnice vozidla D (nízká)" , 
-	"U0062" : "Komunikační sběrnice vozidla D (vysoká)" , 
-	"U0063" : "Komunikační sběrnice vozidla D (zkratovaná na sběrnici D)" , 
-	"U0064" : "Komunikační sběrnice vozidla E" , 
-	"U0065" : "Komunikační sběrnice vozidla E (výkon)" , 
-	"U0066" : "Komunikační sběrnice vozidla E (otevřená)" , 
-	"U0067" : "Komunikační sběrnice vozidla E (nízká)" , 
-	"U0068" : "Komunikační sběrnice vozidla E (vysoká)" , 
-	"U0069" : "Komunikační sběrnice vozidla E (otevřená)" , 
-	"U0070" : "Komunikační sběrnice vozidla E (nízká)" , 
-	"U0071" : "Komunikační sběrnice vozidla E (vysoká)" , 
-	"U0072" : "Komunikační sběrnice vozidla E (zkratovaná na sběrnici E)" , 
-	"U0073" : "Komunikační sběrnice řídicího modulu Vypnuto" , 
-	"U0074" : "Rezervováno J2012" , 
-	"U0075" : "Rezervováno J2012" , 
-	"U0076" : "Rezervováno J2012" , 
-	"U0077" : "Rezervováno J2012" , 
-	"U0078" : "Rezervováno J2012" , 
-	"U0079" : "Rezervováno J2012" , 
-	"U0080" : "Rezervováno J2012" , 
-	"U0081" : "Rezervováno J2012" , 
-	"U0082" : "Rezervováno J2012" , 
-	"U0083" : "Rezervováno J2012" , 
-	"U0084" : "Rezervováno J2012" , 
-	"U0085" : "Rezervováno J2012" , 
-	"U0086" : "Rezervováno J2012" , 
-	"U0087" : "Rezervováno J2012" , 
-	"U0088" : "Rezervováno J2012" , 
-	"U0089" : "Rezervováno J2012" , 
-	"U0090" : "Rezervováno J2012" , 
-	"U0091" : "Rezervováno J2012" , 
-	"U0092" : "Rezervováno J2012" , 
-	"U0093" : "Rezervováno J2012" , 
-	"U0094" : "Rezervováno J2012" , 
-	"U0095" : "Rezervováno J2012" , 
-	"U0096" : "Rezervováno J2012" , 
-	"U0097" : "Rezervováno J2012" , 
-	"U0098" : "Rezervováno J2012" , 
-	"U0099" : "Rezervováno J2012" , 
-	"U0100" : "Ztráta komunikace s ECM/PCM A" , 
-	"U0101" : "Ztráta komunikace s TCM" , 
-	"U0102" : "Ztráta komunikace s řídicím modulem převodovky" , 
-	"U0103" : "Ztráta komunikace s modulem řazení" , 
-	"U0104" : "Ztráta komunikace s modulem tempomatu" , 
-	"U0105" : "Ztráta komunikace s řídicím modulem vstřikovače paliva" , 
-	"U0106" : "Ztráta komunikace s řídicím modulem žhavicích svíček" , 
-	"U0107" : "Ztráta komunikace s řídicím modulem škrticí klapky" , 
-	"U0108" : "Ztráta komunikace s řídicím modulem alternativního paliva" , 
-	"U0109" : "Ztráta komunikace s řídicím modulem palivového čerpadla" , 
-	"U0110" : "Ztráta komunikace s řídicím modulem motoru pohonu" , 
-	"U0111" : "Ztráta komunikace s řídicím modulem energie baterie 'A'" , 
-	"U0112" : "Ztráta komunikace s modulem řízení energie baterie 'B'" , 
-	"U0113" : "Ztráta komunikace s informacemi o kritických kontrolách emisí" , 
-	"U0114" : "Ztráta komunikace s řídicím modulem spojky pohonu všech kol" , 
-	"U0115" : "Ztráta komunikace s ECM/PCM B" , 
-	"U0116" : "Rezervováno J2012" , 
-	"U0117" : "Rezervováno J2012" , 
-	"U0118" : "Rezervováno J2012" , 
-	"U0119" : "Rezervováno J2012" , 
-	"U0120" : "Rezervováno J2012" , 
-	"U0121" : "Ztráta komunikace s řídicím modulem protiblokovacího brzdového systému (ABS)" , 
-	"U0122" : "Ztráta komunikace s řídicím modulem dynamiky vozidla" , 
-	"U0123" : "Ztráta komunikace s modulem snímače výchylky" , 
-	"U0124" : "Ztráta komunikace s modulem snímače bočního zrychlení" , 
-	"U0125" : "Ztráta komunikace s víceosým modulem snímače zrychlení" , 
-	"U0126" : "Ztráta komunikace s modulem snímače úhlu řízení" , 
-	"U0127" : "Ztráta komunikace s modulem sledování tlaku v pneumatikách" , 
-	"U0128" : "Ztráta komunikace s řídicím modulem parkovací brzdy" , 
-	"U0129" : "Ztráta komunikace s řídicím modulem brzdového systému" , 
-	"U0130" : "Ztráta komunikace s řídicím modulem řízení" , 
-	"U0131" : "Ztráta komunikace s řídicím modulem posilovače řízení" , 
-	"U0132" : "Ztráta komunikace s modulem řízení úrovně jízdy" , 
-	"U0133" : "Rezervováno J2012" , 
-	"U0134" : "Rezervováno J2012" , 
-	"U0135" : "Rezervováno J2012" , 
-	"U0136" : "Rezervováno J2012" , 
-	"U0137" : "Rezervováno J2012" , 
-	"U0138" : "Rezervováno J2012" , 
-	"U0139" : "Rezervováno J2012" , 
-	"U0140" : "Ztráta komunikace s řídicím modulem karoserie" , 
-	"U0141" : "Ztráta komunikace s řídicím modulem karoserie 'A'" , 
-	"U0142" : "Ztráta komunikace s řídicím modulem karoserie 'B'" , 
-	"U0143" : "Ztráta komunikace s řídicím modulem karoserie 'C'" , 
-	"U0144" : "Ztráta komunikace s řídicím modulem karoserie 'D'" , 
-	"U0145" : "Ztráta komunikace s řídicím modulem karoserie 'E'" , 
-	"U0146" : "Ztráta komunikace s bránou 'A'" , 
-	"U0147" : "Ztráta komunikace s bránou B" , 
-	"U0148" : "Ztráta komunikace s bránou 'C'" , 
-	"U0149" : "Ztráta komunikace s bránou 'D'" , 
-	"U0150" : "Ztráta komunikace s bránou 'E'" , 
-	"U0151" : "Ztráta komunikace s řídicím modulem zádržných systémů" , 
-	"U0152" : "Ztráta komunikace s řídicím modulem bočních zádržných systémů vlevo" , 
-	"U0153" : "Ztráta komunikace s řídicím modulem bočních zádržných systémů vpravo" , 
-	"U0154" : "Ztráta komunikace se zádržnými systémy Modul řízení snímání polohy cestujících" , 
-	"U0155" : "Ztráta komunikace s řídicím modulem sdružených přístrojů (IPC)" , 
-	"U0156" : "Ztráta komunikace s informačním centrem 'A'" , 
-	"U0157" : "Ztráta komunikace s informačním centrem 'B'" , 
-	"U0158" : "Ztráta komunikace s hlavním displejem" , 
-	"U0159" : "Ztráta komunikace s řídicím modulem parkovacího asistenta" , 
-	"U0160" : "Ztráta komunikace s řídicím modulem zvukové výstrahy" , 
-	"U0161" : "Ztráta komunikace s modulem kompasu" , 
-	"U0162" : "Ztráta komunikace s navigačním zobrazovacím modulem" , 
-	"U0163" : "Ztráta komunikace s navigačním řídicím modulem" , 
-	"U0164" : "Ztráta komunikace s řídicím modulem HVAC" , 
-	"U0165" : "Ztráta komunikace s řídicím modulem HVAC vzadu" , 
-	"U0166" : "Ztráta komunikace s řídicím modulem pomocného topení" , 
-	"U0167" : "Ztráta komunikace s řídicím modulem imobilizéru vozidla" , 
-	"U0168" : "Ztráta komunikace s řídicím modulem zabezpečení vozidla" , 
-	"U0169" : "Ztráta komunikace s řídicím modulem střešního okna" , 
-	"U0170" : "Ztráta komunikace s čidlem zádržného systému A" , 
-	"U0171" : "Ztráta komunikace s čidlem zádržného systému B" , 
-	"U0172" : "Ztráta komunikace s čidlem zádržného systému C" , 
-	"U0173" : "Ztráta komunikace s čidlem zádržného systému D" , 
-	"U0174" : "Ztráta komunikace s čidlem zádržného systému E" , 
-	"U0175" : "Ztráta komunikace s čidlem zádržného systému F" , 
-	"U0176" : "Ztráta komunikace s čidlem zádržného systému G" , 
-	"U0177" : "Ztráta komunikace s čidlem zádržného systému H" , 
-	"U0178" : "Ztráta komunikace s Senzorem zádržného systému I" , 
-	"U0179" : "Ztráta komunikace s čidlem zádržného systému J" , 
-	"U0180" : "Ztráta komunikace s modulem automatického řízení osvětlení" , 
-	"U0181" : "Ztráta komunikace s řídicím modulem vyrovnávání světlometů" , 
-	"U0182" : "Ztráta komunikace s řídicím modulem osvětlení vpředu" , 
-	"U0183" : "Ztráta komunikace s řídicím modulem osvětlení vzadu" , 
-	"U0184" : "Ztráta komunikace s rádiem" , 
-	"U0185" : "Ztráta komunikace s řídicím modulem antény" , 
-	"U0186" : "Ztráta komunikace se zvukovým zesilovačem" , 
-	"U0187" : "Ztráta komunikace s modulem 'A' digitálního přehrávače/měniče disků" , 
-	"U0188" : "Ztráta komunikace s modulem 'B' digitálního přehrávače/měniče disků" , 
-	"U0189" : "Ztráta komunikace s modulem 'C' digitálního přehrávače/měniče disků" , 
-	"U0190" : "Ztráta komunikace s modulem 'D' digitálního přehrávače/měniče disků" , 
-	"U0191" : "Ztráta komunikace s televizí" , 
-	"U0192" : "Ztráta komunikace s osobním počítačem" , 
-	"U0193" : "Ztráta komunikace s Digitálním řídicím modulem zvuku A" , 
-	"U0194" : "Ztráta komunikace s modulem modulem digitálního ovládání zvuku B" , 
-	"U0195" : "Ztráta komunikace s modulem přijímače předplatného pro zábavu" , 
-	"U0196" : "Ztráta komunikace s řídicím modulem zábavy na zadních sedadlech" , 
-	"U0197" : "Ztráta komunikace s řídicím modulem telefonu" , 
-	"U0198" : "Ztráta komunikace s řídicím modulem Telematic" , 
-	"U0199" : "Ztráta komunikace s modulem řízení dveří A" , 
-	"U0200" : "Ztráta komunikace s řídicím modulem dveří B" , 
-	"U0201" : "Ztráta komunikace s modulem řízení dveří C" , 
-	"U0202" : "Ztráta komunikace s řídicím modulem dveří D" , 
-	"U0203" : "Ztráta komunikace s modulem řízení dveří E" , 
-	"U0204" : "Ztráta komunikace s modulem řízení dveří F" , 
-	"U0205" : "Ztráta komunikace s modulem řízení dveří G" , 
-	"U0206" : "Ztráta komunikace s řídicím modulem skládací střechy" , 
-	"U0207" : "Ztráta komunikace s řídicím modulem pohyblivé střechy" , 
-	"U0208" : "Ztráta komunikace s řídicím modulem sedadla A" , 
-	"U0209" : "Ztráta komunikace s řídicím modulem sedadla B" , 
-	"U0210" : "Ztráta komunikace s řídicím modulem sedadla C" , 
-	"U0211" : "Ztráta komunikace s řídicím modulem sedadla D" , 
-	"U0212" : "Ztráta komunikace s řídicím modulem sloupku řízení" , 
-	"U0213" : "Ztráta komunikace s řídicím modulem zrcadla" , 
-	"U0214" : "Ztráta komunikace s dálkovým ovládáním funkcí" , 
-	"U0215" : "Ztráta komunikace se spínačem dveří A" , 
-	"U0216" : "Ztráta komunikace se spínačem dveří B" , 
-	"U0217" : "Ztráta komunikace se spínačem dveří C" , 
-	"U0218" : "Ztráta komunikace se spínačem dveří D" , 
-	"U0219" : "Ztráta komunikace se spínačem dveří E" , 
-	"U0220" : "Ztráta komunikace se spínačem dveří F" , 
-	"U0221" : "Ztráta komunikace se spínačem dveří G" , 
-	"U0222" : "Ztráta komunikace s motorem okna dveří A" , 
-	"U0223" : "Ztráta komunikace s motorem oken dveří B" , 
-	"U0224" : "Ztráta komunikace s motorem oken dveří C" , 
-	"U0225" : "Ztráta komunikace s motorem okna dveří D" , 
-	"U0226" : "Ztráta komunikace s motorem okna dveří E" , 
-	"U0227" : "Ztráta komunikace s motorem oken dveří F" , 
-	"U0228" : "Ztráta komunikace s motorem oken dveří G" , 
-	"U0229" : "Ztráta komunikace s modulem vyhřívaného volantu" , 
-	"U0230" : "Ztráta komunikace s modulem zadní brány" , 
-	"U0231" : "Ztráta komunikace s modulem dešťového senzoru" , 
-	"U0232" : "Ztráta komunikace s řídicím modulem detekce bočních překážek vlevo" , 
-	"U0233" : "Ztráta komunikace s řídicím modulem detekce bočních překážek vpravo" , 
-	"U0234" : "Ztráta komunikace s modulem Convenience Recall" , 
-	"U0235" : "Ztráta komunikace s předním snímačem vzdálenosti tempomatu" , 
-	"U0300" : "Nekompatibilita softwaru interního řídicího modulu" , 
-	"U0301" : "Nekompatibilita softwaru s ECM/PCM" , 
-	"U0302" : "Nekompatibilita softwaru s řídicím modulem převodovky" , 
-	"U0303" : "Nekompatibilita softwaru s řídicím modulem převodovky" , 
-	"U0304" : "Nekompatibilita softwaru s modulem pro ovládání řazení převodových stupňů" , 
-	"U0305" : "Softwarová nekompatibilita s modulem tempomatu" , 
-	"U0306" : "Nekompatibilita softwaru s řídicím modulem vstřikovače paliva" , 
-	"U0307" : "Nekompatibilita softwaru s řídicím modulem žhavicích svíček" , 
-	"U0308" : "Nekompatibilita softwaru s řídicím modulem škrticí klapky" , 
-	"U0309" : "Nekompatibilita softwaru s řídicím modulem alternativního paliva" , 
-	"U0310" : "Nekompatibilita softwaru s řídicím modulem palivového čerpadla" , 
-	"U0311" : "Nekompatibilita softwaru s řídicím modulem motoru pohonu" , 
-	"U0312" : "Softwarová nekompatibilita s modulem řízení energie baterie A" , 
-	"U0313" : "Softwarová nekompatibilita s modulem řízení energie baterie B" , 
-	"U0314" : "Nekompatibilita softwaru s řídicím modulem spojky pohonu všech kol" , 
-	"U0315" : "Nekompatibilita softwaru s řídicím modulem protiblokovacího brzdového systému" , 
-	"U0316" : "Nekompatibilita softwaru s modulem řízení dynamiky vozidla" , 
-	"U0317" : "Nekompatibilita softwaru s modulem řízení parkovací brzdy" , 
-	"U0318" : "Nekompatibilita softwaru s řídicím modulem brzdového systému" , 
-	"U0319" : "Softwarová nekompatibilita s modulem řízení síly řízení" , 
-	"U0320" : "Softwarová nekompatibilita s řídicím modulem posilovače řízení" , 
-	"U0321" : "Nekompatibilita softwaru s modulem řízení úrovně jízdy" , 
-	"U0322" : "Nekompatibilita softwaru s řídicím modulem karoserie" , 
-	"U0323" : "Nekompatibilita softwaru s řídicím modulem panelu přístrojů" , 
-	"U0324" : "Nekompatibilita softwaru s řídicím modulem HVAC" , 
-	"U0325" : "Nekompatibilita softwaru s řídicím modulem pomocného topení" , 
-	"U0326" : "Nekompatibilita softwaru s řídicím modulem imobilizéru vozidla" , 
-	"U0327" : "Nekompatibilita softwaru s řídicím modulem zabezpečení vozidla" , 
-	"U0328" : "Nekompatibilita softwaru s modulem snímače úhlu řízení" , 
-	"U0329" : "Nekompatibilita softwaru s řídicím modulem sloupku řízení" , 
-	"U0330" : "Nekompatibilita softwaru s modulem sledování tlaku v pneumatikách" , 
-	"U0331" : "Nekompatibilita softwaru s řídicím modulem karoserie 'A'" , 
-	"U0400" : "Neplatná přijatá data" , 
-	"U0401" : "Neplatná data přijatá z ECM/PCM" , 
-	"U0402" : "Neplatná data přijatá z modulu řízení přenosu" , 
-	"U0403" : "Neplatná data přijatá z řídicího modulu převodovky" , 
-	"U0404" : "Neplatná data přijatá z modulu řízení řazení převodových stupňů" , 
-	"U0405" : "Neplatná data přijatá z modulu tempomatu" , 
-	"U0406" : "Neplatná data přijatá z řídicího modulu vstřikovače paliva" , 
-	"U0407" : "Neplatná data přijatá z řídicího modulu žhavicích svíček" , 
-	"U0408" : "Neplatná data přijatá z řídicího modulu škrticí klapky" , 
-	"U0409" : "Neplatné údaje přijaté z modulu řízení alternativního paliva" , 
-	"U0410" : "Neplatná data přijatá z řídicího modulu palivového čerpadla" , 
-	"U0411" : "Neplatná data přijatá z řídicího modulu motoru pohonu" , 
-	"U0412" : "Neplatná data přijatá z modulu řízení energie baterie A" , 
-	"U0413" : "Neplatná data přijatá z modulu řízení energie baterie B" , 
-	"U0414" : "Neplatná data přijatá z řídicího modulu spojky pohonu všech kol" , 
-	"U0415" : "Neplatné údaje přijaté z řídicího modulu protiblokovacího brzdového systému" , 
-	"U0416" : "Neplatná data přijatá z řídicího modulu dynamiky vozidla" , 
-	"U0417" : "Neplatná data přijatá z řídicího modulu parkovací brzdy" , 
-	"U0418" : "Neplatná data přijatá z řídicího modulu brzdového systému" , 
-	"U0419" : "Neplatné údaje přijaté z modulu řízení síly řízení" , 
-	"U0420" : "Neplatné údaje přijaté z řídicího modulu posilovače řízení" , 
-	"U0421" : "Neplatná data přijatá z modulu řízení úrovně jízdy" , 
-	"U0422" : "Neplatná data přijatá z řídicího modulu karoserie" , 
-	"U0423" : "Neplatná data přijatá z řídicího modulu panelu přístrojů" , 
-	"U0424" : "Neplatná data přijatá z řídicího modulu HVAC" , 
-	"U0425" : "Neplatná data přijatá z řídicího modulu pomocného topení" , 
-	"U0426" : "Neplatné údaje přijaté z řídicího modulu imobilizéru vozidla" , 
-	"U0427" : "Neplatné údaje přijaté z řídicího modulu zabezpečení vozidla" , 
-	"U0428" : "Neplatná data přijatá z modulu snímače úhlu řízení" , 
-	"U0429" : "Neplatná data přijatá z řídicího modulu sloupku řízení" , 
-	"U0430" : "Neplatné údaje přijaté z modulu sledování tlaku v pneumatikách" , 
-	"U0431" : "Neplatná data přijatá z řídicího modulu karoserie 'A'" 
+# the DTC descriptions are shared with the obd package, see obd/dtc.py
+from obd.dtc import load
+
+pcodes = load()
 
-}
 
 pcode_classes = {
     "P00XX": "Dávkování paliva a vzduchu a pomocné řízení emisí",
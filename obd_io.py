@@ -74,7 +74,8 @@ class OBDConnection:
                 self.connection.close()
             except:
                 pass
-            self.connection = obd.OBD(portstr=portnum, baudrate=baud, protocol=None, fast=FAST, timeout=truncate(float(SERTIMEOUT),1), check_voltage=False, start_low_power=False)
+            # sampled in the background by pyobd's Sampler, long sessions only keep the values
+            self.connection = obd.Async(portstr=portnum, baudrate=baud, protocol=None, fast=FAST, timeout=truncate(float(SERTIMEOUT),1), check_voltage=False, start_low_power=False, delay_cmds=0.1, keep_messages=False)
             if self.connection.status() == "Připojení k automobilu":
                 wx.PostEvent(self._notify_window, DebugEvent([2, "Connected to: "+ str(self.connection.port_name())]))
                 break
@@ -100,7 +101,8 @@ class OBDConnection:
         """Clears all DTCs and freeze frame data"""
         #self.send_command(CLEAR_DTC_COMMAND)
         #r = self.get_result()
-        r = self.connection.query(obd.commands["CLEAR_DTC"])
+        with self.connection.paused():  # Async.query() only returns watched values
+            r = obd.OBD.query(self.connection, obd.commands["CLEAR_DTC"])
         return r
 
     def log(self, sensor_index, filename): 
@@ -27,7 +27,6 @@
 #import pint
 #from mem_top import mem_top
 #import logging
-import numpy as np
 #import multiprocessing
 #from multiprocessing import Queue, Process
 # import wxversion
@@ -56,6 +55,8 @@ import os  # os.environ
 #import glob
 import datetime
 import threading
+import queue
+import concurrent.futures
 import sys
 import serial
 #import platform
@@ -73,6 +74,8 @@ import obd
 #from obd import OBDStatus
 
 from obd.utils import OBDStatus
+from obd.sampler import Sampler
+import numpy as np
 
 
 
@@ -93,9 +96,6 @@ ID_HELP_VISIT = 509
 ID_HELP_ORDER = 510
 
 # Define notification event for sensor result window
-EVT_RESULT_ID = 1000
-EVT_GRAPH_VALUE_ID = 1036
-EVT_GRAPHS_VALUE_ID = 1048
 EVT_GRAPH_ID = 1035
 EVT_GRAPHS_ID = 1049
 EVT_COMBOBOX = 1036
@@ -107,9 +107,11 @@ EVT_COMBOBOXGRAPH_GETSELECTION_ID = 1040
 EVT_COMBOBOXGRAPHS_GETSELECTION_ID = 1046
 EVT_COMBOBOXGRAPH_SETSELECTION_ID = 1044
 EVT_COMBOBOXGRAPHS_SETSELECTION_ID = 1047
-EVT_INSERT_SENSOR_ROW_ID = 1041
-EVT_INSERT_FREEZEFRAME_ROW_ID = 1042
-EVT_FREEZEFRAME_RESULT_ID = 1043
+EVT_SNAPSHOT_ID = 1050
+
+# commands for the producer thread, see MyApp.producer_commands
+CMD_CLEAR_DTC = 1
+CMD_REREAD_DTC = 2
 
 lock = threading.Lock()
 
@@ -139,6 +141,29 @@ TESTS = ["MONITOROVÁNÍ CHYBNÝCH ZÁŽEHŮ",
     "MONITOROVÁNÍ SENZORU VÝFUKOVÝCH PLYNŮ",
     "MONITOROVÁNÍ PM FILTRU"]
 
+# the STATUS monitors behind the first rows of the tests tab, in the order of TESTS
+MONITORS = ("MISFIRE_MONITORING",
+    "FUEL_SYSTEM_MONITORING",
+    "COMPONENT_MONITORING",
+    "CATALYST_MONITORING",
+    "HEATED_CATALYST_MONITORING",
+    "EVAPORATIVE_SYSTEM_MONITORING",
+    "SECONDARY_AIR_SYSTEM_MONITORING",
+    "OXYGEN_SENSOR_MONITORING",
+    "OXYGEN_SENSOR_HEATER_MONITORING",
+    "EGR_VVT_SYSTEM_MONITORING",
+    "NMHC_CATALYST_MONITORING",
+    "NOX_SCR_AFTERTREATMENT_MONITORING",
+    "BOOST_PRESSURE_MONITORING",
+    "EXHAUST_GAS_SENSOR_MONITORING",
+    "PM_FILTER_MONITORING")
+
+# and the misfire counts in the rows after them
+MISFIRE_MONITORS = [obd.commands["MONITOR_MISFIRE_CYLINDER_%d" % n] for n in range(1, 13)]
+
+# mode 01/02 PIDs that aren't shown as sensors (PID bitmaps, status and the like)
+NOT_SENSOR_PIDS = (0x00, 0x01, 0x02, 0x03, 0x13, 0x1C, 0x20, 0x40, 0x41, 0x51)
+
 def EVT_RESULT(win, func, id):
     """Define Result Event."""
     win.Connect(-1, -1, id, func)
@@ -160,41 +185,14 @@ class MyPanel(wx.Panel):
     def OnCombo(self, event):
         self.label2.SetLabel("You Like " + self.combobox.GetValue())
 """
-# event pro akutalizaci Trace tabu
-class ResultEvent(wx.PyEvent):
-    """Simple event to carry arbitrary result data."""
-
-    def __init__(self, data):
-        """Init Result Event."""
-        wx.PyEvent.__init__(self)
-        self.SetEventType(EVT_RESULT_ID)
-        self.data = data
-
-class FreezeframeResultEvent(wx.PyEvent):
+# event pro aktualizaci tabulek (sensors, freezeframe, tests, graph values)
+class SnapshotEvent(wx.PyEvent):
     """Simple event to carry arbitrary result data."""
 
     def __init__(self, data):
         """Init Result Event."""
         wx.PyEvent.__init__(self)
-        self.SetEventType(EVT_FREEZEFRAME_RESULT_ID)
-        self.data = data
-
-class InsertSensorRowEvent(wx.PyEvent):
-    """Simple event to carry arbitrary result data."""
-
-    def __init__(self, data):
-        """Init Result Event."""
-        wx.PyEvent.__init__(self)
-        self.SetEventType(EVT_INSERT_SENSOR_ROW_ID)
-        self.data = data
-
-class InsertFreezeframeRowEvent(wx.PyEvent):
-    """Simple event to carry arbitrary result data."""
-
-    def __init__(self, data):
-        """Init Result Event."""
-        wx.PyEvent.__init__(self)
-        self.SetEventType(EVT_INSERT_FREEZEFRAME_ROW_ID)
+        self.SetEventType(EVT_SNAPSHOT_ID)
         self.data = data
 
 class BuildComboBoxGraphEvent(wx.PyEvent):
@@ -262,24 +260,6 @@ class SetSelectionComboBoxGraphsEvent(wx.PyEvent):
 
 
 
-class GraphValueEvent(wx.PyEvent):
-    """Simple event to carry arbitrary result data."""
-
-    def __init__(self, data):
-        """Init Result Event."""
-        wx.PyEvent.__init__(self)
-        self.SetEventType(EVT_GRAPH_VALUE_ID)
-        self.data = data
-
-class GraphsValueEvent(wx.PyEvent):
-    """Simple event to carry arbitrary result data."""
-
-    def __init__(self, data):
-        """Init Result Event."""
-        wx.PyEvent.__init__(self)
-        self.SetEventType(EVT_GRAPHS_VALUE_ID)
-        self.data = data
-
 
 class GraphEvent(wx.PyEvent):
     """Simple event to carry arbitrary result data."""
@@ -336,18 +316,148 @@ class CloseEvent(wx.PyEvent):
         self.data = data
 
 
-# event pro aktualizaci tests tabu
-EVT_TESTS_ID = 1003
 
+# GNOME/Ubuntu sessions only show what PlotCanvas.Draw() painted after a repaint
+REFRESH_AFTER_DRAW = sys.platform.startswith("linux") and \
+    os.environ.get("DESKTOP_SESSION") in ("gnome", "ubuntu")
 
-class TestEvent(wx.PyEvent):
-    """Simple event to carry arbitrary result data."""
 
-    def __init__(self, data):
-        """Init Result Event."""
-        wx.PyEvent.__init__(self)
-        self.SetEventType(EVT_TESTS_ID)
-        self.data = data
+class GraphRenderer:
+    """
+        Draws a sensor history on one PlotCanvas. The canvas, the line and
+        its PlotGraphics live as long as the renderer; a new sample only
+        replaces the line's points. Samples that arrive within one frame
+        are coalesced into a single redraw.
+    """
+
+    FRAME_MS = 16  # ~60 Hz display refresh
+    STATS_EVERY = 100  # frames between frame time reports
+
+    def __init__(self, parent, pos, size, width):
+        self.canvas = wxplot.PlotCanvas(parent, pos=pos)
+        self.canvas.SetInitialSize(size=wx.Size(*size))
+        self.width = width  # samples shown on the x axis
+        self.line = None
+        self.graphics = None
+        self.labels = None  # (title, unit) of self.graphics
+        self.pending = None  # newest (x, y, title, unit, counter), not drawn yet
+        self.updates = 0
+        self.frames = 0
+        self.frame_time = 0.0  # moving average of the draw time, in seconds
+
+    def update(self, x, y, title, unit, counter):
+        """ queues a redraw with the given history, at most one per frame """
+        self.updates += 1
+        if self.pending is None:
+            wx.CallLater(self.FRAME_MS, self.draw)
+        self.pending = (x, y, title, unit, counter)
+
+    def draw(self):
+        if self.pending is None or not self.canvas:
+            return  # nothing new, or the canvas was destroyed meanwhile
+        x, y, title, unit, counter = self.pending
+        self.pending = None
+        start = time.perf_counter()
+
+        points = np.column_stack((x, y))
+        if self.line is None:
+            self.line = wxplot.PolySpline(points, colour='blue', width=1, style=wx.PENSTYLE_SOLID)
+        else:
+            self.line.points = points
+        if self.labels != (title, unit):
+            self.graphics = wxplot.PlotGraphics([self.line], title, 'frame', unit)
+            self.labels = (title, unit)
+
+        self.canvas.Draw(self.graphics, xAxis=(counter - self.width, counter))
+        if REFRESH_AFTER_DRAW:
+            self.canvas.Refresh()
+
+        elapsed = time.perf_counter() - start
+        if self.frames == 0:
+            self.frame_time = elapsed
+        else:
+            self.frame_time = 0.9 * self.frame_time + 0.1 * elapsed
+        self.frames += 1
+        if self.frames % self.STATS_EVERY == 0:
+            print("Graph %s: %d frames for %d samples, %.1f ms per frame" %
+                  (title, self.frames, self.updates, 1000 * self.frame_time))
+
+    def destroy(self):
+        self.pending = None
+        if self.canvas:
+            self.canvas.Destroy()
+
+
+class UISnapshot:
+    """
+        Collects the table cells the producer thread changes during one
+        refresh cycle. flush() posts them to the GUI as a single
+        SnapshotEvent, holding only the cells whose text differs from what
+        was posted before. Cleared tables are emptied first, then the
+        inserted rows are applied, then the cells.
+    """
+
+    STATS_EVERY = 5.0  # seconds between event rate reports
+
+    def __init__(self, window):
+        self.window = window
+        self.cleared = []  # tables emptied this cycle
+        self.rows = []  # (table, row) inserted this cycle
+        self.cells = {}  # key = (table, row, col), value = text, changed this cycle
+        self.sent = {}  # key = (table, row, col), value = text last posted
+        self.posted = 0  # snapshots posted, by the producer thread
+        self.applied_snapshots = 0  # snapshots applied, by the GUI thread
+        self.applied_cells = 0  # each of them used to be a separate event
+        self.stats_start = time.monotonic()
+        self.stats_posted = 0  # self.posted at stats_start
+
+    def clear(self, table):
+        self.cleared.append(table)
+        self.rows = [(t, row) for t, row in self.rows if t != table]
+        for key in [key for key in self.cells if key[0] == table]:
+            del self.cells[key]
+        for key in [key for key in self.sent if key[0] == table]:
+            del self.sent[key]
+
+    def insert_row(self, table, row):
+        self.rows.append((table, row))
+        # the rows below move down, so their cells have to be sent again
+        for key in [key for key in self.sent if key[0] == table and key[1] >= row]:
+            del self.sent[key]
+
+    def set(self, table, row, col, text):
+        key = (table, row, col)
+        if self.sent.get(key) == text:
+            self.cells.pop(key, None)
+        else:
+            self.cells[key] = text
+
+    def flush(self):
+        """ posts this cycle's changes, if there are any """
+        if not self.cleared and not self.rows and not self.cells:
+            return
+        wx.PostEvent(self.window, SnapshotEvent((self.cleared, self.rows, self.cells, self)))
+        self.sent.update(self.cells)
+        self.posted += 1
+        self.cleared = []
+        self.rows = []
+        self.cells = {}
+
+    def applied(self, cells):
+        """ called by the GUI thread for every snapshot it applied """
+        self.applied_snapshots += 1
+        self.applied_cells += cells
+        now = time.monotonic()
+        elapsed = now - self.stats_start
+        if elapsed >= self.STATS_EVERY:
+            posted = self.posted
+            print("UI snapshots: %.1f/s posted, %.1f/s applied with %.1f cells/s" %
+                  ((posted - self.stats_posted) / elapsed, self.applied_snapshots / elapsed,
+                   self.applied_cells / elapsed))
+            self.stats_start = now
+            self.stats_posted = posted
+            self.applied_snapshots = 0
+            self.applied_cells = 0
 
 
 # defines notification event for debug tracewindow
@@ -373,6 +483,8 @@ class MyApp(wx.App):
             self.baudrate = BAUDRATE
             self.FAST = FAST
             self._nb = _nb
+            self.stop_event = _notify_window.producer_stop  # set by the GUI to end run()
+            self.commands = _notify_window.producer_commands  # CMD_* from the GUI
             threading.Thread.__init__(self)
             self.state = "started"
 
@@ -394,9 +506,18 @@ class MyApp(wx.App):
                 wx.PostEvent(self._notify_window, DebugEvent([1, "Komunikace inicializována..."]))
                 wx.PostEvent(self._notify_window, StatusEvent([0, 1, "Připojení k autu!"]))
 
-                r = self.connection.connection.query(obd.commands.ELM_VERSION)
+                self.sampler = Sampler(self.connection.connection)
+
+                # what the car supports is known from the PID bitmaps read
+                # while connecting, so the tabs don't probe every command
+                self.sensor_commands = [c for c in self.sampler.supported(1) if c.pid not in NOT_SENSOR_PIDS]
+                self.freezeframe_commands = [c for c in self.sampler.supported(2) if c.pid not in NOT_SENSOR_PIDS]
+                self.misfire_commands = [c for c in MISFIRE_MONITORS if self.connection.connection.supports(c)]
+                self.graph_commands = self.sensor_commands + [obd.commands.ELM_VOLTAGE]
+
+                r = self.sampler.query(obd.commands.ELM_VERSION)
                 self.ELMver = str(r.value)
-                r = self.connection.connection.query(obd.commands.ELM_VOLTAGE)
+                r = self.sampler.query(obd.commands.ELM_VOLTAGE)
                 self.ELMvoltage = str(r.value)
                 wx.PostEvent(self._notify_window, StatusEvent([5, 1, str(self.ELMvoltage)]))
                 self.protocol = self.connection.connection.protocol_name()
@@ -405,7 +526,7 @@ class MyApp(wx.App):
                 wx.PostEvent(self._notify_window, StatusEvent([1, 1, str(self.protocol)]))
                 wx.PostEvent(self._notify_window, StatusEvent([3, 1, str(self.connection.connection.port_name())]))
                 try:
-                    r = self.connection.connection.query(obd.commands.VIN)
+                    r = self.sampler.query(obd.commands.VIN)
                     if r.value != None:
                         self.VIN = r.value.decode()
                         wx.PostEvent(self._notify_window, StatusEvent([4, 1, str(self.VIN)]))
@@ -415,11 +536,26 @@ class MyApp(wx.App):
 
                 return "OK"
 
+        def ask(self, event):
+            """
+                Posts a request event to the GUI thread and waits for the
+                handler's reply. Returns None if the producer is stopped
+                meanwhile, or if the handler couldn't answer.
+            """
+            reply = concurrent.futures.Future()
+            event.reply = reply
+            wx.PostEvent(self._notify_window, event)
+            while not self.stop_event.is_set():
+                try:
+                    return reply.result(timeout=0.25)
+                except concurrent.futures.TimeoutError:
+                    pass
+            return None
 
         def run(self):
 
             if self.initCommunication() != "OK":
-                self._notify_window.ThreadControl = 666
+                self.stop_event.set()
                 self.state = "dokončeno"
                 return None
 
@@ -435,47 +571,63 @@ class MyApp(wx.App):
             first_time_graphs = True
             self.first_time_graph_plot = True
             self.first_time_graphs_plot = True
-            self.graph_counter = 0
-            self.graph_counter1 = 0
-            self.graph_dirty1 = False
-            self.graph_dirty2 = False
-            self.graph_dirty3 = False
-            self.graph_dirty4 = False
-            #sensor_list = []
-            misfire_cylinder_supported = True
+            self.current_command = None  # selected on the graph tab
+            self.current_commands = [None, None, None, None]  # selected on the graphs tab
+            graph_posted = None  # what the last GraphEvent showed
+            graphs_posted = None
             first_time=True
-            #pimp_counter = 0
-            #time_prev = datetime.datetime.now()
-            #time_now = datetime.datetime.now()
-
-            def init_all_graphs():
-                self.graph_x_vals = np.array([])
-                self.graph_y_vals = np.array([])
-                self.graph_counter = 0
-
-                self.graph_x_vals1 = np.array([])
-                self.graph_y_vals1 = np.array([])
-                self.graph_x_vals2 = np.array([])
-                self.graph_y_vals2 = np.array([])
-                self.graph_x_vals3 = np.array([])
-                self.graph_y_vals3 = np.array([])
-                self.graph_x_vals4 = np.array([])
-                self.graph_y_vals4 = np.array([])
-                self.graph_counter1 = 0
-                self.graph_counter2 = 0
-                self.graph_counter3 = 0
-                self.graph_counter4 = 0
-
-
-
-            init_all_graphs()
+            no_history = np.zeros(0)
+
             def reconnect():
-                init_all_graphs()
+                nonlocal curstate, first_time_sensors, first_time_freezeframe, first_time_graph, first_time_graphs
+                nonlocal graph_posted, graphs_posted
                 if self.initCommunication() != "OK":
-                    self._notify_window.ThreadControl = 666
-
-            while self._notify_window.ThreadControl != 666:
-                print (self._notify_window.ThreadControl)
+                    self.stop_event.set()
+                # a new connection comes with a new sampler, subscribe again
+                curstate = -1
+                self.current_command = None
+                self.current_commands = [None, None, None, None]
+                # and with new command lists, so the rows and the comboboxes
+                # indexing them are built again
+                self.snapshot.clear("sensors")
+                self.snapshot.clear("freezeframe")
+                wx.PostEvent(self._notify_window, DestroyComboBoxEvent([]))
+                first_time_sensors = True
+                first_time_freezeframe = True
+                first_time_graph = True
+                first_time_graphs = True
+                self.first_time_graph_plot = True
+                self.first_time_graphs_plot = True
+                graph_posted = None
+                graphs_posted = None
+
+            def tab_commands(tab):
+                # the commands a table tab shows, sampled while it's selected
+                if tab == 0:
+                    return [obd.commands.ELM_VOLTAGE]
+                elif tab == 1:
+                    return [obd.commands.STATUS] + self.misfire_commands
+                elif tab == 2:
+                    return self.sensor_commands
+                elif tab == 4:
+                    return self.freezeframe_commands
+                return []
+
+            def graph_of(command):
+                # (x, y, unit, desc, counter) of a graph, from the shared history
+                if command == None:
+                    return (no_history, no_history, 'unit', 'None', 0)
+                r = self.sampler.value(command)
+                try:
+                    unit = str(r.value).split(' ')[1]
+                except IndexError:
+                    unit = "jednotka"
+                x, y = self.sampler.history(command).window()  # the sampler's thread appends meanwhile
+                return (x, y, unit, command.desc, self.sampler.samples(command))
+
+            self.snapshot = UISnapshot(self._notify_window)
+            while not self.stop_event.is_set():
+                self.snapshot.flush()  # the cells changed by the previous cycle
                 if self.connection.connection.status() != OBDStatus.CAR_CONNECTED:
                     reconnect()
                     continue
@@ -489,339 +641,74 @@ class MyApp(wx.App):
                     diff = (time_end - time_start).total_seconds()
                     if (diff < 0.08333) and (diff > 0):
                         sleep_time = 0.08333 - diff
-                        time.sleep(sleep_time)
+                        self.stop_event.wait(sleep_time)
                         print("Slept for "+str(sleep_time)+" seconds.")
                 time_start = datetime.datetime.now()
 
-
-
-                if curstate != 5 and self.graph_counter != 0:
-                    self.graph_x_vals = np.array([])
-                    self.graph_y_vals = np.array([])
-                    self.graph_counter = 0
-                    self.first_time_graph_plot = True
-                    if self.first_time_graph_plot:
-                        self.unit = 'unit'
-                    if self.current_command == None:
-                        desc = 'None'
-                    else:
-                        desc = self.current_command.desc
-                    wx.PostEvent(self._notify_window,
-                                 GraphEvent(
-                                     [(self.graph_x_vals, self.graph_y_vals, self.unit, desc, self.graph_counter),
-                                      (self.first_time_graph_plot)
-                                      ]))
-                    self.first_time_graph_plot = False
-                    wx.PostEvent(self._notify_window, GraphValueEvent([0, 0, self.current_command.command]))
-                    wx.PostEvent(self._notify_window, GraphValueEvent([0, 1, self.current_command.desc]))
-
-
-
-                if curstate != 6 and self.graph_counter1 != 0:
-                    self.graph_x_vals1 = np.array([])
-                    self.graph_y_vals1 = np.array([])
-                    self.graph_x_vals2 = np.array([])
-                    self.graph_y_vals2 = np.array([])
-                    self.graph_x_vals3 = np.array([])
-                    self.graph_y_vals3 = np.array([])
-                    self.graph_x_vals4 = np.array([])
-                    self.graph_y_vals4 = np.array([])
-                    self.graph_counter1 = 0
-                    self.graph_counter2 = 0
-                    self.graph_counter3 = 0
-                    self.graph_counter4 = 0
-                    self.first_time_graphs_plot = True
-                    wx.PostEvent(self._notify_window, GraphsEvent(
-                        [(self.graph_x_vals1, self.graph_y_vals1, self.unit1, desc1, self.graph_counter1),
-                         (self.graph_x_vals2, self.graph_y_vals2, self.unit2, desc2, self.graph_counter2),
-                         (self.graph_x_vals3, self.graph_y_vals3, self.unit3, desc3, self.graph_counter3),
-                         (self.graph_x_vals4, self.graph_y_vals4, self.unit4, desc4, self.graph_counter4),
-                         (self.first_time_graphs_plot)
-                         ]))
-                    wx.PostEvent(self._notify_window, GraphsValueEvent([0, 0, self.current_command1.command]))
-                    wx.PostEvent(self._notify_window, GraphsValueEvent([0, 1, self.current_command1.desc]))
-
-                    wx.PostEvent(self._notify_window, GraphsValueEvent([1, 0, self.current_command2.command]))
-                    wx.PostEvent(self._notify_window, GraphsValueEvent([1, 1, self.current_command2.desc]))
-
-                    wx.PostEvent(self._notify_window, GraphsValueEvent([2, 0, self.current_command3.command]))
-                    wx.PostEvent(self._notify_window, GraphsValueEvent([2, 1, self.current_command3.desc]))
-
-                    wx.PostEvent(self._notify_window, GraphsValueEvent([3, 0, self.current_command4.command]))
-                    wx.PostEvent(self._notify_window, GraphsValueEvent([3, 1, self.current_command4.desc]))
+                # the tabs are views: the sampler only samples what the selected
+                # one shows, plus the commands selected on the graph tabs
+                if curstate != prevstate:
+                    self.sampler.subscribe("tab", tab_commands(curstate))
 
                 if curstate == 0:  # show status tab
-                    s = self.connection.connection.query(obd.commands.RPM)
-                    if s.value == None:
-                        reconnect()
-                        continue
-
-                    r = self.connection.connection.query(obd.commands.ELM_VOLTAGE)
-                    self.ELMvoltage = str(r.value)
-                    wx.PostEvent(self._notify_window, StatusEvent([5, 1, str(self.ELMvoltage)]))
-
-
+                    r = self.sampler.value(obd.commands.ELM_VOLTAGE)
+                    if r.value != None and str(r.value) != self.ELMvoltage:
+                        self.ELMvoltage = str(r.value)
+                        wx.PostEvent(self._notify_window, StatusEvent([5, 1, str(self.ELMvoltage)]))
 
                 elif curstate == 1:  # show tests tab
                     try:
-                        s = self.connection.connection.query(obd.commands.RPM)
-                        if s.value == None:
-                            reconnect()
-                            continue
-                        r = self.connection.connection.query(obd.commands[1][1])
-                        if r.value == None:
-                            # NOT SUPPORTED, so do nothing
-                            continue
-
-                        if r.value.MISFIRE_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([0, 1, "Dostupné na"]))
-                            if r.value.MISFIRE_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([0, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([0, 2, "Neúplné"]))
-                        if r.value.FUEL_SYSTEM_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([1, 1, "Dostupné na"]))
-                            if r.value.FUEL_SYSTEM_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([1, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([1, 2, "Neúplné"]))
-                        if r.value.COMPONENT_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([2, 1, "Dostupné na"]))
-                            if r.value.COMPONENT_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([2, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([2, 2, "Neúplné"]))
-
-                        if r.value.CATALYST_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([3, 1, "Dostupné na"]))
-                            if r.value.CATALYST_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([3, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([3, 2, "Neúplné"]))
-
-                        if r.value.HEATED_CATALYST_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([4, 1, "Dostupné na"]))
-                            if r.value.HEATED_CATALYST_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([4, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([4, 2, "Neúplné"]))
-
-                        if r.value.EVAPORATIVE_SYSTEM_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([5, 1, "Dostupné na"]))
-                            if r.value.EVAPORATIVE_SYSTEM_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([5, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([5, 2, "Neúplné"]))
-
-                        if r.value.SECONDARY_AIR_SYSTEM_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([6, 1, "Dostupné na"]))
-                            if r.value.SECONDARY_AIR_SYSTEM_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([6, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([6, 2, "Neúplné"]))
-
-                        if r.value.OXYGEN_SENSOR_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([7, 1, "Dostupné na"]))
-                            if r.value.OXYGEN_SENSOR_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([7, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([7, 2, "Neúplné"]))
-
-                        if r.value.OXYGEN_SENSOR_HEATER_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([8, 1, "Dostupné na"]))
-                            if r.value.OXYGEN_SENSOR_HEATER_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([8, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([8, 2, "Neúplné"]))
-
-                        if r.value.EGR_VVT_SYSTEM_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([9, 1, "Dostupné na"]))
-                            if r.value.EGR_VVT_SYSTEM_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([9, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([9, 2, "Neúplné"]))
-
-                        if r.value.NMHC_CATALYST_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([10, 1, "Dostupné na"]))
-                            if r.value.NMHC_CATALYST_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([10, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([10, 2, "Neúplné"]))
-
-                        if r.value.NOX_SCR_AFTERTREATMENT_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([11, 1, "Dostupné na"]))
-                            if r.value.NOX_SCR_AFTERTREATMENT_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([11, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([11, 2, "Neúplné"]))
-
-                        if r.value.BOOST_PRESSURE_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([12, 1, "Dostupné na"]))
-                            if r.value.BOOST_PRESSURE_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([12, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([12, 2, "Neúplné"]))
-
-                        if r.value.EXHAUST_GAS_SENSOR_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([13, 1, "Dostupné na"]))
-                            if r.value.EXHAUST_GAS_SENSOR_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([13, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([13, 2, "Neúplné"]))
-
-                        if r.value.PM_FILTER_MONITORING.available:
-                            wx.PostEvent(self._notify_window, TestEvent([14, 1, "Dostupné na"]))
-                            if r.value.PM_FILTER_MONITORING.complete:
-                                wx.PostEvent(self._notify_window, TestEvent([14, 2, "Kompletní"]))
-                            else:
-                                wx.PostEvent(self._notify_window, TestEvent([14, 2, "Neúplné"]))
-
-                        response = self.connection.connection.query(obd.commands.MONITOR_MISFIRE_CYLINDER_1)
-                        if response.value != None:
-                            result = response.value.MISFIRE_COUNT
-                            wx.PostEvent(self._notify_window, TestEvent([15, 2, str(result)]))
-                        response = self.connection.connection.query(obd.commands.MONITOR_MISFIRE_CYLINDER_2)
-                        if response.value != None:
-                            result = response.value.MISFIRE_COUNT
-                            wx.PostEvent(self._notify_window, TestEvent([16, 2, str(result)]))
-                        response = self.connection.connection.query(obd.commands.MONITOR_MISFIRE_CYLINDER_3)
-                        if response.value != None:
-                            result = response.value.MISFIRE_COUNT
-                            wx.PostEvent(self._notify_window, TestEvent([17, 2, str(result)]))
-                        response = self.connection.connection.query(obd.commands.MONITOR_MISFIRE_CYLINDER_4)
-                        if response.value != None:
-                            result = response.value.MISFIRE_COUNT
-                            wx.PostEvent(self._notify_window, TestEvent([18, 2, str(result)]))
-                        response = self.connection.connection.query(obd.commands.MONITOR_MISFIRE_CYLINDER_5)
-                        if response.value != None:
-                            result = response.value.MISFIRE_COUNT
-                            wx.PostEvent(self._notify_window, TestEvent([19, 2, str(result)]))
-                        response = self.connection.connection.query(obd.commands.MONITOR_MISFIRE_CYLINDER_6)
-                        if response.value != None:
-                            result = response.value.MISFIRE_COUNT
-                            wx.PostEvent(self._notify_window, TestEvent([20, 2, str(result)]))
-                        response = self.connection.connection.query(obd.commands.MONITOR_MISFIRE_CYLINDER_7)
-                        if response.value != None:
-                            result = response.value.MISFIRE_COUNT
-                            wx.PostEvent(self._notify_window, TestEvent([21, 2, str(result)]))
-                        response = self.connection.connection.query(obd.commands.MONITOR_MISFIRE_CYLINDER_8)
-                        if response.value != None:
-                            result = response.value.MISFIRE_COUNT
-                            wx.PostEvent(self._notify_window, TestEvent([22, 2, str(result)]))
-                        response = self.connection.connection.query(obd.commands.MONITOR_MISFIRE_CYLINDER_9)
-                        if response.value != None:
-                            result = response.value.MISFIRE_COUNT
-                            wx.PostEvent(self._notify_window, TestEvent([23, 2, str(result)]))
-                        response = self.connection.connection.query(obd.commands.MONITOR_MISFIRE_CYLINDER_10)
-                        if response.value != None:
-                            result = response.value.MISFIRE_COUNT
-                            wx.PostEvent(self._notify_window, TestEvent([24, 2, str(result)]))
-                        response = self.connection.connection.query(obd.commands.MONITOR_MISFIRE_CYLINDER_11)
-                        if response.value != None:
-                            result = response.value.MISFIRE_COUNT
-                            wx.PostEvent(self._notify_window, TestEvent([25, 2, str(result)]))
-                        response = self.connection.connection.query(obd.commands.MONITOR_MISFIRE_CYLINDER_12)
-                        if response.value != None:
-                            result = response.value.MISFIRE_COUNT
-                            wx.PostEvent(self._notify_window, TestEvent([26, 2, str(result)]))
+                        r = self.sampler.value(obd.commands.STATUS)
+                        if r.value != None:
+                            for row, monitor in enumerate(MONITORS):
+                                test = getattr(r.value, monitor)
+                                if test.available:
+                                    self.snapshot.set("tests", row, 1, "Dostupné na")
+                                    if test.complete:
+                                        self.snapshot.set("tests", row, 2, "Kompletní")
+                                    else:
+                                        self.snapshot.set("tests", row, 2, "Neúplné")
+
+                        for row, command in enumerate(MISFIRE_MONITORS, len(MONITORS)):
+                            response = self.sampler.value(command)
+                            if response.value != None:
+                                result = response.value.MISFIRE_COUNT
+                                self.snapshot.set("tests", row, 2, str(result))
 
                     except:
                         traceback.print_exc()
 
-
-                    """
-                    "MONITOROVÁNÍ CHYBNÝCH ZÁŽEHŮ",
-                    "MONITOROVÁNÍ PALIVOVÉHO SYSTÉMU",
-                    "MONITOROVÁNÍ KOMPONENT",
-                    "MONITOROVÁNÍ KATALYZÁTORU",
-                    "MONITOROVÁNÍ VYHŘÍVANÉHO KATALYZÁTORU",
-                    "MONITOROVÁNÍ ODPAŘOVACÍHO SYSTÉMU",
-                    "MONITOROVÁNÍ SYSTÉMU SEKUNDÁRNÍHO VZDUCHU",
-                    "MONITOROVÁNÍ KYSLÍKOVÝCH SENZORŮ",
-                    "MONITOROVÁNÍ KYSLÍKOVÝCH SENZORŮ OHŘÍVAČŮ",
-                    "MONITOROVÁNÍ SYSTÉMU EGR VVT",
-                    "MONITOROVÁNÍ KATALYZÁTORU NMHC",
-                    "MONITOROVÁNÍ NÁSLEDNÉHO ZPRACOVÁNÍ EMISÍ NOX SCR",
-                    "MONITOROVÁNÍ PLNICÍHO TLAKU",
-                    "MONITOROVÁNÍ SENZORU VÝFUKOVÝCH PLYNŮ",
-                    "MONITOROVÁNÍ PM FILTRU"
-                    """
-
                 elif curstate == 2:  # show sensor tab
 
                     if first_time_sensors:
-                        sensor_list = []
-                        counter = 0
+                        sensor_list = list(self.sensor_commands)
                         first_time_sensors = False
-                        for command in obd.commands[1]:
-                            if command:
-                                if command.command not in (b"0100" , b"0101", b"0120", b"0140", b"0103", b"0102", b"011C", b"0113", b"0141", b"0151"):
-                                    s = self.connection.connection.query(command)
-                                    if s.value == None:
-                                        continue
-                                    else:
-                                        sensor_list.append([command, command.desc])
-
-                                        #app.sensors.InsertItem(counter, "")
-                                        wx.PostEvent(self._notify_window, InsertSensorRowEvent(counter))
-                                        wx.PostEvent(self._notify_window, ResultEvent([counter, 0, str(command.command)]))
-                                        wx.PostEvent(self._notify_window, ResultEvent([counter, 1, str(command.desc)]))
-                                        wx.PostEvent(self._notify_window, ResultEvent([counter, 2, str(s.value)]))
-                                        counter = counter + 1
-                        #s = self.connection.connection.query(obd.commands.ELM_VOLTAGE)
-                        #sensor_list.append([obd.commands.ELM_VOLTAGE, obd.commands.ELM_VOLTAGE.desc, str(s.value)])
-                        #wx.PostEvent(self._notify_window, InsertSensorRowEvent(counter))
-                        #wx.PostEvent(self._notify_window, ResultEvent([counter, 0, str(obd.commands.ELM_VOLTAGE.command)]))
-                        #wx.PostEvent(self._notify_window, ResultEvent([counter, 1, str(obd.commands.ELM_VOLTAGE.desc)]))
-                        #wx.PostEvent(self._notify_window, ResultEvent([counter, 2, str(s.value)]))
-                    else:
-                        #for i in range(0, app.sensors.GetItemCount()):
-                        #    app.sensors.DeleteItem(0)
-                        counter = 0
-                        for sens in sensor_list:
-                            s = self.connection.connection.query(sens[0])
-                            if s.value == None:
-                                reconnect()
-                                continue
-                            wx.PostEvent(self._notify_window, ResultEvent([counter, 0, str(sens[0].command)]))
-                            wx.PostEvent(self._notify_window, ResultEvent([counter, 1, str(sens[1])]))
-                            wx.PostEvent(self._notify_window, ResultEvent([counter, 2, str(s.value)]))
-                            counter = counter + 1
+                        for counter, command in enumerate(sensor_list):
+                            self.snapshot.insert_row("sensors", counter)
+                            self.snapshot.set("sensors", counter, 0, str(command.command))
+                            self.snapshot.set("sensors", counter, 1, str(command.desc))
+                    for counter, command in enumerate(sensor_list):
+                        s = self.sampler.value(command)
+                        self.snapshot.set("sensors", counter, 2, str(s.value))
 
                 elif curstate == 3:  # show DTC tab
-                    s = self.connection.connection.query(obd.commands.RPM)
-                    if s.value == None:
-                        reconnect()
-                        continue
-
-                    if self._notify_window.ThreadControl == 1:  # clear DTC
-                        r = self.connection.connection.query(obd.commands["CLEAR_DTC"])
 
-                        if self._notify_window.ThreadControl == 666:  # before reset ThreadControl we must check if main thread did not want us to finish
-                            break
-
-                        self._notify_window.ThreadControl = 0
+                    while not self.commands.empty():
+                        command = self.commands.get_nowait()
+                        if command == CMD_CLEAR_DTC:
+                            r = self.sampler.query(obd.commands["CLEAR_DTC"])
                         prevstate = -1  # to reread DTC
-                    if self._notify_window.ThreadControl == 2:  # reread DTC
-
-                        prevstate = -1
-
-                        if self._notify_window.ThreadControl == 666:
-                            break
-
-                        self._notify_window.ThreadControl = 0
 
-                        pass
                     if prevstate != 3:
 
                         wx.PostEvent(self._notify_window, DTCEvent(0))  # clear list
-                        r = self.connection.connection.query(obd.commands.GET_DTC)
+                        r = self.sampler.query(obd.commands.GET_DTC)
                         DTCCODES = []
                         print ("DTCCODES:",r.value)
                         if r.value != None:
                             for dtccode in r.value:
                                 DTCCODES.append((dtccode[0], "Active", dtccode[1]))
-                        r = self.connection.connection.query(obd.commands.FREEZE_DTC)
+                        r = self.sampler.query(obd.commands.FREEZE_DTC)
                         print ("FREEZECODES:",r.value)
                         if r.value != None:
                             dtccode = r.value
@@ -837,471 +724,80 @@ class MyApp(wx.App):
 
                 elif curstate == 4:  # show freezeframe tab
                     if first_time_freezeframe:
-                        freezeframe_list = []
-                        counter = 0
+                        freezeframe_list = list(self.freezeframe_commands)
                         first_time_freezeframe = False
-                        for command in obd.commands[2]:
-                            if command:
-                                if command.command not in (b"0200" , b"0201", b"0220", b"0240", b"0203", b"0202", b"021C", b"0213", b"0241", b"0251"):
-                                    s = self.connection.connection.query(command)
-                                    if s.value == None:
-                                        continue
-                                    else:
-                                        freezeframe_list.append([command.command, command.desc, str(s.value)])
-                                        wx.PostEvent(self._notify_window, InsertFreezeframeRowEvent(counter))
-                                        wx.PostEvent(self._notify_window, FreezeframeResultEvent([counter, 0, str(command.command)]))
-                                        wx.PostEvent(self._notify_window, FreezeframeResultEvent([counter, 1, str(command.desc)]))
-                                        wx.PostEvent(self._notify_window, FreezeframeResultEvent([counter, 2, str(s.value)]))
-                                        counter = counter + 1
-                    else:
-                        counter = 0
-                        for sens in freezeframe_list:
-                            for command in obd.commands[2]:
-                                if command.command == sens[0]:
-                                    s = self.connection.connection.query(command)
-                                    if s.value == None:
-                                        reconnect()
-                                        continue
-                                    freezeframe_list[counter] = [command.command, command.desc, str(s.value)]
-                                    counter = counter + 1
-                        counter = 0
-                        for sens in freezeframe_list:
-                            wx.PostEvent(self._notify_window, FreezeframeResultEvent([counter, 0, str(sens[0])]))
-                            wx.PostEvent(self._notify_window, FreezeframeResultEvent([counter, 1, str(sens[1])]))
-                            wx.PostEvent(self._notify_window, FreezeframeResultEvent([counter, 2, str(sens[2])]))
-                            counter = counter + 1
-                            #if sens[2] == "None" and sens[0]!='0203':
-                            #    raise AttributeError
+                        for counter, command in enumerate(freezeframe_list):
+                            self.snapshot.insert_row("freezeframe", counter)
+                            self.snapshot.set("freezeframe", counter, 0, str(command.command))
+                            self.snapshot.set("freezeframe", counter, 1, str(command.desc))
+                    for counter, command in enumerate(freezeframe_list):
+                        s = self.sampler.value(command)
+                        self.snapshot.set("freezeframe", counter, 2, str(s.value))
 
                 elif curstate == 5:  # show Graph tab
                     if first_time_graph:
                         print("First time graph")
-                        #wx.PostEvent(self._notify_window, DestroyComboBoxEvent([]))
-                        self.graph_x_vals = np.array([])
-                        self.graph_y_vals = np.array([])
-                        self.graph_counter = 0
-                        self.current_command = None
-
-
-                        graph_commands = []
-
-                        #wx.PostEvent(self._notify_window, GraphEvent((self.current_command, [], [])))
-                        prev_command = None
-
+                        sensor_descriptions = [command.desc for command in self.graph_commands]
+                        self.ask(BuildComboBoxGraphEvent(sensor_descriptions))
+                        self.ask(SetSelectionComboBoxGraphEvent([]))
                         first_time_graph = False
-                        for command in obd.commands[1]:
-                            if command:
-                                if command.command not in (b"0100" , b"0101", b"0120", b"0140", b"0103", b"0102", b"011C", b"0113", b"0141", b"0151"):
-                                    s = self.connection.connection.query(command)
-                                    if s.value == None:
-                                        continue
-                                    else:
-                                        graph_commands.append(command)
-                        graph_commands.append(obd.commands.ELM_VOLTAGE)
-                        sensor_descriptions = []
-                        #sensor_descriptions.append("None")
-                        for command in graph_commands:
-                            sensor_descriptions.append(command.desc)
-                        app.build_combobox_graph_event_finished = False
-                        wx.PostEvent(self._notify_window, BuildComboBoxGraphEvent(sensor_descriptions))
-                        while not app.build_combobox_graph_event_finished:
-                            time.sleep(0.01)
-                        app.combobox_graph_set_sel_finished=False
-                        wx.PostEvent(self._notify_window, SetSelectionComboBoxGraphEvent([]))
-                        while not app.combobox_graph_set_sel_finished:
-                            time.sleep(0.01)
-                    else:
 
-                        app.combobox_graph_get_sel_finished = False
-                        wx.PostEvent(self._notify_window, GetSelectionComboBoxGraphEvent([]))
-                        while not app.combobox_graph_get_sel_finished:
-                            time.sleep(0.01)
-                        curr_selection = app.combobox_selection
-
-                        if sensor_descriptions[curr_selection] == "None":
-                            curr_selection = -1
-                        if curr_selection != -1:
-                            prev_command = self.current_command
-                            self.current_command = graph_commands[curr_selection]
-                        else:
-                            self.current_command = None
-
-                        if self.current_command != None:
-                            if (prev_command == None) or (prev_command != self.current_command):
-                                self.graph_x_vals = np.array([])
-                                self.graph_y_vals = np.array([])
-                                self.graph_counter = 0
-                                wx.PostEvent(self._notify_window, GraphValueEvent([0, 0, self.current_command.command]))
-                                wx.PostEvent(self._notify_window, GraphValueEvent([0, 1, self.current_command.desc]))
-                            else:
-                                s = self.connection.connection.query(self.current_command)
-                                if s.value == None:
-                                    reconnect()
-                                    continue
-                                self.graph_x_vals = np.append(self.graph_x_vals, self.graph_counter)
-                                try:
-                                    self.graph_y_vals = np.append(self.graph_y_vals, float(s.value.magnitude))
-                                except AttributeError:
-                                    self.graph_y_vals = np.append(self.graph_y_vals, float(0))
-                                if len(self.graph_x_vals) > 450:
-                                    self.graph_x_vals = np.delete(self.graph_x_vals, (0))
-                                    self.graph_y_vals = np.delete(self.graph_y_vals, (0))
-
-                                self.graph_counter = self.graph_counter + 1
-                                prev_command = self.current_command
-
-
-                                if s.value == None:
-                                    wx.PostEvent(self._notify_window, GraphValueEvent([0, 2, str(0)]))
-                                    self.unit = "jednotka"
-                                else:
-                                    wx.PostEvent(self._notify_window, GraphValueEvent([0, 2, str(s.value)]))
-                                    try:
-                                        self.unit = str(s.value).split(' ')[1]
-                                    except IndexError:
-                                        self.unit = "jednotka"
-
-
-                        else:
-                            self.graph_x_vals = np.array([])
-                            self.graph_y_vals = np.array([])
-                            self.graph_counter = 0
-
-
-                        if self.first_time_graph_plot:
-                            self.unit = 'unit'
-
-                        if self.current_command == None:
-                            desc = 'None'
-                        else:
-                            desc = self.current_command.desc
-
-                        wx.PostEvent(self._notify_window, GraphEvent([(self.graph_x_vals,self.graph_y_vals, self.unit, desc, self.graph_counter),
-                                                                      (self.first_time_graph_plot)
-                                                                      ]))
+                    curr_selection = self.ask(GetSelectionComboBoxGraphEvent([]))
+                    if curr_selection is None or curr_selection == -1:
+                        command = None
+                    else:
+                        command = self.graph_commands[curr_selection]
+
+                    if command != self.current_command:
+                        self.current_command = command
+                        self.sampler.subscribe("graph", [command] if command != None else [])
+                        if command != None:
+                            self.snapshot.set("graph", 0, 0, command.command)
+                            self.snapshot.set("graph", 0, 1, command.desc)
+
+                    if command != None:
+                        self.snapshot.set("graph", 0, 2, str(self.sampler.value(command).value))
+
+                    # only post when there's a new sample to draw
+                    graph = graph_of(command)
+                    if self.first_time_graph_plot or (command, graph[4]) != graph_posted:
+                        wx.PostEvent(self._notify_window, GraphEvent([graph, (self.first_time_graph_plot)]))
                         self.first_time_graph_plot = False
-                        #time.sleep(0.2)
+                        graph_posted = (command, graph[4])
 
                 elif curstate == 6:  # show Graphs tab
                     if first_time_graphs:
                         print("First time graph")
-                        #wx.PostEvent(self._notify_window, DestroyComboBoxEvent([]))
-                        self.graph_x_vals1 = np.array([])
-                        self.graph_y_vals1 = np.array([])
-                        self.graph_x_vals2 = np.array([])
-                        self.graph_y_vals2 = np.array([])
-                        self.graph_x_vals3 = np.array([])
-                        self.graph_y_vals3 = np.array([])
-                        self.graph_x_vals4 = np.array([])
-                        self.graph_y_vals4 = np.array([])
-                        self.graph_counter1 = 0
-                        self.graph_counter2 = 0
-                        self.graph_counter3 = 0
-                        self.graph_counter4 = 0
-                        self.current_command1 = None
-                        self.current_command2 = None
-                        self.current_command3 = None
-                        self.current_command4 = None
-
-                        graph_commands = []
-                        #wx.PostEvent(self._notify_window, GraphEvent((self.current_command, [], [])))
-                        prev_command1 = None
-                        prev_command2 = None
-                        prev_command3 = None
-                        prev_command4 = None
+                        sensor_descriptions = [command.desc for command in self.graph_commands]
+                        self.ask(BuildComboBoxGraphsEvent(sensor_descriptions))
+                        self.ask(SetSelectionComboBoxGraphsEvent([]))
                         first_time_graphs = False
-                        for command in obd.commands[1]:
-                            if command:
-                                if command.command not in (b"0100" , b"0101", b"0120", b"0140", b"0103", b"0102", b"011C", b"0113", b"0141", b"0151"):
-                                    s = self.connection.connection.query(command)
-                                    if s.value == None:
-                                        continue
-                                    else:
-                                        graph_commands.append(command)
-                        graph_commands.append(obd.commands.ELM_VOLTAGE)
-                        sensor_descriptions = []
-                        #sensor_descriptions.append("None")
-                        for command in graph_commands:
-                            sensor_descriptions.append(command.desc)
-                        app.build_combobox_graphs_event_finished = False
-                        wx.PostEvent(self._notify_window, BuildComboBoxGraphsEvent(sensor_descriptions))
-                        while not app.build_combobox_graphs_event_finished:
-                            time.sleep(0.01)
-                        app.combobox_graphs_set_sel_finished=False
-                        wx.PostEvent(self._notify_window, SetSelectionComboBoxGraphsEvent([]))
-                        while not app.combobox_graphs_set_sel_finished:
-                            time.sleep(0.01)
-                    else:
 
-                        app.combobox_graphs_get_sel_finished = False
-                        wx.PostEvent(self._notify_window, GetSelectionComboBoxGraphsEvent([]))
-                        while not app.combobox_graphs_get_sel_finished:
-                            time.sleep(0.01)
-                        curr_selection1 = app.combobox1_selection
-                        curr_selection2 = app.combobox2_selection
-                        curr_selection3 = app.combobox3_selection
-                        curr_selection4 = app.combobox4_selection
-                        if sensor_descriptions[curr_selection1] == "None":
-                            curr_selection1 = -1
-                        if curr_selection1 != -1:
-                            prev_command1 = self.current_command1
-                            self.current_command1 = graph_commands[curr_selection1]
-                        else:
-                            self.current_command1 = None
-
-                        if sensor_descriptions[curr_selection2] == "None":
-                            curr_selection2 = -1
-                        if curr_selection2 != -1:
-                            prev_command2 = self.current_command2
-                            self.current_command2 = graph_commands[curr_selection2]
-                        else:
-                            self.current_command2 = None
-
-                        if sensor_descriptions[curr_selection3] == "None":
-                            curr_selection3 = -1
-                        if curr_selection3 != -1:
-                            prev_command3 = self.current_command3
-                            self.current_command3 = graph_commands[curr_selection3]
-                        else:
-                            self.current_command3 = None
-
-                        if sensor_descriptions[curr_selection4] == "None":
-                            curr_selection4 = -1
-                        if curr_selection4 != -1:
-                            prev_command4 = self.current_command4
-                            self.current_command4 = graph_commands[curr_selection4]
-                        else:
-                            self.current_command4 = None
-
-                        if self.current_command1 != None:
-                            if (prev_command1 == None) or (prev_command1 != self.current_command1):
-                                self.graph_x_vals1 = np.array([])
-                                self.graph_y_vals1 = np.array([])
-                                #self.graph_x_vals1 = []
-                                #self.graph_y_vals1 = []
-                                self.graph_counter1 = 0
-                                wx.PostEvent(self._notify_window, GraphsValueEvent([0, 0, self.current_command1.command]))
-                                wx.PostEvent(self._notify_window, GraphsValueEvent([0, 1, self.current_command1.desc]))
-                            else:
-                                s = self.connection.connection.query(self.current_command1)
-                                if s.value == None:
-                                    reconnect()
-                                    continue
-                                #if s.value == None:
-                                #    print("s.value is None!")
-                                #    raise AttributeError
-                                self.graph_x_vals1 = np.append(self.graph_x_vals1, self.graph_counter1)
-                                try:
-                                    self.graph_y_vals1 = np.append(self.graph_y_vals1, float(s.value.magnitude))
-                                except AttributeError:
-                                    self.graph_y_vals1 = np.append(self.graph_y_vals1, float(0))
-                                #self.graph_x_vals1.append(self.graph_counter1)
-                                #self.graph_y_vals1.append(float(s.value.magnitude))
-                                if len(self.graph_x_vals1) > 200:
-                                    self.graph_x_vals1 = np.delete(self.graph_x_vals1, (0))
-                                    self.graph_y_vals1 = np.delete(self.graph_y_vals1, (0))
-                                    #self.graph_x_vals1.pop(0)
-                                    #self.graph_y_vals1.pop(0)
-
-                                self.graph_counter1 = self.graph_counter1 + 1
-                                prev_command1 = self.current_command1
-                                self.graph_dirty1 = True
-                                #wx.PostEvent(self._notify_window, GraphEvent(self.current_command1))
-                                if s.value == None:
-                                    wx.PostEvent(self._notify_window, GraphsValueEvent([0, 2, str(0)]))
-                                    self.unit1 = "jednotka"
-                                else:
-                                    wx.PostEvent(self._notify_window, GraphsValueEvent([0, 2, str(s.value)]))
-                                    try:
-                                        self.unit1 = str(s.value).split(' ')[1]
-                                    except IndexError:
-                                        self.unit1 = "jednotka"
-                        else:
-                            self.graph_x_vals1 = np.array([])
-                            self.graph_y_vals1 = np.array([])
-                            self.graph_counter1 = 0
-
-                        if self.current_command2 != None:
-                            if (prev_command2 == None) or (prev_command2 != self.current_command2):
-                                self.graph_x_vals2 = np.array([])
-                                self.graph_y_vals2 = np.array([])
-                                #self.graph_x_vals2 = []
-                                #self.graph_y_vals2 = []
-                                self.graph_counter2 = 0
-                                wx.PostEvent(self._notify_window, GraphsValueEvent([1, 0, self.current_command2.command]))
-                                wx.PostEvent(self._notify_window, GraphsValueEvent([1, 1, self.current_command2.desc]))
-                            else:
-                                s = self.connection.connection.query(self.current_command2)
-                                if s.value == None:
-                                    reconnect()
-                                    continue
-                                #if s.value == None:
-                                #    print("s.value is None!")
-                                #    raise AttributeError
-                                self.graph_x_vals2 = np.append(self.graph_x_vals2, self.graph_counter2)
-                                try:
-                                    self.graph_y_vals2 = np.append(self.graph_y_vals2, float(s.value.magnitude))
-                                except AttributeError:
-                                    self.graph_y_vals2 = np.append(self.graph_y_vals2, float(0))
-                                #self.graph_x_vals2.append(self.graph_counter2)
-                                #self.graph_y_vals2.append(float(s.value.magnitude))
-                                if len(self.graph_x_vals2) > 200:
-                                    self.graph_x_vals2 = np.delete(self.graph_x_vals2, (0))
-                                    self.graph_y_vals2 = np.delete(self.graph_y_vals2, (0))
-                                    #self.graph_x_vals2.pop(0)
-                                    #self.graph_y_vals2.pop(0)
-
-                                self.graph_counter2 = self.graph_counter2 + 1
-                                prev_command2 = self.current_command2
-                                self.graph_dirty2 = True
-                                #wx.PostEvent(self._notify_window, GraphEvent(self.current_command2))
-                                if s.value == None:
-                                    wx.PostEvent(self._notify_window, GraphsValueEvent([1, 2, str(0)]))
-                                    self.unit2 = "jednotka"
-                                else:
-                                    wx.PostEvent(self._notify_window, GraphsValueEvent([1, 2, str(s.value)]))
-                                    try:
-                                        self.unit2 = str(s.value).split(' ')[1]
-                                    except IndexError:
-                                        self.unit2 = "jednotka"
-                        else:
-                            self.graph_x_vals2 = np.array([])
-                            self.graph_y_vals2 = np.array([])
-                            self.graph_counter2 = 0
-
-                        if self.current_command3 != None:
-                            if (prev_command3 == None) or (prev_command3 != self.current_command3):
-                                self.graph_x_vals3 = np.array([])
-                                self.graph_y_vals3 = np.array([])
-                                #self.graph_x_vals3 = []
-                                #self.graph_y_vals3 = []
-                                self.graph_counter3 = 0
-                                wx.PostEvent(self._notify_window, GraphsValueEvent([2, 0, self.current_command3.command]))
-                                wx.PostEvent(self._notify_window, GraphsValueEvent([2, 1, self.current_command3.desc]))
-                            else:
-                                s = self.connection.connection.query(self.current_command3)
-                                if s.value == None:
-                                    reconnect()
-                                    continue
-                                #if s.value == None:
-                                #    print("s.value is None!")
-                                #    raise AttributeError
-                                self.graph_x_vals3 = np.append(self.graph_x_vals3, self.graph_counter3)
-                                try:
-                                    self.graph_y_vals3 = np.append(self.graph_y_vals3, float(s.value.magnitude))
-                                except AttributeError:
-                                    self.graph_y_vals3 = np.append(self.graph_y_vals3, float(0))
-                                #self.graph_x_vals3.append(self.graph_counter3)
-                                #self.graph_y_vals3.append(float(s.value.magnitude))
-                                if len(self.graph_x_vals3) > 200:
-                                    self.graph_x_vals3 = np.delete(self.graph_x_vals3, (0))
-                                    self.graph_y_vals3 = np.delete(self.graph_y_vals3, (0))
-                                    #self.graph_x_vals3.pop(0)
-                                    #self.graph_y_vals3.pop(0)
-
-                                self.graph_counter3 = self.graph_counter3 + 1
-                                prev_command3 = self.current_command3
-                                self.graph_dirty3 = True
-                                #wx.PostEvent(self._notify_window, GraphEvent(self.current_command3))
-                                if s.value == None:
-                                    wx.PostEvent(self._notify_window, GraphsValueEvent([2, 2, str(0)]))
-                                    self.unit3 = "jednotka"
-                                else:
-                                    wx.PostEvent(self._notify_window, GraphsValueEvent([2, 2, str(s.value)]))
-                                    try:
-                                        self.unit3 = str(s.value).split(' ')[1]
-                                    except IndexError:
-                                        self.unit3 = "jednotka"
-                        else:
-                            self.graph_x_vals3 = np.array([])
-                            self.graph_y_vals3 = np.array([])
-                            self.graph_counter3 = 0
-
-                        if self.current_command4 != None:
-                            if (prev_command4 == None) or (prev_command4 != self.current_command4):
-                                self.graph_x_vals4 = np.array([])
-                                self.graph_y_vals4 = np.array([])
-                                #self.graph_x_vals4 = []
-                                #self.graph_y_vals4 = []
-                                self.graph_counter4 = 0
-                                wx.PostEvent(self._notify_window, GraphsValueEvent([3, 0, self.current_command4.command]))
-                                wx.PostEvent(self._notify_window, GraphsValueEvent([3, 1, self.current_command4.desc]))
-                            else:
-                                s = self.connection.connection.query(self.current_command4)
-                                if s.value == None:
-                                    reconnect()
-                                    continue
-                                #if s.value == None:
-                                #    print("s.value is None!")
-                                #    raise AttributeError
-                                self.graph_x_vals4 = np.append(self.graph_x_vals4, self.graph_counter4)
-
-                                try:
-                                    self.graph_y_vals4 = np.append(self.graph_y_vals4, float(s.value.magnitude))
-                                except AttributeError:
-                                    self.graph_y_vals4 = np.append(self.graph_y_vals4, float(0))
-
-                                #self.graph_x_vals4.append(self.graph_counter4)
-                                #self.graph_y_vals4.append(float(s.value.magnitude))
-                                if len(self.graph_x_vals4) > 200:
-                                    self.graph_x_vals4 = np.delete(self.graph_x_vals4, (0))
-                                    self.graph_y_vals4 = np.delete(self.graph_y_vals4, (0))
-                                    #self.graph_x_vals4.pop(0)
-                                    #self.graph_y_vals4.pop(0)
-
-                                self.graph_counter4 = self.graph_counter4 + 1
-                                prev_command4 = self.current_command4
-                                self.graph_dirty4 = True
-                                #wx.PostEvent(self._notify_window, GraphEvent(self.current_command4))
-                                if s.value == None:
-                                    wx.PostEvent(self._notify_window, GraphsValueEvent([3, 2, str(0)]))
-                                    self.unit4 = "jednotka"
-                                else:
-                                    wx.PostEvent(self._notify_window, GraphsValueEvent([3, 2, str(s.value)]))
-                                    try:
-                                        self.unit4 = str(s.value).split(' ')[1]
-                                    except IndexError:
-                                        self.unit4 = "jednotka"
-                        else:
-                            self.graph_x_vals4 = np.array([])
-                            self.graph_y_vals4 = np.array([])
-                            self.graph_counter4 = 0
-
-                        if self.first_time_graphs_plot:
-                            self.unit1 = 'unit'
-                            self.unit2 = 'unit'
-                            self.unit3 = 'unit'
-                            self.unit4 = 'unit'
-                        if self.current_command1 == None:
-                            desc1 = 'None'
-                        else:
-                            desc1 = self.current_command1.desc
-                        if self.current_command2 == None:
-                            desc2 = 'None'
-                        else:
-                            desc2 = self.current_command2.desc
-                        if self.current_command3 == None:
-                            desc3 = 'None'
-                        else:
-                            desc3 = self.current_command3.desc
-                        if self.current_command4 == None:
-                            desc4 = 'None'
-                        else:
-                            desc4 = self.current_command4.desc
-                        wx.PostEvent(self._notify_window, GraphsEvent([(self.graph_x_vals1,self.graph_y_vals1, self.unit1, desc1, self.graph_counter1),
-                                                                      (self.graph_x_vals2,self.graph_y_vals2, self.unit2, desc2, self.graph_counter2),
-                                                                      (self.graph_x_vals3,self.graph_y_vals3, self.unit3, desc3, self.graph_counter3),
-                                                                      (self.graph_x_vals4,self.graph_y_vals4, self.unit4, desc4, self.graph_counter4),
-                                                                      (self.first_time_graphs_plot)
-                                                                      ]))
+                    selections = self.ask(GetSelectionComboBoxGraphsEvent([]))
+                    if selections is None:
+                        selections = (-1, -1, -1, -1)
+                    commands = [None if selection == -1 else self.graph_commands[selection]
+                                for selection in selections]
+
+                    if commands != self.current_commands:
+                        for row, command in enumerate(commands):
+                            if command != None and command != self.current_commands[row]:
+                                self.snapshot.set("graphs", row, 0, command.command)
+                                self.snapshot.set("graphs", row, 1, command.desc)
+                        self.current_commands = commands
+                        self.sampler.subscribe("graphs", [command for command in commands if command != None])
+
+                    for row, command in enumerate(commands):
+                        if command != None:
+                            self.snapshot.set("graphs", row, 2, str(self.sampler.value(command).value))
+
+                    graphs = [graph_of(command) for command in commands]
+                    counters = [(command, graph[4]) for command, graph in zip(commands, graphs)]
+                    if self.first_time_graphs_plot or counters != graphs_posted:
+                        wx.PostEvent(self._notify_window, GraphsEvent(graphs + [(self.first_time_graphs_plot)]))
                         self.first_time_graphs_plot = False
-                        #time.sleep(0.2)
+                        graphs_posted = counters
 
-                elif curstate == 7:
-                    s = self.connection.connection.query(obd.commands.RPM)
-                    if s.value == None:
-                        reconnect()
-                        continue
                 time_end = datetime.datetime.now()
                 first_time = False
             self.state = "dokončeno"
@@ -1331,7 +827,7 @@ class MyApp(wx.App):
         """
 
         def stop(self):
-            #self._notify_window.ThreadControl = 666
+            #self.stop_event.set()
 
             try: # if stop is called before any connection port is not defined (and not connected )
                 self.connection.connection.close()
@@ -1573,7 +1069,8 @@ class MyApp(wx.App):
             self.trace.Append([str(level), msg])
 
     def OnInit(self):
-        self.ThreadControl = 0  # say thread what to do
+        self.producer_stop = threading.Event()  # tells the producer thread to finish
+        self.producer_commands = queue.Queue()  # CMD_* for the producer thread
         self.COMPORT = 0
         self.senprod = None
         self.DEBUGLEVEL = 0  # debug everything
@@ -1615,13 +1112,9 @@ class MyApp(wx.App):
         ico = wx.Icon(resource_path('pyobd.ico'), wx.BITMAP_TYPE_ICO)
         self.frame.SetIcon(ico)
 
-        EVT_RESULT(self, self.OnResult, EVT_RESULT_ID)
         EVT_RESULT(self, self.OnDebug, EVT_DEBUG_ID)
         EVT_RESULT(self, self.OnDtc, EVT_DTC_ID)
         EVT_RESULT(self, self.OnStatus, EVT_STATUS_ID)
-        EVT_RESULT(self, self.OnTests, EVT_TESTS_ID)
-        EVT_RESULT(self, self.OnGraphValue, EVT_GRAPH_VALUE_ID)
-        EVT_RESULT(self, self.OnGraphsValue, EVT_GRAPHS_VALUE_ID)
         EVT_RESULT(self, self.OnGraph, EVT_GRAPH_ID)
         EVT_RESULT(self, self.OnGraphs, EVT_GRAPHS_ID)
         EVT_RESULT(self, self.OnClose, EVT_CLOSE_ID)
@@ -1632,9 +1125,7 @@ class MyApp(wx.App):
         EVT_RESULT(self, self.GetSelectionGraphsComboBox, EVT_COMBOBOXGRAPHS_GETSELECTION_ID)
         EVT_RESULT(self, self.SetSelectionGraphComboBox, EVT_COMBOBOXGRAPH_SETSELECTION_ID)
         EVT_RESULT(self, self.SetSelectionGraphsComboBox, EVT_COMBOBOXGRAPHS_SETSELECTION_ID)
-        EVT_RESULT(self, self.InsertSensorRow, EVT_INSERT_SENSOR_ROW_ID)
-        EVT_RESULT(self, self.InsertFreezeframeRow, EVT_INSERT_FREEZEFRAME_ROW_ID)
-        EVT_RESULT(self, self.OnFreezeframeResult, EVT_FREEZEFRAME_RESULT_ID)
+        EVT_RESULT(self, self.OnSnapshot, EVT_SNAPSHOT_ID)
 
         # Main notebook frames
         self.nb = wx.Notebook(self.frame, -1, style=wx.NB_TOP)
@@ -1797,11 +1288,24 @@ the Free Software Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  0211
         self.HelpAboutDlg.ShowModal()
         self.HelpAboutDlg.Destroy()
 
-    def OnResult(self, event):
-        self.sensors.SetItem(event.data[0], event.data[1], event.data[2])
-
-    def OnFreezeframeResult(self, event):
-        self.freezeframe.SetItem(event.data[0], event.data[1], event.data[2])
+    def OnSnapshot(self, event):
+        cleared, rows, cells, snapshot = event.data
+        tables = {"sensors": self.sensors, "freezeframe": self.freezeframe, "tests": self.OBDTests,
+                  "graph": self.graph_list_ctrl, "graphs": self.graphs_list_ctrl}
+        changed = set(cleared + [table for table, row in rows] + [key[0] for key in cells])
+        for table in changed:
+            tables[table].Freeze()
+        try:
+            for table in cleared:
+                tables[table].DeleteAllItems()
+            for table, row in rows:
+                tables[table].InsertItem(row, "")
+            for (table, row, col), text in cells.items():
+                tables[table].SetItem(row, col, text)
+        finally:
+            for table in changed:
+                tables[table].Thaw()
+        snapshot.applied(len(cells))
 
     def OnStatus(self, event):
         if event.data[0] == 666:  # signal, that connection falied
@@ -1809,9 +1313,6 @@ the Free Software Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  0211
         else:
             self.status.SetItem(event.data[0], event.data[1], event.data[2])
 
-    def OnTests(self, event):
-        self.OBDTests.SetItem(event.data[0], event.data[1], event.data[2])
-
     """
     def OnCombo(self, event):
         self.curr_selection1 = self.combobox1.GetSelection()
@@ -1819,24 +1320,24 @@ the Free Software Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  0211
         self.curr_selection3 = self.combobox3.GetSelection()
         self.curr_selection4 = self.combobox4.GetSelection()
     """
-    def InsertSensorRow(self, event):
-        counter = event.data
-        self.sensors.InsertItem(counter, "")
-
-    def InsertFreezeframeRow(self, event):
-        counter = event.data
-        self.freezeframe.InsertItem(counter, "")
-
     def BuildComboBoxGraph(self, event):
-        self.combobox = wx.ComboBox(self.graph_panel, choices=event.data, pos=(0, 65))
-        self.build_combobox_graph_event_finished=True
+        try:
+            self.combobox = wx.ComboBox(self.graph_panel, choices=event.data, pos=(0, 65))
+            event.reply.set_result(True)
+        except:
+            traceback.print_exc()
+            event.reply.set_result(None)
 
     def BuildComboBoxGraphs(self, event):
-        self.combobox1 = wx.ComboBox(self.graphs_panel, choices=event.data, pos=(0, 140))
-        self.combobox2 = wx.ComboBox(self.graphs_panel, choices=event.data, pos=(0, 190))
-        self.combobox3 = wx.ComboBox(self.graphs_panel, choices=event.data, pos=(330, 140))
-        self.combobox4 = wx.ComboBox(self.graphs_panel, choices=event.data, pos=(330, 190))
-        self.build_combobox_graphs_event_finished=True
+        try:
+            self.combobox1 = wx.ComboBox(self.graphs_panel, choices=event.data, pos=(0, 140))
+            self.combobox2 = wx.ComboBox(self.graphs_panel, choices=event.data, pos=(0, 190))
+            self.combobox3 = wx.ComboBox(self.graphs_panel, choices=event.data, pos=(330, 140))
+            self.combobox4 = wx.ComboBox(self.graphs_panel, choices=event.data, pos=(330, 190))
+            event.reply.set_result(True)
+        except:
+            traceback.print_exc()
+            event.reply.set_result(None)
 
     def DestroyComboBox(self, event):
         try:
@@ -1858,34 +1359,40 @@ the Free Software Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  0211
 
     def GetSelectionGraphComboBox(self, event):
         try:
-            self.combobox_selection = self.combobox.GetSelection()
-            self.combobox_graph_get_sel_finished = True
+            event.reply.set_result(self.combobox.GetSelection())
         except:
-            pass
+            event.reply.set_result(None)
 
     def GetSelectionGraphsComboBox(self, event):
         try:
-            self.combobox1_selection = self.combobox1.GetSelection()
-            self.combobox2_selection = self.combobox2.GetSelection()
-            self.combobox3_selection = self.combobox3.GetSelection()
-            self.combobox4_selection = self.combobox4.GetSelection()
-            self.combobox_graphs_get_sel_finished = True
+            event.reply.set_result((self.combobox1.GetSelection(), self.combobox2.GetSelection(),
+                                    self.combobox3.GetSelection(), self.combobox4.GetSelection()))
         except:
-            pass
+            event.reply.set_result(None)
 
     def SetSelectionGraphComboBox(self, event):
-        self.combobox_selection = self.combobox.SetSelection(0)
-        self.combobox_graph_set_sel_finished = True
+        try:
+            if self.combobox.GetCount() > 0:
+                self.combobox.SetSelection(0)
+            event.reply.set_result(True)
+        except:
+            traceback.print_exc()
+            event.reply.set_result(None)
 
     def SetSelectionGraphsComboBox(self, event):
-        self.combobox1_selection = self.combobox1.SetSelection(0)
-        self.combobox2_selection = self.combobox2.SetSelection(1)
-        self.combobox3_selection = self.combobox3.SetSelection(2)
-        self.combobox4_selection = self.combobox4.SetSelection(3)
-        self.combobox_graphs_set_sel_finished = True
+        try:
+            # the first four commands, as far as there are that many
+            comboboxes = (self.combobox1, self.combobox2, self.combobox3, self.combobox4)
+            for selection, combobox in enumerate(comboboxes):
+                if combobox.GetCount() > 0:
+                    combobox.SetSelection(min(selection, combobox.GetCount() - 1))
+            event.reply.set_result(True)
+        except:
+            traceback.print_exc()
+            event.reply.set_result(None)
 
     def OnClose(self, event):
-        self.ThreadControl = 666
+        self.producer_stop.set()
         time.sleep(0.1)
         #while self.senprod.state != "dokončeno":
         #    time.sleep(0.1)
@@ -1956,109 +1463,33 @@ the Free Software Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  0211
             pass
 
     def OnGraph(self, event):
-        xy_data = list(zip(event.data[0][0],event.data[0][1]))
-        unit = event.data[0][2]
-        command_desc = event.data[0][3]
-        graph_counter = event.data[0][4]
+        x, y, unit, command_desc, graph_counter = event.data[0]
         first_time_graph_plot = event.data[1]
 
-        def animate():
-            if not first_time_graph_plot:
-                self.line = wxplot.PolySpline(xy_data, colour = 'blue', width = 1, style=wx.PENSTYLE_SOLID)
-                self.graphics = wxplot.PlotGraphics([self.line], command_desc, 'frame', unit)
-                if sys.platform.startswith("linux"):
-                    if os.environ.get("DESKTOP_SESSION") == "gnome" or os.environ.get("DESKTOP_SESSION") == "ubuntu":
-                        self.panel.Destroy()
-                        self.panel = wxplot.PlotCanvas(self.graph_panel, pos=(0, 100))
-                        self.panel.SetInitialSize(size=wx.Size(900, 400))
-                self.panel.Draw(self.graphics, xAxis=(graph_counter - 450, graph_counter))
-
         if first_time_graph_plot:
-            self.panel = wxplot.PlotCanvas(self.graph_panel, pos=(0, 100))
-            self.panel.SetInitialSize(size=wx.Size(900, 400))
+            if getattr(self, "graph_renderer", None) is not None:
+                self.graph_renderer.destroy()
+            self.graph_renderer = GraphRenderer(self.graph_panel, (0, 100), (900, 400), 450)
+            self.panel = self.graph_renderer.canvas
         else:
-            animate()
+            self.graph_renderer.update(x, y, command_desc, unit, graph_counter)
 
     def OnGraphs(self, event):
-        xy_data1 = list(zip(event.data[0][0],event.data[0][1]))
-        unit1 = event.data[0][2]
-        command_desc1 = event.data[0][3]
-        graph_counter1 = event.data[0][4]
-        xy_data2 = list(zip(event.data[1][0],event.data[1][1]))
-        unit2 = event.data[1][2]
-        command_desc2 = event.data[1][3]
-        graph_counter2 = event.data[1][4]
-        xy_data3 = list(zip(event.data[2][0],event.data[2][1]))
-        unit3 = event.data[2][2]
-        command_desc3 = event.data[2][3]
-        graph_counter3 = event.data[2][4]
-        xy_data4 = list(zip(event.data[3][0],event.data[3][1]))
-        unit4 = event.data[3][2]
-        command_desc4 = event.data[3][3]
-        graph_counter4 = event.data[3][4]
         first_time_graphs_plot = event.data[4]
 
-        def animate():
-            if not first_time_graphs_plot:
-
-                self.line1 = wxplot.PolySpline(xy_data1, colour = 'blue', width = 1, style=wx.PENSTYLE_SOLID)
-                self.graphics1 = wxplot.PlotGraphics([self.line1], command_desc1, 'frame', unit1)
-                if sys.platform.startswith("linux"):
-                    if os.environ.get("DESKTOP_SESSION") == "gnome" or os.environ.get("DESKTOP_SESSION") == "ubuntu":
-                        self.panel1.Destroy()
-                        self.panel1 = wxplot.PlotCanvas(self.graphs_panel, pos=(0, 250))
-                        self.panel1.SetInitialSize(size=wx.Size(400, 220))
-                self.panel1.Draw(self.graphics1, xAxis=(graph_counter1 - 200, graph_counter1))
-
-                self.line2 = wxplot.PolySpline(xy_data2, colour = 'blue', width = 1, style=wx.PENSTYLE_SOLID)
-                self.graphics2 = wxplot.PlotGraphics([self.line2], command_desc2, 'frame', unit2)
-                if sys.platform.startswith("linux"):
-                    if os.environ.get("DESKTOP_SESSION") == "gnome" or os.environ.get("DESKTOP_SESSION") == "ubuntu":
-                        self.panel2.Destroy()
-                        self.panel2 = wxplot.PlotCanvas(self.graphs_panel, pos=(0, 480))
-                        self.panel2.SetInitialSize(size=wx.Size(400, 220))
-                self.panel2.Draw(self.graphics2, xAxis=(graph_counter2 -200, graph_counter2))
-
-                self.line3 = wxplot.PolySpline(xy_data3, colour = 'blue', width = 1, style=wx.PENSTYLE_SOLID)
-                self.graphics3 = wxplot.PlotGraphics([self.line3], command_desc3, 'frame', unit3)
-                if sys.platform.startswith("linux"):
-                    if os.environ.get("DESKTOP_SESSION") == "gnome" or os.environ.get("DESKTOP_SESSION") == "ubuntu":
-                        self.panel3.Destroy()
-                        self.panel3 = wxplot.PlotCanvas(self.graphs_panel, pos=(410, 250))
-                        self.panel3.SetInitialSize(size=wx.Size(400, 220))
-                self.panel3.Draw(self.graphics3, xAxis=(graph_counter3 - 200, graph_counter3))
-
-                self.line4 = wxplot.PolySpline(xy_data4, colour = 'blue', width = 1, style=wx.PENSTYLE_SOLID)
-                self.graphics4 = wxplot.PlotGraphics([self.line4], command_desc4, 'frame', unit4)
-                if sys.platform.startswith("linux"):
-                    if os.environ.get("DESKTOP_SESSION") == "gnome" or os.environ.get("DESKTOP_SESSION") == "ubuntu":
-                        self.panel4.Destroy()
-                        self.panel4 = wxplot.PlotCanvas(self.graphs_panel, pos=(410, 480))
-                        self.panel4.SetInitialSize(size=wx.Size(400, 220))
-                self.panel4.Draw(self.graphics4, xAxis=(graph_counter4 - 200, graph_counter4))
-
-
         if first_time_graphs_plot:
-            self.panel1 = wxplot.PlotCanvas(self.graphs_panel, pos=(0, 250))
-            self.panel1.SetInitialSize(size=wx.Size(400, 220))
-
-            self.panel2 = wxplot.PlotCanvas(self.graphs_panel, pos=(0, 480))
-            self.panel2.SetInitialSize(size=wx.Size(400, 220))
-
-            self.panel3 = wxplot.PlotCanvas(self.graphs_panel, pos=(410, 250))
-            self.panel3.SetInitialSize(size=wx.Size(400, 220))
-
-            self.panel4 = wxplot.PlotCanvas(self.graphs_panel, pos=(410, 480))
-            self.panel4.SetInitialSize(size=wx.Size(400, 220))
-
+            for renderer in getattr(self, "graphs_renderers", []):
+                renderer.destroy()
+            self.graphs_renderers = [
+                GraphRenderer(self.graphs_panel, pos, (400, 220), 200)
+                for pos in ((0, 250), (0, 480), (410, 250), (410, 480))
+            ]
+            self.panel1, self.panel2, self.panel3, self.panel4 = \
+                [renderer.canvas for renderer in self.graphs_renderers]
         else:
-            animate()
-
-    def OnGraphValue(self, event):
-        self.graph_list_ctrl.SetItem(event.data[0], event.data[1], event.data[2])
-
-    def OnGraphsValue(self, event):
-        self.graphs_list_ctrl.SetItem(event.data[0], event.data[1], event.data[2])
+            for renderer, (x, y, unit, command_desc, graph_counter) in \
+                    zip(self.graphs_renderers, event.data[:4]):
+                renderer.update(x, y, command_desc, unit, graph_counter)
 
     def OnDebug(self, event):
         self.TraceDebug(event.data[0], event.data[1])
@@ -2071,7 +1502,7 @@ the Free Software Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  0211
 
     def OnDisconnect(self, event):  # disconnect connection to ECU
         try:
-            self.ThreadControl = 666
+            self.producer_stop.set()
             time.sleep(0.1)
         except:
             traceback.print_exc()
@@ -2084,7 +1515,9 @@ the Free Software Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  0211
         if self.senprod:
             if self.senprod.is_alive():  # signal current producers to finish
                 self.senprod.stop()
-        self.ThreadControl = 0
+        # a fresh channel, so the old producer still sees its stop signal
+        self.producer_stop = threading.Event()
+        self.producer_commands = queue.Queue()
 
         self.senprod = self.sensorProducer(self, self.COMPORT, self.SERTIMEOUT, self.RECONNATTEMPTS, self.BAUDRATE, self.FAST, self.nb)
         self.senprod.start()
@@ -2093,7 +1526,7 @@ the Free Software Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  0211
 
     def GetDTC(self, e):
         self.nb.SetSelection(3)
-        self.ThreadControl = 2
+        self.producer_commands.put(CMD_REREAD_DTC)
 
     def AddDTC(self, code):
         self.dtc.InsertStringItem(0, "")
@@ -2109,15 +1542,23 @@ the Free Software Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  0211
 
         root = tree.AddRoot("Code Reference")
         proot = root;  # tree.AppendItem(root,"Powertrain (P) Codes")
-        codes = pcodes.keys()
-        codes = sorted(codes)
+        # the table is sorted, and only the group's codes are read when it's expanded
         group = ""
-        for c in codes:
+        for c in pcodes:
             if c[:3] != group:
                 group_root = tree.AppendItem(proot, c[:3] + "XX")
+                tree.SetItemHasChildren(group_root, True)
                 group = c[:3]
-            leaf = tree.AppendItem(group_root, c)
-            tree.AppendItem(leaf, pcodes[c])
+
+        def expand_group(event):
+            group_root = event.GetItem()
+            if group_root == root or tree.GetChildrenCount(group_root, False) > 0:
+                return
+            for c, description in pcodes.search(tree.GetItemText(group_root)):
+                leaf = tree.AppendItem(group_root, c)
+                tree.AppendItem(leaf, description)
+
+        tree.Bind(wx.EVT_TREE_ITEM_EXPANDING, expand_group)
 
         diag.SetSize((400, 500))
         diag.Show(True)
@@ -2143,7 +1584,7 @@ the Free Software Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  0211
             self.ClearDTC()
 
     def ClearDTC(self):
-        self.ThreadControl = 1
+        self.producer_commands.put(CMD_CLEAR_DTC)
         self.nb.SetSelection(3)
 
     def try_port(self, portStr):
@@ -2264,7 +1705,7 @@ the Free Software Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  0211
             self.config.write(open(self.configfilepath, 'w'))
 
     def OnExit(self, e=None):
-        self.ThreadControl = 666
+        self.producer_stop.set()
         time.sleep(0.1)
         os._exit(0)
 